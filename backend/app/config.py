@@ -28,6 +28,7 @@ class Settings(BaseSettings):
 
     data_dir: Path = Field(default_factory=_default_data_dir)
     models_dirname: str = "models"
+    checkpoints_dirname: str = "checkpoints"
     database_url: str = Field(default="")  # resolved post-init if empty
 
     allowed_origins: List[str] = Field(
@@ -40,14 +41,46 @@ class Settings(BaseSettings):
     )
 
     neat_workers: str = Field(default="auto")  # "auto" | "1" | "N"
+    training_worker_budget: int = 0  # evaluation workers shared by concurrent runs; 0 = resolve_workers()
+    max_concurrent_runs: int = 2  # runs evaluating at once; further runs wait in the queue
+    training_queue_limit: int = 16  # queued runs accepted before /start returns 409
+    max_sweep_trials: int = 64  # variants x repeats accepted per sweep
+    training_subprocess: bool = True  # train in a child process when evaluation would be serial
+    loop_lag_interval_ms: float = 50.0  # event-loop lag sampling period; 0 disables the monitor
+    training_progress_hz: float = 4.0  # intra-generation progress events per second; 0 disables
+    generation_stats_batch: int = 10  # generation rows group-committed together
+    generation_stats_flush_seconds: float = 2.0  # max delay before queued rows are written
+    training_record_replays: bool = True  # store each generation champion's episode for playback
+    leaderboard_verify_workers: int = 1  # processes replaying leaderboard action logs
+    leaderboard_verify_batch: int = 64  # action logs replayed per batch
+    leaderboard_verify_concurrency: int = 2  # batches in flight
+    leaderboard_replay_max_frames: int = 60 * 60 * 3  # longest replayable log (3 minutes at 60 fps)
+    eval_pool_max_tasks_per_child: int = 500  # recycle evaluation workers after N chunks; 0 = never
+    fitness_cache_size: int = 4096  # memoized genome fitnesses per training run; 0 disables
+    checkpoint_every_generations: int = 10  # 0 = only time-based
+    checkpoint_every_seconds: float = 60.0  # 0 = only generation-based
+    checkpoint_keep: int = 2  # newest checkpoint files kept per run
     neat_config_path: Path = Field(default_factory=lambda: _PKG_ROOT / "neat" / "config.ini")
 
     max_upload_bytes: int = 5 * 1024 * 1024  # 5 MB
+    max_decision_batch_rows: int = 4096  # sensor rows per /api/decision/batch call
+    inference_batch_window_ms: float = 1.0  # /ws/play micro-batching window; 0 disables
+    net_cache_max_entries: int = 256  # compiled nets kept in memory
+    net_cache_max_bytes: int = 64 * 1024 * 1024  # 64 MB, estimated from weight arrays
+    net_cache_warmup_count: int = 0  # models preloaded at startup
+    net_cache_warmup_by: str = "fitness"  # "fitness" | "recent" (last played)
 
     @property
     def models_dir(self) -> Path:
         return self.data_dir / self.models_dirname
 
+    @property
+    def checkpoints_dir(self) -> Path:
+        return self.data_dir / self.checkpoints_dirname
+
+    def worker_budget(self) -> int:
+        return self.training_worker_budget if self.training_worker_budget > 0 else self.resolve_workers()
+
     def resolve_workers(self) -> int:
         if self.neat_workers == "auto":
             return max(1, (os.cpu_count() or 2) - 1)
@@ -66,4 +99,5 @@ def get_settings() -> Settings:
         s.database_url = f"sqlite+aiosqlite:///{db_path}"
     s.data_dir.mkdir(parents=True, exist_ok=True)
     s.models_dir.mkdir(parents=True, exist_ok=True)
+    s.checkpoints_dir.mkdir(parents=True, exist_ok=True)
     return s
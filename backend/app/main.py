@@ -1,6 +1,7 @@
 """FastAPI application entrypoint."""
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -9,19 +10,44 @@ from loguru import logger
 
 from .config import get_settings
 from .db import init_db
-from .routers import health, inference, leaderboard, models, training
+from .routers import health, inference, leaderboard, models, sweeps, training
+from .services.eval_pool import eval_pool
+from .services.generation_history import generation_history
+from .services.loop_monitor import loop_monitor
+from .services.net_cache import net_cache
+from .services.replay_verifier import replay_verifier
+from .services.sweep_manager import sweep_manager
+from .services.training_manager import training_manager
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     settings = get_settings()
     await init_db()
+    interrupted = await training_manager.recover_stale()
+    if interrupted:
+        logger.info("Marked {} unfinished training run(s) as interrupted", interrupted)
+    interrupted = await sweep_manager.recover_stale()
+    if interrupted:
+        logger.info("Marked {} unfinished sweep(s) as interrupted", interrupted)
+    requeued = await replay_verifier.recover()
+    if requeued:
+        logger.info("Queued {} leaderboard replay(s) for verification", requeued)
+    await asyncio.to_thread(eval_pool.start)
+    if settings.net_cache_warmup_count > 0:
+        loaded = await net_cache.warmup(settings.net_cache_warmup_count, by=settings.net_cache_warmup_by)
+        logger.info("Net cache warmed with {} model(s)", loaded)
     logger.info(
         "🦖 Dino AI Trainer backend ready | data_dir={} | workers={}",
         settings.data_dir,
         settings.resolve_workers(),
     )
+    loop_monitor.start()
     yield
+    await loop_monitor.stop()
+    await generation_history.flush()
+    await asyncio.to_thread(replay_verifier.close)
+    await asyncio.to_thread(eval_pool.close)
 
 
 settings = get_settings()
@@ -37,6 +63,7 @@ app.add_middleware(
 
 app.include_router(health.router)
 app.include_router(training.router)
+app.include_router(sweeps.router)
 app.include_router(inference.router)
 app.include_router(models.router)
 app.include_router(leaderboard.router)
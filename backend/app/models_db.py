@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, Integer, String, Text
+from sqlalchemy import DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .db import Base
@@ -21,13 +21,14 @@ class Model(Base):
     sha256: Mapped[str] = mapped_column(String(64), default="")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     notes: Mapped[str] = mapped_column(Text, default="")
+    last_played_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)  # last /ws/play session
 
 
 class TrainingRun(Base):
     __tablename__ = "training_runs"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    status: Mapped[str] = mapped_column(String(32), default="running")  # running|finished|stopped|error
+    status: Mapped[str] = mapped_column(String(32), default="running")  # queued|running|paused|finished|stopped|interrupted|error
     population_size: Mapped[int] = mapped_column(Integer, default=0)
     max_generations: Mapped[int] = mapped_column(Integer, default=0)
     best_fitness: Mapped[float] = mapped_column(Float, default=0.0)
@@ -36,6 +37,35 @@ class TrainingRun(Base):
     finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     model_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
     config_json: Mapped[str] = mapped_column(Text, default="{}")
+    metrics_json: Mapped[str | None] = mapped_column(Text, nullable=True)  # TrainingMetrics
+
+
+class GenerationStat(Base):
+    __tablename__ = "generation_stats"
+    __table_args__ = (Index("ix_generation_stats_run_generation", "run_id", "generation", unique=True),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    run_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    generation: Mapped[int] = mapped_column(Integer, nullable=False)
+    best_fitness: Mapped[float] = mapped_column(Float, default=0.0)
+    mean_fitness: Mapped[float] = mapped_column(Float, default=0.0)
+    species_count: Mapped[int] = mapped_column(Integer, default=0)
+    elapsed_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    update_json: Mapped[str] = mapped_column(Text, default="{}")  # the generation's TrainingUpdate
+    replay_json: Mapped[str | None] = mapped_column(Text, nullable=True)  # champion's Recording
+
+
+class Sweep(Base):
+    __tablename__ = "sweeps"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    name: Mapped[str] = mapped_column(String(120), default="")
+    status: Mapped[str] = mapped_column(String(32), default="running")  # running|finished|stopped|interrupted|error
+    config_json: Mapped[str] = mapped_column(Text, default="{}")
+    results_json: Mapped[str] = mapped_column(Text, default="{}")  # SweepStatus
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
 
 class LeaderboardEntry(Base):
@@ -47,3 +77,10 @@ class LeaderboardEntry(Base):
     mode: Mapped[str] = mapped_column(String(8), default="human")  # human|ai
     model_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Optional replay log; verification is pending|verified|rejected when one was submitted.
+    replay_seed: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    replay_actions: Mapped[str | None] = mapped_column(Text, nullable=True)
+    verification: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    verified_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    verification_note: Mapped[str | None] = mapped_column(String(120), nullable=True)
+    verified_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
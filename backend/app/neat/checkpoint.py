@@ -0,0 +1,120 @@
+"""Training checkpoints: enough state to continue a run after a restart.
+
+Like ``neat.Checkpointer`` a checkpoint is a gzip-compressed pickle of the
+population, species set, generation counter and RNG state; the config is not
+stored (it is rebuilt from the run's ``TrainingStartRequest``). Only the
+current population's ancestry is kept so files stay small over long runs.
+
+neat-python draws from the process-global ``random``, so the captured RNG
+state only belongs to this run when it was the only run in its process, and
+restoring it reseeds every other run in the process. ``restore(rng=False)``
+leaves the global RNG alone.
+"""
+from __future__ import annotations
+
+import gzip
+import itertools
+import os
+import pickle
+import random
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+import neat
+
+_NAME = re.compile(r"^gen-(\d{6})\.ckpt\.gz$")
+
+
+def _peek(owner: object, attr: str, default: int) -> int:
+    """Next value of the ``itertools.count`` at ``owner.attr``, without losing it."""
+    counter = getattr(owner, attr)
+    if counter is None:
+        return default
+    value = next(counter)
+    setattr(owner, attr, itertools.count(value))
+    return value
+
+
+@dataclass
+class Checkpoint:
+    generation: int  # completed generations
+    population: dict
+    species_set: object
+    best_genome: Optional[object]
+    next_genome_key: int
+    next_node_key: int
+    ancestors: dict
+    rng_state: tuple
+    trainer_state: dict = field(default_factory=dict)
+
+    @classmethod
+    def capture(
+        cls, pop: neat.Population, config: neat.Config, trainer_state: Optional[dict] = None
+    ) -> "Checkpoint":
+        ancestors = pop.reproduction.ancestors
+        max_node = max((k for g in pop.population.values() for k in g.nodes), default=0)
+        return cls(
+            generation=pop.generation,
+            population=pop.population,
+            species_set=pop.species,
+            best_genome=pop.best_genome,
+            next_genome_key=_peek(pop.reproduction, "genome_indexer", max(pop.population) + 1),
+            next_node_key=_peek(config.genome_config, "node_indexer", max_node + 1),
+            ancestors={k: ancestors[k] for k in pop.population if k in ancestors},
+            rng_state=random.getstate(),
+            trainer_state=trainer_state or {},
+        )
+
+    def restore(self, pop: neat.Population, config: neat.Config, rng: bool = True) -> None:
+        """Load this checkpoint into a freshly constructed ``pop``; with ``rng`` also its RNG state."""
+        pop.population = self.population
+        pop.species = self.species_set
+        pop.generation = self.generation
+        pop.best_genome = self.best_genome
+        pop.reproduction.genome_indexer = itertools.count(self.next_genome_key)
+        pop.reproduction.ancestors.clear()
+        pop.reproduction.ancestors.update(self.ancestors)
+        config.genome_config.node_indexer = itertools.count(self.next_node_key)
+        if rng:
+            random.setstate(self.rng_state)
+
+
+def dumps(checkpoint: Checkpoint) -> bytes:
+    """Snapshot ``checkpoint`` now; compression and I/O can happen later."""
+    return pickle.dumps(checkpoint, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def write(directory: Path, generation: int, blob: bytes, keep: int = 2) -> Path:
+    """Compress ``blob`` into ``directory`` atomically, pruning all but ``keep`` files."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"gen-{generation:06d}.ckpt.gz"
+    tmp = path.with_suffix(".tmp")
+    with gzip.open(tmp, "wb", compresslevel=5) as f:
+        f.write(blob)
+    os.replace(tmp, path)
+    for old in list_checkpoints(directory)[:-keep] if keep > 0 else []:
+        old.unlink(missing_ok=True)
+    return path
+
+
+def list_checkpoints(directory: Path) -> List[Path]:
+    if not directory.is_dir():
+        return []
+    return sorted(p for p in directory.iterdir() if _NAME.match(p.name))
+
+
+def latest(directory: Path) -> Optional[Path]:
+    found = list_checkpoints(directory)
+    return found[-1] if found else None
+
+
+def generation_of(path: Path) -> int:
+    """Completed generations recorded in a checkpoint file name."""
+    return int(_NAME.match(path.name).group(1))
+
+
+def load(path: Path) -> Checkpoint:
+    with gzip.open(path, "rb") as f:
+        return pickle.load(f)
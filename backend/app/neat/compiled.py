@@ -0,0 +1,219 @@
+"""Compile NEAT genomes into dense NumPy layers.
+
+``neat.nn.FeedForwardNetwork`` walks Python dicts node by node on every
+activation. ``compile_genome`` flattens the same evaluation order
+(``neat.graphs.feed_forward_layers``) into one weight matrix and bias vector
+per layer, so a forward pass is a few small matmuls and works the same on a
+single sensor vector or an ``(N, num_inputs)`` batch.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+import neat
+import numpy as np
+from neat.graphs import feed_forward_layers
+
+
+# NumPy twins of ``neat.activations`` (same clamping, elementwise). Order is
+# part of the packed wire format: codes index ``ACTIVATION_NAMES``.
+ACTIVATIONS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "sigmoid": lambda z: 1.0 / (1.0 + np.exp(-np.clip(5.0 * z, -60.0, 60.0))),
+    "tanh": lambda z: np.tanh(np.clip(2.5 * z, -60.0, 60.0)),
+    "sin": lambda z: np.sin(np.clip(5.0 * z, -60.0, 60.0)),
+    "gauss": lambda z: np.exp(-5.0 * np.clip(z, -3.4, 3.4) ** 2),
+    "relu": lambda z: np.where(z > 0.0, z, 0.0),
+    "softplus": lambda z: 0.2 * np.log1p(np.exp(np.clip(5.0 * z, -60.0, 60.0))),
+    "identity": lambda z: z,
+    "clamped": lambda z: np.clip(z, -1.0, 1.0),
+    "log": lambda z: np.log(np.maximum(z, 1e-7)),
+    "exp": lambda z: np.exp(np.clip(z, -60.0, 60.0)),
+    "abs": np.abs,
+    "hat": lambda z: np.maximum(0.0, 1.0 - np.abs(z)),
+    "square": np.square,
+    "cube": lambda z: z ** 3,
+}
+ACTIVATION_NAMES: Tuple[str, ...] = tuple(ACTIVATIONS)
+_ACTIVATION_CODES = {id(fn): code for code, fn in enumerate(ACTIVATIONS.values())}
+
+
+@dataclass
+class Layer:
+    """Nodes evaluated together: ``values[start:stop] = act(bias + values[:start] @ weights)``.
+
+    Node ``response`` multipliers are folded into ``weights`` at compile time.
+    """
+
+    start: int
+    stop: int
+    weights: np.ndarray  # (start, stop - start)
+    bias: np.ndarray  # (stop - start,)
+    activations: List[Tuple[Callable[[np.ndarray], np.ndarray], slice]]  # contiguous column runs
+
+
+class CompiledNet:
+    """Dense feed-forward evaluator equivalent to ``FeedForwardNetwork``.
+
+    Columns of the value buffer are the inputs, then every evaluated node in
+    layer order, then one constant-zero column that outputs unreachable from
+    the inputs point at (they stay 0.0 in ``FeedForwardNetwork`` too).
+    """
+
+    def __init__(self, num_inputs: int, layers: List[Layer], output_columns: np.ndarray) -> None:
+        self.num_inputs = num_inputs
+        self.layers = layers
+        self.output_columns = output_columns
+        self.num_outputs = len(output_columns)
+        self.width = (layers[-1].stop if layers else num_inputs) + 1
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the compiled arrays."""
+        return sum(L.weights.nbytes + L.bias.nbytes for L in self.layers) + self.output_columns.nbytes
+
+    def _forward(self, values: np.ndarray) -> np.ndarray:
+        # ``values`` is (width,) or (N, width); ``...`` indexes the last axis.
+        for L in self.layers:
+            z = values[..., : L.start] @ L.weights
+            z += L.bias
+            for act, cols in L.activations:
+                values[..., L.start + cols.start : L.start + cols.stop] = act(z[..., cols])
+        return values[..., self.output_columns]
+
+    def activate_batch(self, inputs: np.ndarray) -> np.ndarray:
+        """Evaluate an ``(N, num_inputs)`` batch; returns ``(N, num_outputs)``."""
+        inputs = np.asarray(inputs, dtype=np.float64)
+        if inputs.ndim != 2 or inputs.shape[1] != self.num_inputs:
+            raise RuntimeError(
+                "Expected {0:n} inputs, got shape {1}".format(self.num_inputs, inputs.shape)
+            )
+        values = np.zeros((inputs.shape[0], self.width))
+        values[:, : self.num_inputs] = inputs
+        return self._forward(values)
+
+    def activate(self, inputs) -> np.ndarray:
+        """Evaluate a single input vector; returns a ``(num_outputs,)`` array."""
+        if len(inputs) != self.num_inputs:
+            raise RuntimeError("Expected {0:n} inputs, got {1:n}".format(self.num_inputs, len(inputs)))
+        values = np.zeros(self.width)
+        values[: self.num_inputs] = inputs
+        return self._forward(values)
+
+
+def compile_genome(genome: object, config: neat.Config) -> CompiledNet:
+    """Turn ``genome`` into a :class:`CompiledNet` for ``config``."""
+    gc = config.genome_config
+    input_keys = list(gc.input_keys)
+    output_keys = list(gc.output_keys)
+    connections = [cg.key for cg in genome.connections.values() if cg.enabled]
+    node_layers = feed_forward_layers(input_keys, output_keys, connections)
+
+    column = {k: i for i, k in enumerate(input_keys)}
+    incoming: Dict[int, List[Tuple[int, float]]] = {}
+    for key in connections:
+        incoming.setdefault(key[1], []).append((key[0], genome.connections[key].weight))
+
+    layers: List[Layer] = []
+    start = len(input_keys)
+    for layer_nodes in node_layers:
+        # Group by activation so each function runs once on a contiguous slice.
+        nodes = sorted(layer_nodes, key=lambda k: (genome.nodes[k].activation, k))
+        size = len(nodes)
+        weights = np.zeros((start, size))
+        bias = np.empty(size)
+        runs: List[Tuple[str, int, int]] = []
+        for j, node in enumerate(nodes):
+            ng = genome.nodes[node]
+            if ng.aggregation != "sum":
+                raise ValueError(f"Unsupported aggregation for compiled net: {ng.aggregation}")
+            if ng.activation not in ACTIVATIONS:
+                raise ValueError(f"Unsupported activation for compiled net: {ng.activation}")
+            for src, w in incoming.get(node, ()):
+                weights[column[src], j] += w
+            weights[:, j] *= ng.response
+            bias[j] = ng.bias
+            if runs and runs[-1][0] == ng.activation:
+                runs[-1] = (ng.activation, runs[-1][1], j + 1)
+            else:
+                runs.append((ng.activation, j, j + 1))
+        for j, node in enumerate(nodes):
+            column[node] = start + j
+        layers.append(Layer(
+            start=start,
+            stop=start + size,
+            weights=weights,
+            bias=bias,
+            activations=[(ACTIVATIONS[name], slice(a, b)) for name, a, b in runs],
+        ))
+        start += size
+
+    zero_column = start
+    output_columns = np.array([column.get(k, zero_column) for k in output_keys])
+    return CompiledNet(len(input_keys), layers, output_columns)
+
+
+@dataclass
+class PackedNets:
+    """Several compiled nets flattened into two arrays for cheap pickling.
+
+    ``ints`` holds, per net: ``num_inputs, num_layers, num_outputs``, the
+    output columns, then per layer ``start, stop, num_runs`` followed by
+    ``(activation code, first, last)`` for each run. ``floats`` holds each
+    layer's row-major weights followed by its bias, in the same order.
+    """
+
+    count: int
+    ints: np.ndarray  # int32
+    floats: np.ndarray  # float64
+
+    @property
+    def nbytes(self) -> int:
+        return self.ints.nbytes + self.floats.nbytes
+
+
+def pack_nets(nets: List[CompiledNet]) -> PackedNets:
+    ints: List[int] = []
+    floats: List[np.ndarray] = []
+    for net in nets:
+        ints += [net.num_inputs, len(net.layers), net.num_outputs]
+        ints += net.output_columns.tolist()
+        for L in net.layers:
+            ints += [L.start, L.stop, len(L.activations)]
+            for fn, cols in L.activations:
+                ints += [_ACTIVATION_CODES[id(fn)], cols.start, cols.stop]
+            floats += [L.weights.ravel(), L.bias]
+    return PackedNets(
+        count=len(nets),
+        ints=np.array(ints, dtype=np.int32),
+        floats=np.concatenate(floats) if floats else np.empty(0),
+    )
+
+
+def unpack_nets(packed: PackedNets) -> List[CompiledNet]:
+    ints = packed.ints.tolist()
+    floats = packed.floats
+    nets: List[CompiledNet] = []
+    i = f = 0
+    for _ in range(packed.count):
+        num_inputs, num_layers, num_outputs = ints[i : i + 3]
+        i += 3
+        output_columns = np.array(ints[i : i + num_outputs], dtype=np.int64)
+        i += num_outputs
+        layers: List[Layer] = []
+        for _ in range(num_layers):
+            start, stop, num_runs = ints[i : i + 3]
+            i += 3
+            activations = []
+            for _ in range(num_runs):
+                code, a, b = ints[i : i + 3]
+                i += 3
+                activations.append((ACTIVATIONS[ACTIVATION_NAMES[code]], slice(a, b)))
+            size = stop - start
+            weights = floats[f : f + start * size].reshape(start, size)
+            f += start * size
+            bias = floats[f : f + size]
+            f += size
+            layers.append(Layer(start, stop, weights, bias, activations))
+        nets.append(CompiledNet(num_inputs, layers, output_columns))
+    return nets
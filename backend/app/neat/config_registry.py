@@ -0,0 +1,117 @@
+"""Parsed NEAT configs, shared in-process.
+
+``neat.Config`` only reads from a file path, so the base ``config.ini`` is
+parsed once per path and overrides (``pop_size``, thresholds, ...) are applied
+in memory: a section with overridden keys is rebuilt from its merged items
+through the public ``parse_config`` of its type, and ``[NEAT]`` keys are set
+directly, coerced by the parser. Results are cached by ``(path, overrides)``
+the same way ``simulator.get_course`` caches obstacle courses.
+
+Cached configs are shared and must be treated as read-only. Training mutates
+``genome_config.node_indexer``, so trainers take a :func:`fresh_config` copy.
+"""
+from __future__ import annotations
+
+import copy
+from configparser import ConfigParser
+from functools import lru_cache
+from pathlib import Path
+from typing import Mapping, Optional, Tuple
+
+import neat
+
+from ..config import get_settings
+
+CONFIG_CACHE_SIZE = 32
+
+# Config attribute holding the parsed section of each neat type.
+_SECTIONS = {
+    neat.DefaultGenome.__name__: ("genome_type", "genome_config"),
+    neat.DefaultReproduction.__name__: ("reproduction_type", "reproduction_config"),
+    neat.DefaultSpeciesSet.__name__: ("species_set_type", "species_set_config"),
+    neat.DefaultStagnation.__name__: ("stagnation_type", "stagnation_config"),
+}
+
+OverrideKey = Tuple[Tuple[str, str], ...]
+
+
+def _override_key(overrides: Optional[Mapping[str, object]]) -> OverrideKey:
+    return tuple(sorted((k, str(v)) for k, v in (overrides or {}).items()))
+
+
+def _load(path: str) -> neat.Config:
+    return neat.Config(
+        neat.DefaultGenome,
+        neat.DefaultReproduction,
+        neat.DefaultSpeciesSet,
+        neat.DefaultStagnation,
+        path,
+    )
+
+
+@lru_cache(maxsize=8)
+def _parse_base(path: str) -> Tuple[neat.Config, ConfigParser]:
+    parser = ConfigParser()
+    with open(path) as f:
+        parser.read_file(f)
+    return _load(path), parser
+
+
+@lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def _get_config(path: str, overrides: OverrideKey) -> neat.Config:
+    base, parser = _parse_base(path)
+    if not overrides:
+        return base
+    tuned = ConfigParser()
+    tuned.read_dict(parser)
+    by_section: dict[str, list[str]] = {}
+    for key, value in overrides:
+        section = next((s for s in parser.sections() if parser.has_option(s, key)), None)
+        if section is None:
+            raise KeyError(f"Unknown NEAT config item: {key}")
+        tuned.set(section, key, value)
+        by_section.setdefault(section, []).append(key)
+
+    config = copy.deepcopy(base)
+    for section, keys in by_section.items():
+        if section == "NEAT":
+            for key in keys:
+                setattr(config, key, _coerce(tuned, key, getattr(base, key)))
+            continue
+        type_attr, config_attr = _SECTIONS[section]
+        setattr(config, config_attr, getattr(config, type_attr).parse_config(dict(tuned.items(section))))
+    return config
+
+
+def _coerce(parser: ConfigParser, key: str, current: object) -> object:
+    """``[NEAT]`` value of ``key`` with the type of its ``current`` value."""
+    if isinstance(current, bool):
+        return parser.getboolean("NEAT", key)
+    if isinstance(current, int):
+        return parser.getint("NEAT", key)
+    if isinstance(current, float):
+        return parser.getfloat("NEAT", key)
+    return parser.get("NEAT", key)
+
+
+def get_config(
+    overrides: Optional[Mapping[str, object]] = None, path: Optional[Path] = None
+) -> neat.Config:
+    """Shared, read-only config for ``path`` (default: settings) with ``overrides`` applied."""
+    path = path or get_settings().neat_config_path
+    return _get_config(str(path), _override_key(overrides))
+
+
+def fresh_config(
+    overrides: Optional[Mapping[str, object]] = None, path: Optional[Path] = None
+) -> neat.Config:
+    """Like :func:`get_config` but with a private genome config (own node indexer)."""
+    config = copy.copy(get_config(overrides, path))
+    config.genome_config = copy.copy(config.genome_config)
+    config.genome_config.node_indexer = None
+    return config
+
+
+def cache_info() -> dict:
+    info = _get_config.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "entries": info.currsize}
@@ -0,0 +1,66 @@
+"""Fitness memoization for deterministic evaluation.
+
+Evaluation replays fixed seeds for a fixed number of frames, so a genome's
+fitness is a pure function of the genes that reach the compiled net. Elites
+carried over by ``DefaultReproduction`` and offspring identical to a parent
+can reuse the fitness computed in an earlier generation.
+"""
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+def genome_signature(genome: object) -> bytes:
+    """Canonical digest of the genes that affect a genome's outputs.
+
+    Covers enabled connections with their weights and every node's bias,
+    response, activation and aggregation. Disabled connections and gene
+    bookkeeping (fitness, key) are ignored.
+    """
+    conns = sorted(
+        (k, cg.weight) for k, cg in genome.connections.items() if cg.enabled
+    )
+    nodes = sorted(
+        (k, ng.bias, ng.response, ng.activation, ng.aggregation)
+        for k, ng in genome.nodes.items()
+    )
+    return hashlib.blake2b(repr((conns, nodes)).encode(), digest_size=16).digest()
+
+
+class FitnessCache:
+    """Bounded LRU of ``signature -> fitness`` for one evaluation scope.
+
+    ``scope`` identifies the evaluation settings (seeds, frame budget); it is
+    part of every key so a cache can never answer for different settings.
+    """
+
+    def __init__(self, scope: Hashable, max_entries: int = 4096) -> None:
+        self.scope = scope
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, float] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, signature: bytes) -> Optional[float]:
+        key = (self.scope, signature)
+        fitness = self._entries.get(key)
+        if fitness is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return fitness
+
+    def put(self, signature: bytes, fitness: float) -> None:
+        if self.max_entries <= 0:
+            return
+        key = (self.scope, signature)
+        self._entries[key] = fitness
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
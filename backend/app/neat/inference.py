@@ -1,4 +1,4 @@
-"""Inference helpers: load a pickled genome + NEAT config → action decider."""
+"""Inference helpers: load a pickled genome + NEAT config → compiled action decider."""
 from __future__ import annotations
 
 import pickle
@@ -6,32 +6,43 @@ from pathlib import Path
 from typing import List, Tuple
 
 import neat
+import numpy as np
 
+from .. import physics as P
+from .compiled import CompiledNet, compile_genome
+from .config_registry import get_config
 
-_ACTIONS = ("jump", "duck", "noop")
+
+_ACTIONS = P.ACTIONS
+
+
+def load_config(config_path: Path) -> neat.Config:
+    """Shared parsed config for ``config_path`` (see ``config_registry``)."""
+    return get_config(path=config_path)
 
 
 def load_genome(pickle_path: Path, config_path: Path) -> Tuple[object, neat.Config]:
     with open(pickle_path, "rb") as f:
         genome = pickle.load(f)
-    config = neat.Config(
-        neat.DefaultGenome,
-        neat.DefaultReproduction,
-        neat.DefaultSpeciesSet,
-        neat.DefaultStagnation,
-        str(config_path),
-    )
-    return genome, config
+    return genome, load_config(config_path)
 
 
-def build_net(genome: object, config: neat.Config) -> neat.nn.FeedForwardNetwork:
-    return neat.nn.FeedForwardNetwork.create(genome, config)
+def build_net(genome: object, config: neat.Config) -> CompiledNet:
+    return compile_genome(genome, config)
 
 
-def decide(net: neat.nn.FeedForwardNetwork, sensors: List[float]) -> Tuple[str, List[float]]:
+def decide(net: CompiledNet, sensors: List[float]) -> Tuple[str, List[float]]:
     outputs = net.activate(sensors)
-    idx = max(range(len(outputs)), key=lambda i: outputs[i])
-    return _ACTIONS[idx], list(outputs)
+    return _ACTIONS[int(np.argmax(outputs))], outputs.tolist()
+
+
+def decide_batch(net: CompiledNet, sensors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized ``decide`` over an ``(N, NUM_INPUTS)`` matrix.
+
+    Returns ``(action_indices, outputs)``; indices point into ``_ACTIONS``.
+    """
+    outputs = net.activate_batch(sensors)
+    return outputs.argmax(axis=1), outputs
 
 
 def genome_to_graph(genome: object, config: neat.Config) -> dict:
@@ -0,0 +1,90 @@
+"""Steady-state (rtNEAT-style) population bookkeeping.
+
+Instead of replacing the whole population each generation, one offspring at
+a time is bred from the current species pool and, once evaluated, replaces
+the worst genome. ``SteadyStateBreeder`` only manipulates a
+``neat.Population`` in place; ``NeatTrainer`` drives evaluation.
+"""
+from __future__ import annotations
+
+import math
+import random
+from typing import List, Optional
+
+import neat
+
+
+class SteadyStateBreeder:
+    """Breed, insert and cull genomes of a running ``neat.Population``.
+
+    Newborns join the species with the nearest representative; new species
+    only appear at the periodic full :meth:`respeciate`.
+    """
+
+    def __init__(self, pop: neat.Population, config: neat.Config, survival_threshold: float) -> None:
+        self.pop = pop
+        self.config = config
+        self.survival_threshold = survival_threshold
+
+    # ------------------------------------------------------------------
+    def _pick_species(self) -> neat.species.Species:
+        species = [s for s in self.pop.species.species.values() if s.members]
+        fitnesses = [sum(m.fitness for m in s.members.values()) / len(s.members) for s in species]
+        floor = min(fitnesses)
+        # Shift so the weakest species still gets a small chance.
+        weights = [f - floor + 1e-3 for f in fitnesses]
+        return random.choices(species, weights=weights)[0]
+
+    def breed(self) -> object:
+        """A new, unevaluated offspring of two parents from one species."""
+        members = sorted(
+            self._pick_species().members.items(), key=lambda kv: kv[1].fitness, reverse=True
+        )
+        cutoff = max(2, int(math.ceil(self.survival_threshold * len(members))))
+        parents = members[:cutoff]
+        (parent1_id, parent1), (parent2_id, parent2) = random.choice(parents), random.choice(parents)
+
+        reproduction = self.pop.reproduction
+        gid = next(reproduction.genome_indexer)
+        child = self.config.genome_type(gid)
+        child.configure_crossover(parent1, parent2, self.config.genome_config)
+        child.mutate(self.config.genome_config)
+        reproduction.ancestors[gid] = (parent1_id, parent2_id)
+        return child
+
+    # ------------------------------------------------------------------
+    def insert(self, genome: object) -> Optional[object]:
+        """Add an evaluated genome and cull the worst one; returns the culled genome."""
+        population = self.pop.population
+        species_set = self.pop.species
+        gc = self.config.genome_config
+        nearest = min(
+            (s for s in species_set.species.values() if s.representative is not None),
+            key=lambda s: genome.distance(s.representative, gc),
+        )
+        population[genome.key] = genome
+        nearest.members[genome.key] = genome
+        species_set.genome_to_species[genome.key] = nearest.key
+
+        # Never cull the current champion.
+        best_key = max(population, key=lambda k: population[k].fitness)
+        worst_key = min(
+            (k for k in population if k != best_key), key=lambda k: population[k].fitness
+        )
+        culled = population.pop(worst_key)
+        sid = species_set.genome_to_species.pop(worst_key)
+        members = species_set.species[sid].members
+        members.pop(worst_key, None)
+        if not members:
+            del species_set.species[sid]
+        return culled
+
+    def respeciate(self, generation: int) -> None:
+        """Full re-speciation (new representatives, new species)."""
+        self.pop.species.speciate(self.config, self.pop.population, generation)
+
+    def best(self) -> object:
+        return max(self.pop.population.values(), key=lambda g: g.fitness)
+
+    def fitnesses(self) -> List[float]:
+        return [g.fitness for g in self.pop.population.values()]
@@ -1,45 +1,298 @@
 """NEAT training orchestration.
 
 Runs generation-by-generation so we can broadcast live progress over a
-WebSocket. Uses ``neat.ParallelEvaluator`` to evaluate genomes in parallel
-when multiple workers are configured. Falls back to serial evaluation on
-Windows-native or when workers == 1 to avoid multiprocessing pickling issues.
+WebSocket. Evaluates genomes in parallel on the shared application
+``EvaluationPool`` when one is passed in, otherwise on a per-run
+``neat.ParallelEvaluator`` when multiple workers are configured. Falls back to
+serial evaluation on Windows-native or when workers == 1 to avoid
+multiprocessing pickling issues.
 """
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import math
 import os
 import pickle
+import queue
+import random
 import sys
-import tempfile
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Awaitable, Callable, Optional
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import neat
+import numpy as np
 from loguru import logger
 
-from .. import physics as P
-from ..simulator import DinoSimulator
-from .inference import decide
+from ..simulator import ACTION_NOOP, BatchDinoSimulator, Recording, record_episode
+from . import checkpoint
+from .compiled import CompiledNet, PackedNets, compile_genome, pack_nets, unpack_nets
+from .config_registry import fresh_config
+from .fitness_cache import FitnessCache, genome_signature
+from .steady_state import SteadyStateBreeder
+from .warm_start import seed_population
 
 
-# Module-level function so ParallelEvaluator can pickle it.
-def _eval_genome(genome, config) -> float:
-    net = neat.nn.FeedForwardNetwork.create(genome, config)
+EVAL_SEEDS = (42, 1337, 7)
+EVAL_MAX_FRAMES = 60 * 45
+# (genome, seed) task batches queued per pool worker; more batches balance
+# better, fewer keep more episodes in each lockstep simulation.
+TASKS_PER_WORKER = 4
+# Longest wait for any pool result before the run fails; a task lost with a
+# dead or replaced pool would otherwise block it forever.
+RESULT_TIMEOUT_SECONDS = 300.0
+# neat-python draws from the process-global ``random``. A run seeds it or
+# restores a checkpoint's RNG state only while it is the only active run in
+# its process (always the case in a ``ProcessTrainer`` child); otherwise it
+# would reseed the runs it shares the process with.
+_active_runs = 0
+_active_runs_lock = threading.Lock()
+# Offspring bred and evaluated together in steady-state mode: enough rows
+# to batch the simulator, few enough that replacement stays fine-grained.
+OFFSPRING_PER_TASK = 4
 
-    def policy(sensors):
-        action, _ = decide(net, sensors)
-        return action
 
-    # Deterministic fitness across a few seeds to reduce variance
+@dataclass
+class EvalResult:
+    """Per-net fitness for one evaluation call.
+
+    ``censored[i]`` marks a racing-mode fitness that is only a lower bound:
+    the net's remaining episodes were stopped once even surviving to
+    ``max_frames`` could not lift its mean above the cutoff.
+    """
+
+    fitness: List[float]
+    censored: List[bool]
+    frames_simulated: int = 0
+    frames_saved: int = 0  # frame budget left in stopped episodes
+
+
+@dataclass
+class EpisodeResult:
+    """Per-episode outcome of one (genome, seed) task batch."""
+
+    fitness: List[float]
+    frames: List[int]
+    censored: List[bool]  # the episode's net was stopped by racing
+    frames_saved: int
+    busy_seconds: float  # wall time spent in the worker
+    worker: int = 0  # pid of the process that ran the batch
+
+
+@dataclass
+class ProgressReport:
+    """Partial progress of the generation being evaluated."""
+
+    generation: int
+    evaluated: int  # genomes with a fitness so far
+    total: int
+    best_fitness: float
+    mean_fitness: float
+    frames_simulated: int
+
+
+class ProgressMeter:
+    """Running totals of one generation's evaluation, emitted at most every ``interval`` seconds."""
+
+    def __init__(self, emit: Callable[[ProgressReport], None], generation: int, total: int, interval: float) -> None:
+        self._emit = emit
+        self.generation = generation
+        self.total = total
+        self.interval = interval
+        self.evaluated = 0
+        self.fitness_total = 0.0
+        self.best = -math.inf
+        self.frames = 0
+        self._next = time.monotonic() + interval
+
+    def due(self) -> bool:
+        return time.monotonic() >= self._next
+
+    def add(self, fitnesses: Iterable[float], frames: int = 0) -> None:
+        """Record genomes whose evaluation finished."""
+        for fitness in fitnesses:
+            self.evaluated += 1
+            self.fitness_total += fitness
+            self.best = max(self.best, fitness)
+        self.frames += frames
+        if self.due():
+            self.emit()
+
+    def partial(self, fitnesses: Sequence[float], frames: int) -> None:
+        """Emit including in-flight results that ``add`` will record later."""
+        self.emit(fitnesses, frames)
+
+    def emit(self, extra: Sequence[float] = (), extra_frames: int = 0) -> None:
+        self._next = time.monotonic() + self.interval
+        evaluated = self.evaluated + len(extra)
+        best = max(self.best, max(extra, default=-math.inf))
+        self._emit(
+            ProgressReport(
+                generation=self.generation,
+                evaluated=evaluated,
+                total=self.total,
+                best_fitness=float(best) if evaluated else 0.0,
+                mean_fitness=(self.fitness_total + float(sum(extra))) / evaluated if evaluated else 0.0,
+                frames_simulated=self.frames + extra_frames,
+            )
+        )
+
+
+def simulate_episodes(
+    nets: Sequence[CompiledNet],
+    episodes: Sequence[Tuple[int, int]],
+    max_frames: int = EVAL_MAX_FRAMES,
+    cutoff: Optional[float] = None,
+    seeds_per_net: int = len(EVAL_SEEDS),
+    progress: Optional[ProgressMeter] = None,
+    copies: Optional[Sequence[int]] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """Run ``(net index, seed)`` episodes in one ``BatchDinoSimulator``.
+
+    ``episodes`` must list each net's episodes contiguously. Each frame,
+    every net with a live episode runs one batched activation over its own
+    rows. With ``cutoff`` (racing), whenever an episode ends each net's mean
+    over ``seeds_per_net`` seeds is re-bounded: finished episodes at their
+    fitness, live ones and seeds not in this batch at the course's
+    ``max_fitness``. Nets whose bound fell below ``cutoff`` are stopped.
+
+    When ``progress`` is due, nets whose episodes have all ended are passed
+    to ``progress.partial`` with the frames simulated so far, each repeated
+    ``copies[net index]`` times (the genomes sharing it).
+
+    Returns per-episode ``(fitness, frames, censored, frames_saved)``.
+    """
+    sim = BatchDinoSimulator([seed for _, seed in episodes], max_frames=max_frames)
+    owner = np.array([i for i, _ in episodes], dtype=np.int64)
+    bounds = np.flatnonzero(np.diff(owner)) + 1
+    spans = list(zip(np.r_[0, bounds].tolist(), np.r_[bounds, len(owner)].tolist()))
+    actions = np.full(sim.n, ACTION_NOOP)
+    censored = np.zeros(sim.n, dtype=bool)
+    frames_saved = 0
+    if cutoff is not None:
+        best_case = sim.max_fitness()
+        # Seeds of a net evaluated elsewhere count at their best case too.
+        missing = np.array([seeds_per_net - (b - a) for a, b in spans]) * best_case.max()
+    while sim.alive.any():
+        sensors = sim.sensors()
+        alive = sim.alive
+        for a, b in spans:
+            if alive[a:b].any():
+                actions[a:b] = nets[owner[a]].activate_batch(sensors[a:b]).argmax(axis=1)
+        still_alive = sim.step(actions)
+        if progress is not None and progress.due():
+            starts = [a for a, _ in spans]
+            done = ~np.logical_or.reduceat(still_alive, starts)
+            means = np.add.reduceat(sim.fitness(), starts) / np.diff(np.r_[starts, sim.n])
+            if copies is not None:
+                means = np.repeat(means[done], [copies[owner[a]] for a in np.array(starts)[done]])
+            else:
+                means = means[done]
+            progress.partial(means.tolist(), int(sim.frames.sum()))
+        if cutoff is None or not still_alive.any() or (alive == still_alive).all():
+            continue
+        per_row = np.where(still_alive, best_case, sim.fitness())
+        totals = np.add.reduceat(per_row, [a for a, _ in spans]) + missing
+        losing = totals / seeds_per_net < cutoff
+        if losing.any():
+            stop = np.repeat(losing, [b - a for a, b in spans]) & still_alive
+            if stop.any():
+                frames_saved += int((max_frames - sim.frames[stop]).sum())
+                sim.stop(stop)
+                censored |= stop
+    # A net is censored as a whole once any of its episodes was stopped.
+    for a, b in spans:
+        if censored[a:b].any():
+            censored[a:b] = True
+    return sim.fitness(), sim.frames.copy(), censored, frames_saved
+
+
+def _mean_fitness(episode_fitness: Sequence[float]) -> float:
+    # Summed in seed order so results do not depend on how episodes were split.
     fitness_total = 0.0
-    seeds = (42, 1337, 7)
-    for seed in seeds:
-        sim = DinoSimulator(seed=seed, max_frames=60 * 45)
-        fitness_total += sim.run(policy)
-    return fitness_total / len(seeds)
+    for fitness in episode_fitness:
+        fitness_total += fitness
+    return fitness_total / len(episode_fitness)
+
+
+def evaluate_nets(
+    nets: Sequence[CompiledNet],
+    seeds: Sequence[int] = EVAL_SEEDS,
+    max_frames: int = EVAL_MAX_FRAMES,
+    cutoff: Optional[float] = None,
+    progress: Optional[ProgressMeter] = None,
+    copies: Optional[Sequence[int]] = None,
+) -> EvalResult:
+    """Fitness of each compiled net, averaged over ``seeds``.
+
+    ``copies[i]`` is how many genomes net ``i`` stands for in progress reports.
+    """
+    n, per = len(nets), len(seeds)
+    episodes = [(i, s) for i in range(n) for s in seeds]
+    fitness, frames, censored, frames_saved = simulate_episodes(
+        nets, episodes, max_frames, cutoff, per, progress, copies
+    )
+    return EvalResult(
+        fitness=[_mean_fitness(row) for row in fitness.reshape(n, per).tolist()],
+        censored=censored.reshape(n, per).any(axis=1).tolist(),
+        frames_simulated=int(frames.sum()),
+        frames_saved=frames_saved,
+    )
+
+
+def evaluate_genomes(
+    genomes: Sequence[object],
+    config: neat.Config,
+    seeds: Sequence[int] = EVAL_SEEDS,
+    max_frames: int = EVAL_MAX_FRAMES,
+) -> List[float]:
+    """Fitness of each genome, averaged over ``seeds``."""
+    return evaluate_nets([compile_genome(g, config) for g in genomes], seeds, max_frames).fitness
+
+
+def evaluate_task(
+    packed: PackedNets,
+    episodes: Sequence[Tuple[int, int]],
+    cutoff: Optional[float] = None,
+    seeds_per_net: int = len(EVAL_SEEDS),
+    max_frames: int = EVAL_MAX_FRAMES,
+) -> EpisodeResult:
+    """Worker entry point for one batch of ``(packed net index, seed)`` tasks."""
+    t0 = time.perf_counter()
+    fitness, frames, censored, frames_saved = simulate_episodes(
+        unpack_nets(packed), episodes, max_frames, cutoff, seeds_per_net
+    )
+    return EpisodeResult(
+        fitness=fitness.tolist(),
+        frames=frames.tolist(),
+        censored=censored.tolist(),
+        frames_saved=frames_saved,
+        busy_seconds=time.perf_counter() - t0,
+        worker=os.getpid(),
+    )
+
+
+def _next_result(results: "queue.Queue[tuple]") -> tuple:
+    try:
+        return results.get(timeout=RESULT_TIMEOUT_SECONDS)
+    except queue.Empty:
+        raise RuntimeError(
+            f"No evaluation result within {RESULT_TIMEOUT_SECONDS:.0f}s; a pool task was lost"
+        ) from None
+
+
+def genome_size(genome: object) -> int:
+    """Nodes plus enabled connections: what a compiled net has to evaluate."""
+    return len(genome.nodes) + sum(1 for c in genome.connections.values() if c.enabled)
+
+
+# Module-level function so ParallelEvaluator can pickle it.
+def _eval_genome(genome, config) -> float:
+    # Deterministic fitness across a few seeds to reduce variance
+    return evaluate_genomes([genome], config)[0]
 
 
 @dataclass
@@ -51,9 +304,50 @@ class GenerationReport:
     population_size: int
     elapsed_seconds: float
     best_genome: object
+    cache_hits: int = 0  # genomes whose fitness came from the fitness cache
+    cache_hit_rate: float = 0.0
+    censored: int = 0  # racing: genomes with a lower-bound fitness
+    frames_simulated: int = 0
+    frames_saved: int = 0  # racing: frame budget skipped in stopped episodes
+    worker_idle_seconds: float = 0.0  # pool capacity left unused during evaluation
+    load_imbalance: float = 0.0  # evaluation wall time / evenly split busy time - 1
+    # Wall seconds per phase: compile, evaluate, reproduce, speciate,
+    # checkpoint, record; ipc is added downstream of the trainer.
+    phase_seconds: Dict[str, float] = field(default_factory=dict)
+    frames_per_second: float = 0.0  # simulated frames over evaluation wall time
+    genomes_per_second: float = 0.0  # genomes evaluated over evaluation wall time
+    worker_utilization: List[float] = field(default_factory=list)  # busy share per worker process
+    mean_genome_size: float = 0.0  # nodes + enabled connections
+    max_genome_size: int = 0
+    replay: Optional[Recording] = None  # best_genome's episode on the first evaluation seed
+
+
+@dataclass
+class _EvalStats:
+    cache_hits: int = 0
+    censored: int = 0
+    frames_simulated: int = 0
+    frames_saved: int = 0
+    worker_idle_seconds: float = 0.0
+    load_imbalance: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+    busy: Dict[int, float] = field(default_factory=dict)  # worker pid -> busy seconds
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def add_busy(self, worker: int, seconds: float) -> None:
+        self.busy[worker] = self.busy.get(worker, 0.0) + seconds
+
+    def utilization(self, wall: float) -> List[float]:
+        """Busy share of ``wall`` for each worker process, by pid."""
+        if wall <= 0:
+            return []
+        return [min(1.0, self.busy[w] / wall) for w in sorted(self.busy)]
 
 
 ProgressCallback = Callable[[GenerationReport], Awaitable[None]]
+ProgressListener = Callable[[ProgressReport], None]  # called on the event loop
 
 
 class NeatTrainer:
@@ -67,62 +361,617 @@ class NeatTrainer:
         max_generations: int = 30,
         survival_threshold: float = 0.2,
         compatibility_threshold: float = 3.0,
+        mutation_rate: Optional[float] = None,
+        seed: Optional[int] = None,
         workers: int = 1,
+        pool: Optional[object] = None,
+        fitness_cache_size: int = 4096,
+        racing: bool = False,
+        mode: str = "generational",
+        checkpoint_dir: Optional[Path] = None,
+        checkpoint_every_generations: int = 10,
+        checkpoint_every_seconds: float = 60.0,
+        checkpoint_keep: int = 2,
+        resume_from: Optional[Path] = None,
+        seed_genomes: Sequence[object] = (),
+        progress_interval: float = 0.25,
+        record_replays: bool = True,
     ) -> None:
         self.base_config_path = base_config_path
         self.population_size = population_size
         self.max_generations = max_generations
         self.survival_threshold = survival_threshold
         self.compatibility_threshold = compatibility_threshold
+        # Per-connection weight mutation probability (None: config file value).
+        self.mutation_rate = mutation_rate
+        # Seeds the global ``random`` module neat-python draws from. Applied only
+        # when no other run is active in the process, and reproducible only
+        # while none starts; a ``ProcessTrainer`` child is always alone.
+        self.seed = seed
         self.workers = max(1, workers)
+        # Shared ``EvaluationPool`` (anything with ``apply_async``); without one a
+        # per-run ``ParallelEvaluator`` is created when workers > 1. ``workers``
+        # caps this run's in-flight tasks and may change between generations.
+        self.pool = pool
+        self.fitness_cache = FitnessCache((EVAL_SEEDS, EVAL_MAX_FRAMES), fitness_cache_size)
+        # Racing: stop genomes that cannot beat the previous generation's
+        # survival cutoff (none for the first generation).
+        self.racing = racing
+        self.mode = mode  # "generational" | "steady_state"
+        self._race_cutoff: Optional[float] = None
+        self.censored_keys: set = set()
+        # (genome key, seed index) -> episode length, for longest-first scheduling.
+        self._episode_frames: Dict[Tuple[int, int], int] = {}
+        self._next_episode_frames: Dict[Tuple[int, int], int] = {}
+        self._ancestors: dict = {}
+        self._last_eval = _EvalStats()
+        self._last_evaluated = 0
+        self._last_replay: Optional[Recording] = None
         self._stop_flag = False
-        self._active_config_path: Optional[Path] = None
+        self._unpaused = threading.Event()
+        self._unpaused.set()
+        # Checkpoints are written every N generations or T seconds, whichever
+        # comes first; ``resume_from`` continues a run from one of them.
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_every_generations = checkpoint_every_generations
+        self.checkpoint_every_seconds = checkpoint_every_seconds
+        self.checkpoint_keep = checkpoint_keep
+        self.resume_from = resume_from
+        self._checkpoint_writer: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._checkpoint_future: Optional[concurrent.futures.Future] = None
+        self._checkpointed_generation = -1
+        self._checkpointed_at = 0.0
+        # Warm start: trained genomes the initial population is built from.
+        self.seed_genomes = list(seed_genomes)
+        # Seconds between partial-progress reports within a generation (0: none).
+        self.progress_interval = progress_interval
+        self._emit_progress: Optional[Callable[[ProgressReport], None]] = None
+        self._meter: Optional[ProgressMeter] = None
+        self._owns_rng = True  # the only active run in this process; set by ``run``
+        # Record the champion's episode with every report; re-recorded only
+        # when the champion changes.
+        self.record_replays = record_replays
+        self._replay: Optional[Tuple[int, Recording]] = None  # (genome key, recording)
 
     def request_stop(self) -> None:
         self._stop_flag = True
+        self._unpaused.set()
+
+    @property
+    def stop_requested(self) -> bool:
+        return self._stop_flag
+
+    @property
+    def paused(self) -> bool:
+        return not self._unpaused.is_set()
+
+    def pause(self) -> None:
+        """Hold the run at the next generation (or offspring batch) boundary."""
+        self._unpaused.clear()
+
+    def unpause(self) -> None:
+        self._unpaused.set()
+
+    def set_workers(self, workers: int) -> None:
+        """Change this run's worker share; applies to the next task submitted."""
+        self.workers = max(1, workers)
+
+    def _start_meter(self, generation: int, total: int) -> None:
+        """Begin tracking the progress of ``generation``, if anyone listens."""
+        if self._emit_progress is not None:
+            self._meter = ProgressMeter(self._emit_progress, generation, total, self.progress_interval)
+
+    def _record_replay(
+        self, genome: object, config: neat.Config, phases: Dict[str, float]
+    ) -> Optional[Recording]:
+        """``genome``'s episode on the first evaluation seed, for ``GenerationReport.replay``."""
+        if not self.record_replays or genome is None:
+            return None
+        if self._replay is None or self._replay[0] != genome.key:
+            t0 = time.perf_counter()
+            net = compile_genome(genome, config)
+            recording = record_episode(
+                lambda x: net.activate_batch(x).argmax(axis=1), EVAL_SEEDS[0], EVAL_MAX_FRAMES
+            )
+            self._replay = (genome.key, recording)
+            phases["record"] = time.perf_counter() - t0
+        return self._replay[1]
 
     # ------------------------------------------------------------------
-    def _materialize_config(self) -> Path:
-        """Write a temp NEAT config with overrides applied."""
-        text = Path(self.base_config_path).read_text()
+    def _build_config(self) -> neat.Config:
+        """Base config with this run's overrides, applied in memory."""
+        overrides = {
+            "pop_size": self.population_size,
+            "survival_threshold": self.survival_threshold,
+            "compatibility_threshold": self.compatibility_threshold,
+        }
+        if self.mutation_rate is not None:
+            overrides["weight_mutate_rate"] = self.mutation_rate
+        return fresh_config(overrides, path=self.base_config_path)
+
+    def _evaluate(self, batch: List[object], config: neat.Config, workers=None) -> _EvalStats:
+        """Set ``fitness`` on every genome, simulating only unseen networks.
+
+        In racing mode genomes stopped below the cutoff get a censored
+        (lower-bound) fitness; their keys land in ``self.censored_keys`` and
+        they are not memoized.
+        """
+        stats = _EvalStats()
+        meter = self._meter
+        self.censored_keys = set()
+        self._next_episode_frames = {}
+        pending: dict[bytes, List[object]] = {}
+        for g in batch:
+            signature = genome_signature(g)
+            cached = self.fitness_cache.get(signature)
+            if cached is not None:
+                g.fitness = cached
+                stats.cache_hits += 1
+                if meter is not None:
+                    meter.add((cached,))
+                for s in range(len(EVAL_SEEDS)):
+                    if (g.key, s) in self._episode_frames:
+                        self._next_episode_frames[(g.key, s)] = self._episode_frames[(g.key, s)]
+            else:
+                pending.setdefault(signature, []).append(g)
+        if not pending:
+            self._episode_frames = self._next_episode_frames
+            return stats
+
+        signatures = list(pending)
+        todo = [pending[sig][0] for sig in signatures]
+        copies = [len(pending[sig]) for sig in signatures]
+        cutoff = self._race_cutoff if self.racing else None
+        if workers is not None:
+            fitnesses, censored = self._evaluate_parallel(todo, copies, config, cutoff, workers, stats)
+        else:
+            t0 = time.perf_counter()
+            nets = [compile_genome(g, config) for g in todo]
+            t1 = time.perf_counter()
+            result = evaluate_nets(nets, cutoff=cutoff, progress=meter, copies=copies)
+            t2 = time.perf_counter()
+            if meter is not None:
+                meter.add(
+                    (f for f, n in zip(result.fitness, copies) for _ in range(n)),
+                    result.frames_simulated,
+                )
+            stats.add_phase("compile", t1 - t0)
+            stats.add_phase("evaluate", t2 - t1)
+            stats.add_busy(os.getpid(), t2 - t1)
+            fitnesses, censored = result.fitness, result.censored
+            stats.frames_simulated += result.frames_simulated
+            stats.frames_saved += result.frames_saved
+
+        for sig, fitness, is_censored in zip(signatures, fitnesses, censored):
+            if is_censored:
+                stats.censored += len(pending[sig])
+                self.censored_keys.update(g.key for g in pending[sig])
+            else:
+                self.fitness_cache.put(sig, fitness)
+            for g in pending[sig]:
+                g.fitness = fitness
+        self._episode_frames = self._next_episode_frames
+        return stats
+
+    def _expected_frames(self, genome: object, seed_index: int) -> int:
+        """Predicted episode length: last generation's own, else the longest parent's."""
+        known = self._episode_frames.get((genome.key, seed_index))
+        if known is not None:
+            return known
+        parents = self._ancestors.get(genome.key, ())
+        lengths = [self._episode_frames.get((p, seed_index)) for p in parents]
+        lengths = [n for n in lengths if n is not None]
+        return max(lengths) if lengths else EVAL_MAX_FRAMES
+
+    def _evaluate_parallel(
+        self,
+        todo: List[object],
+        copies: List[int],
+        config: neat.Config,
+        cutoff: Optional[float],
+        workers,
+        stats: _EvalStats,
+    ) -> Tuple[List[float], List[bool]]:
+        """Evaluate on a pool as longest-first batches of (genome, seed) tasks.
+
+        Tasks with similar predicted lengths share a batch, so lockstep
+        episodes finish together; batches are submitted longest first, at
+        most ``self.workers`` at a time, and each finished batch frees a slot
+        for the next. That keeps a long-lived genome from becoming the
+        generation's straggler and holds a run to its share of a shared pool.
+        Genomes count toward progress (``copies[i]`` each) once all their
+        seeds are back.
+        """
+        per = len(EVAL_SEEDS)
+        t_compile = time.perf_counter()
+        nets = [compile_genome(g, config) for g in todo]
+        tasks = [(i, s) for i in range(len(todo)) for s in range(per)]
+        tasks.sort(key=lambda t: self._expected_frames(todo[t[0]], t[1]), reverse=True)
+        size = math.ceil(len(tasks) / min(len(tasks), self.workers * TASKS_PER_WORKER))
+
+        batches: List[List[Tuple[int, int]]] = []
+        payloads = []
+        for start in range(0, len(tasks), size):
+            batch = sorted(tasks[start : start + size])  # contiguous per net, seed order
+            local = {i: j for j, i in enumerate(dict.fromkeys(i for i, _ in batch))}
+            batches.append(batch)
+            payloads.append((
+                pack_nets([nets[i] for i in local]),
+                [(local[i], EVAL_SEEDS[s]) for i, s in batch],
+                cutoff,
+                per,
+            ))
+        stats.add_phase("compile", time.perf_counter() - t_compile)
 
-        def sub(key: str, value: str) -> None:
-            nonlocal text
-            import re
+        episode_fitness = [[0.0] * per for _ in todo]
+        seeds_left = [per] * len(todo)
+        meter = self._meter
+        censored = [False] * len(todo)
+        total_busy = 0.0
+        done: "queue.Queue[tuple]" = queue.Queue()
+        queued = iter(range(len(payloads)))
 
-            text = re.sub(rf"^{key}\s*=.*$", f"{key}              = {value}", text, flags=re.MULTILINE)
+        def submit() -> None:
+            k = next(queued, None)
+            if k is not None:
+                workers.apply_async(
+                    evaluate_task,
+                    payloads[k],
+                    callback=lambda r, k=k: done.put((k, r)),
+                    error_callback=lambda e, k=k: done.put((k, e)),
+                )
+
+        t0 = time.perf_counter()
+        for _ in range(min(self.workers, len(payloads))):
+            submit()
+        for _ in range(len(payloads)):
+            k, result = _next_result(done)
+            if isinstance(result, BaseException):
+                raise result
+            submit()
+            finished = []
+            for (i, s), fitness, frames, stopped in zip(
+                batches[k], result.fitness, result.frames, result.censored
+            ):
+                episode_fitness[i][s] = fitness
+                censored[i] = censored[i] or stopped
+                self._next_episode_frames[(todo[i].key, s)] = frames
+                seeds_left[i] -= 1
+                if not seeds_left[i]:
+                    finished.extend([_mean_fitness(episode_fitness[i])] * copies[i])
+            if meter is not None:
+                meter.add(finished, sum(result.frames))
+            stats.frames_simulated += sum(result.frames)
+            stats.frames_saved += result.frames_saved
+            stats.add_busy(result.worker, result.busy_seconds)
+            total_busy += result.busy_seconds
+        wall = time.perf_counter() - t0
+        stats.add_phase("evaluate", wall)
 
-        sub("pop_size", str(self.population_size))
-        sub("survival_threshold", str(self.survival_threshold))
-        sub("compatibility_threshold", str(self.compatibility_threshold))
+        # Idle = pool capacity not spent simulating; imbalance = how much longer
+        # the evaluation took than a perfectly even split of the same work.
+        stats.worker_idle_seconds = max(0.0, self.workers * wall - total_busy)
+        if total_busy > 0:
+            stats.load_imbalance = max(0.0, wall / (total_busy / self.workers) - 1.0)
+        return [_mean_fitness(row) for row in episode_fitness], censored
 
-        tmp = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".ini", delete=False, encoding="utf-8"
+    def _update_race_cutoff(self, batch: List[object]) -> None:
+        """Next generation's cutoff: the survival quantile of this one."""
+        fitnesses = [g.fitness for g in batch if g.fitness is not None]
+        if fitnesses:
+            self._race_cutoff = float(np.quantile(fitnesses, 1.0 - self.survival_threshold))
+
+    @staticmethod
+    def _log_report(report: GenerationReport) -> None:
+        logger.info(
+            "Gen {:03d} | best={:.2f} mean={:.2f} species={} cache={:.0%} censored={} "
+            "saved={} frames idle={:.2f}s imbalance={:.0%} fps={:.0f} time={:.2f}s",
+            report.generation,
+            report.best_fitness,
+            report.mean_fitness,
+            report.species_count,
+            report.cache_hit_rate,
+            report.censored,
+            report.frames_saved,
+            report.worker_idle_seconds,
+            report.load_imbalance,
+            report.frames_per_second,
+            report.elapsed_seconds,
         )
-        tmp.write(text)
-        tmp.close()
-        self._active_config_path = Path(tmp.name)
-        return self._active_config_path
 
     # ------------------------------------------------------------------
-    async def run(self, on_generation: Optional[ProgressCallback] = None) -> Optional[object]:
-        cfg_path = self._materialize_config()
-        config = neat.Config(
-            neat.DefaultGenome,
-            neat.DefaultReproduction,
-            neat.DefaultSpeciesSet,
-            neat.DefaultStagnation,
-            str(cfg_path),
+    def _checkpoint_due(self, generation: int) -> bool:
+        if self.checkpoint_dir is None or generation <= self._checkpointed_generation:
+            return False
+        every = self.checkpoint_every_generations
+        return (every > 0 and generation % every == 0) or (
+            self.checkpoint_every_seconds > 0
+            and time.monotonic() - self._checkpointed_at >= self.checkpoint_every_seconds
+        )
+
+    def _checkpoint(self, pop: neat.Population, config: neat.Config) -> None:
+        """Snapshot ``pop`` and hand compression and I/O to the writer thread.
+
+        Must be called while nothing else mutates the population (from the
+        thread running evaluation). Only one write is outstanding at a time.
+        """
+        self._wait_checkpoint()
+        blob = checkpoint.dumps(
+            checkpoint.Checkpoint.capture(
+                pop,
+                config,
+                {"race_cutoff": self._race_cutoff, "episode_frames": self._episode_frames},
+            )
         )
+        if self._checkpoint_writer is None:
+            self._checkpoint_writer = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="checkpoint"
+            )
+        self._checkpoint_future = self._checkpoint_writer.submit(
+            checkpoint.write, self.checkpoint_dir, pop.generation, blob, self.checkpoint_keep
+        )
+        self._checkpointed_generation = pop.generation
+        self._checkpointed_at = time.monotonic()
+
+    def _wait_checkpoint(self) -> None:
+        future, self._checkpoint_future = self._checkpoint_future, None
+        if future is None:
+            return
+        try:
+            path = future.result()
+            logger.debug("Checkpoint written to {}", path)
+        except Exception as exc:
+            logger.warning("Checkpoint write failed: {}", exc)
+
+    def _restore(self, pop: neat.Population, config: neat.Config, ckpt: checkpoint.Checkpoint) -> None:
+        ckpt.restore(pop, config, rng=self._owns_rng)
+        if not self._owns_rng:
+            logger.warning("Other runs share the RNG; resumed run will not replay its original sequence")
+        self._race_cutoff = ckpt.trainer_state.get("race_cutoff")
+        self._episode_frames = ckpt.trainer_state.get("episode_frames", {})
+        self._checkpointed_generation = pop.generation
+        logger.info("Resumed NEAT run at generation {} from {}", pop.generation, self.resume_from)
+
+    # ------------------------------------------------------------------
+    def _offspring_task(self, children: List[object], config: neat.Config, cutoff: Optional[float]) -> tuple:
+        """``evaluate_task`` arguments covering every seed of ``children``."""
+        nets = [compile_genome(g, config) for g in children]
+        episodes = [(i, seed) for i in range(len(nets)) for seed in EVAL_SEEDS]
+        return pack_nets(nets), episodes, cutoff, len(EVAL_SEEDS)
+
+    def _run_steady_state(self, pop: neat.Population, config: neat.Config, workers, emit) -> object:
+        """Steady-state evolution; runs in an executor thread.
+
+        Keeps ``2 * workers`` offspring batches in flight. Whenever one comes
+        back its genomes replace the worst of the population and a new batch
+        is bred and submitted, so workers never wait on a generation barrier.
+        Every ``pop_size`` evaluations a ``GenerationReport`` is emitted and the
+        population is fully re-speciated. Species stagnation is not applied.
+        A resumed population (already evaluated) skips the seed evaluation.
+        """
+        breeder = SteadyStateBreeder(pop, config, self.survival_threshold)
+        pop_size = config.pop_size
+        per = len(EVAL_SEEDS)
+
+        if pop.generation and all(g.fitness is not None for g in pop.population.values()):
+            evaluated = pop.generation * pop_size
+        else:
+            # Seed population: evaluated like a normal first generation.
+            window_start = time.perf_counter()
+            batch = list(pop.population.values())
+            self._start_meter(1, len(batch))
+            stats = self._evaluate(batch, config, workers)
+            t0 = time.perf_counter()
+            pop.species.speciate(config, pop.population, 0)
+            stats.add_phase("speciate", time.perf_counter() - t0)
+            pop.best_genome = breeder.best()
+            pop.generation = 1
+            emit(self._steady_report(1, pop, config, stats, len(batch), window_start))
+            evaluated = len(batch)
+            if self._checkpoint_due(pop.generation):
+                self._checkpoint(pop, config)
+
+        results: "queue.Queue[tuple]" = queue.Queue()
+        in_flight = 0
+        submitted = evaluated
+        total = self.max_generations * pop_size
+        stats, window_evaluated, window_start, window_busy = _EvalStats(), 0, time.perf_counter(), 0.0
+        self._start_meter(evaluated // pop_size + 1, pop_size)
+
+        def submit() -> Tuple[int, bool]:
+            """Breed and dispatch one offspring batch; returns (bred, task started)."""
+            cutoff = None
+            if self.racing:
+                cutoff = float(np.quantile(breeder.fitnesses(), 1.0 - self.survival_threshold))
+            t0 = time.perf_counter()
+            children = [breeder.breed() for _ in range(min(OFFSPRING_PER_TASK, total - submitted))]
+            stats.add_phase("reproduce", time.perf_counter() - t0)
+            fresh, signatures = [], []
+            for child in children:
+                signature = genome_signature(child)
+                cached = self.fitness_cache.get(signature)
+                if cached is not None:
+                    child.fitness = cached
+                    results.put(([child], None, None))
+                else:
+                    fresh.append(child)
+                    signatures.append(signature)
+            if fresh:
+                t0 = time.perf_counter()
+                args = self._offspring_task(fresh, config, cutoff)
+                stats.add_phase("compile", time.perf_counter() - t0)
+                if workers is None:
+                    result = evaluate_task(*args)
+                    stats.add_phase("evaluate", result.busy_seconds)
+                    results.put((fresh, signatures, result))
+                else:
+                    workers.apply_async(
+                        evaluate_task,
+                        args,
+                        callback=lambda r, f=fresh, sig=signatures: results.put((f, sig, r)),
+                        error_callback=lambda e, f=fresh: results.put((f, None, e)),
+                    )
+            return len(children), bool(fresh)
+
+        while evaluated < total:
+            target = max(1, 2 * self.workers) if workers is not None else 1
+            while not self._stop_flag and not self.paused and in_flight < target and submitted < total:
+                bred, started = submit()
+                submitted += bred
+                in_flight += started
+            if in_flight == 0 and results.empty():
+                if self._stop_flag:
+                    break  # stop requested and everything drained
+                self._unpaused.wait()  # paused and drained
+                continue
+            t0 = time.perf_counter()
+            children, signatures, result = _next_result(results)
+            if workers is not None:
+                stats.add_phase("evaluate", time.perf_counter() - t0)
+            if isinstance(result, BaseException):
+                raise result
+            if result is not None:
+                in_flight -= 1
+                window_busy += result.busy_seconds
+                stats.add_busy(result.worker, result.busy_seconds)
+                stats.frames_simulated += sum(result.frames)
+                stats.frames_saved += result.frames_saved
+                for i, (child, signature) in enumerate(zip(children, signatures)):
+                    child.fitness = _mean_fitness(result.fitness[i * per : (i + 1) * per])
+                    if any(result.censored[i * per : (i + 1) * per]):
+                        stats.censored += 1
+                    else:
+                        self.fitness_cache.put(signature, child.fitness)
+            else:
+                stats.cache_hits += 1
+            if self._meter is not None:
+                self._meter.add(
+                    [child.fitness for child in children], sum(result.frames) if result is not None else 0
+                )
+            t0 = time.perf_counter()
+            for child in children:
+                breeder.insert(child)
+                if child.fitness > pop.best_genome.fitness:
+                    pop.best_genome = child
+            stats.add_phase("speciate", time.perf_counter() - t0)
+            evaluated += len(children)
+            window_evaluated += len(children)
+
+            if window_evaluated >= pop_size or (evaluated >= total and window_evaluated):
+                generation = -(-evaluated // pop_size)
+                t0 = time.perf_counter()
+                breeder.respeciate(generation)
+                stats.add_phase("speciate", time.perf_counter() - t0)
+                pop.generation = generation
+                wall = time.perf_counter() - window_start
+                if workers is not None:
+                    stats.worker_idle_seconds = max(0.0, self.workers * wall - window_busy)
+                    if window_busy > 0:
+                        stats.load_imbalance = max(0.0, wall / (window_busy / self.workers) - 1.0)
+                emit(self._steady_report(generation, pop, config, stats, window_evaluated, window_start))
+                stats, window_evaluated, window_start, window_busy = _EvalStats(), 0, time.perf_counter(), 0.0
+                self._start_meter(generation + 1, pop_size)
+                if self._checkpoint_due(generation):
+                    t0 = time.perf_counter()
+                    self._checkpoint(pop, config)
+                    stats.add_phase("checkpoint", time.perf_counter() - t0)
+        return pop.best_genome
+
+    def _steady_report(
+        self,
+        generation: int,
+        pop: neat.Population,
+        config: neat.Config,
+        stats: _EvalStats,
+        evaluated: int,
+        since: float,
+    ) -> GenerationReport:
+        # Evaluation overlaps breeding here, so throughput is over the whole window.
+        fitnesses = [g.fitness for g in pop.population.values()]
+        wall = time.perf_counter() - since
+        replay = self._record_replay(pop.best_genome, config, stats.phases)
+        return GenerationReport(
+            generation=generation,
+            best_fitness=float(pop.best_genome.fitness),
+            mean_fitness=float(sum(fitnesses) / len(fitnesses)),
+            species_count=len(pop.species.species),
+            population_size=len(pop.population),
+            elapsed_seconds=wall,
+            best_genome=pop.best_genome,
+            cache_hits=stats.cache_hits,
+            cache_hit_rate=stats.cache_hits / evaluated if evaluated else 0.0,
+            censored=stats.censored,
+            frames_simulated=stats.frames_simulated,
+            frames_saved=stats.frames_saved,
+            worker_idle_seconds=stats.worker_idle_seconds,
+            load_imbalance=stats.load_imbalance,
+            replay=replay,
+            **self._performance(stats, evaluated, wall, pop.population.values()),
+        )
+
+    @staticmethod
+    def _performance(stats: _EvalStats, evaluated: int, wall: float, genomes) -> dict:
+        """Phase, throughput, utilization and genome-size fields of a ``GenerationReport``."""
+        sizes = [genome_size(g) for g in genomes]
+        return dict(
+            phase_seconds=dict(stats.phases),
+            frames_per_second=stats.frames_simulated / wall if wall > 0 else 0.0,
+            genomes_per_second=evaluated / wall if wall > 0 else 0.0,
+            worker_utilization=stats.utilization(wall),
+            mean_genome_size=sum(sizes) / len(sizes) if sizes else 0.0,
+            max_genome_size=max(sizes, default=0),
+        )
+
+    # ------------------------------------------------------------------
+    async def run(
+        self,
+        on_generation: Optional[ProgressCallback] = None,
+        on_progress: Optional[ProgressListener] = None,
+    ) -> Optional[object]:
+        global _active_runs
+        with _active_runs_lock:
+            _active_runs += 1
+            self._owns_rng = _active_runs == 1
+        try:
+            return await self._run(on_generation, on_progress)
+        finally:
+            with _active_runs_lock:
+                _active_runs -= 1
+
+    async def _run(
+        self,
+        on_generation: Optional[ProgressCallback],
+        on_progress: Optional[ProgressListener],
+    ) -> Optional[object]:
+        config = self._build_config()
+        if self.seed is not None and self.resume_from is None:
+            if self._owns_rng:
+                random.seed(self.seed)
+            else:
+                logger.warning("Other runs share the RNG; seed {} not applied", self.seed)
         pop = neat.Population(config)
-        best_genome = None
         loop = asyncio.get_running_loop()
+        if self.resume_from is not None:
+            ckpt = await loop.run_in_executor(None, checkpoint.load, self.resume_from)
+            self._restore(pop, config, ckpt)
+        elif self.seed_genomes:
+            seed_population(pop, config, self.seed_genomes)
+            logger.info("Seeded population from {} trained genome(s)", len(self.seed_genomes))
+        best_genome = pop.best_genome
+        self._checkpointed_at = time.monotonic()
+        if on_progress is not None and self.progress_interval > 0:
+            self._emit_progress = lambda report: loop.call_soon_threadsafe(on_progress, report)
 
         use_parallel = self.workers > 1 and sys.platform != "win32"
+        self._ancestors = pop.reproduction.ancestors
         evaluator = None
-        if use_parallel:
+        workers = None
+        if self.pool is not None:
+            workers = self.pool
+        elif use_parallel:
             try:
                 evaluator = neat.ParallelEvaluator(self.workers, _eval_genome)
+                workers = evaluator.pool
                 logger.info("NEAT using ParallelEvaluator with {} workers", self.workers)
             except Exception as exc:  # pragma: no cover
                 logger.warning("ParallelEvaluator unavailable ({}); falling back to serial", exc)
@@ -130,70 +979,109 @@ class NeatTrainer:
 
         start = time.perf_counter()
 
-        for gen in range(self.max_generations):
-            if self._stop_flag:
-                logger.info("Training stopped by request at generation {}", gen)
-                break
+        if self.mode == "steady_state":
+            def emit(report: GenerationReport) -> None:
+                self._log_report(report)
+                if on_generation:
+                    asyncio.run_coroutine_threadsafe(on_generation(report), loop).result()
 
-            gen_start = time.perf_counter()
+            best_genome = await loop.run_in_executor(
+                None, self._run_steady_state, pop, config, workers, emit
+            )
+        else:
+            for gen in range(pop.generation, self.max_generations):
+                while self.paused:
+                    await asyncio.sleep(0.25)
+                if self._stop_flag:
+                    logger.info("Training stopped by request at generation {}", gen)
+                    break
 
-            def _run_one_generation():
-                # Follow neat.Population.run exact ordering
-                pop.reporters.start_generation(pop.generation)
-                genomes = list(pop.population.items())
-                if evaluator is not None:
-                    evaluator.evaluate(genomes, config)
-                else:
+                gen_start = time.perf_counter()
+
+                def _run_one_generation():
+                    # Follow neat.Population.run exact ordering
+                    pop.reporters.start_generation(pop.generation)
+                    genomes = list(pop.population.items())
+                    batch = [g for _, g in genomes]
+                    self._start_meter(pop.generation + 1, len(batch))
+                    self._last_eval = stats = self._evaluate(batch, config, workers)
+                    self._last_evaluated = len(genomes)
+                    eval_wall = stats.phases.get("compile", 0.0) + stats.phases.get("evaluate", 0.0)
+                    self._last_perf = self._performance(stats, len(batch), eval_wall, batch)
+                    if self.racing:
+                        self._update_race_cutoff(batch)
+                    # Determine best
+                    best = None
                     for _, g in genomes:
-                        g.fitness = _eval_genome(g, config)
-                # Determine best
-                best = None
-                for _, g in genomes:
-                    if best is None or (g.fitness is not None and g.fitness > best.fitness):
-                        best = g
-                pop.reporters.post_evaluate(config, pop.population, pop.species, best)
-                if pop.best_genome is None or (best and best.fitness > pop.best_genome.fitness):
-                    pop.best_genome = best
-                # Reproduce next generation
-                pop.population = pop.reproduction.reproduce(
-                    config, pop.species, config.pop_size, pop.generation
+                        if best is None or (g.fitness is not None and g.fitness > best.fitness):
+                            best = g
+                    pop.reporters.post_evaluate(config, pop.population, pop.species, best)
+                    if pop.best_genome is None or (best and best.fitness > pop.best_genome.fitness):
+                        pop.best_genome = best
+                    # Reproduce next generation
+                    t0 = time.perf_counter()
+                    pop.population = pop.reproduction.reproduce(
+                        config, pop.species, config.pop_size, pop.generation
+                    )
+                    # Handle extinction
+                    if not pop.species.species:
+                        pop.reporters.complete_extinction()
+                        if config.reset_on_extinction:
+                            pop.population = pop.reproduction.create_new(
+                                config.genome_type, config.genome_config, config.pop_size
+                            )
+                    t1 = time.perf_counter()
+                    # Speciate the new population
+                    pop.species.speciate(config, pop.population, pop.generation)
+                    t2 = time.perf_counter()
+                    pop.reporters.end_generation(config, pop.population, pop.species)
+                    pop.generation += 1
+                    phases = self._last_perf["phase_seconds"]
+                    phases["reproduce"] = t1 - t0
+                    phases["speciate"] = t2 - t1
+                    if self._checkpoint_due(pop.generation):
+                        self._checkpoint(pop, config)
+                        phases["checkpoint"] = time.perf_counter() - t2
+                    self._last_replay = self._record_replay(pop.best_genome, config, phases)
+                    return best
+
+                best = await loop.run_in_executor(None, _run_one_generation)
+                best_genome = pop.best_genome
+
+                fitnesses = [g.fitness for _, g in pop.population.items() if g.fitness is not None]
+                report = GenerationReport(
+                    generation=gen + 1,
+                    best_fitness=float(best_genome.fitness) if best_genome else 0.0,
+                    mean_fitness=float(sum(fitnesses) / len(fitnesses)) if fitnesses else 0.0,
+                    species_count=len(pop.species.species),
+                    population_size=len(pop.population),
+                    elapsed_seconds=time.perf_counter() - gen_start,
+                    best_genome=best_genome,
+                    cache_hits=self._last_eval.cache_hits,
+                    cache_hit_rate=self._last_eval.cache_hits / self._last_evaluated
+                    if self._last_evaluated
+                    else 0.0,
+                    censored=self._last_eval.censored,
+                    frames_simulated=self._last_eval.frames_simulated,
+                    frames_saved=self._last_eval.frames_saved,
+                    worker_idle_seconds=self._last_eval.worker_idle_seconds,
+                    load_imbalance=self._last_eval.load_imbalance,
+                    replay=self._last_replay,
+                    **self._last_perf,
                 )
-                # Handle extinction
-                if not pop.species.species:
-                    pop.reporters.complete_extinction()
-                    if config.reset_on_extinction:
-                        pop.population = pop.reproduction.create_new(
-                            config.genome_type, config.genome_config, config.pop_size
-                        )
-                # Speciate the new population
-                pop.species.speciate(config, pop.population, pop.generation)
-                pop.reporters.end_generation(config, pop.population, pop.species)
-                pop.generation += 1
-                return best
-
-            best = await loop.run_in_executor(None, _run_one_generation)
-            best_genome = pop.best_genome
-
-            fitnesses = [g.fitness for _, g in pop.population.items() if g.fitness is not None]
-            report = GenerationReport(
-                generation=gen + 1,
-                best_fitness=float(best_genome.fitness) if best_genome else 0.0,
-                mean_fitness=float(sum(fitnesses) / len(fitnesses)) if fitnesses else 0.0,
-                species_count=len(pop.species.species),
-                population_size=len(pop.population),
-                elapsed_seconds=time.perf_counter() - gen_start,
-                best_genome=best_genome,
-            )
-            logger.info(
-                "Gen {:03d} | best={:.2f} mean={:.2f} species={} time={:.2f}s",
-                report.generation,
-                report.best_fitness,
-                report.mean_fitness,
-                report.species_count,
-                report.elapsed_seconds,
-            )
-            if on_generation:
-                await on_generation(report)
+                self._log_report(report)
+                if on_generation:
+                    await on_generation(report)
+
+        if self.checkpoint_dir is not None:
+            if self._stop_flag and pop.generation > self._checkpointed_generation:
+                # Stopped between scheduled checkpoints: keep the latest state to resume from.
+                self._checkpointed_generation = -1
+                await loop.run_in_executor(None, self._checkpoint, pop, config)
+            await loop.run_in_executor(None, self._wait_checkpoint)
+            if self._checkpoint_writer is not None:
+                self._checkpoint_writer.shutdown()
+                self._checkpoint_writer = None
 
         if evaluator is not None:
             try:
@@ -203,12 +1091,6 @@ class NeatTrainer:
 
         logger.info("Training done in {:.2f}s", time.perf_counter() - start)
 
-        if self._active_config_path and self._active_config_path.exists():
-            try:
-                os.unlink(self._active_config_path)
-            except OSError:
-                pass
-
         return best_genome
 
 
@@ -0,0 +1,84 @@
+"""Seed a NEAT population from previously trained genomes.
+
+neat-python identifies connection genes by their ``(in, out)`` node pair, so
+"innovation" alignment is entirely a matter of node ids. Input and output
+nodes share fixed ids across genomes; hidden node ids are only meaningful
+within the genome (lineage) that created them. Genomes from different saved
+models therefore get their hidden nodes renumbered into disjoint ranges
+before they can be crossed over, and the run's node indexer starts past all
+of them.
+"""
+from __future__ import annotations
+
+import copy
+import itertools
+from typing import List, Sequence
+
+import neat
+
+# Mutation rounds applied to each seeded variant: enough to spread the
+# population around its sources without losing what they learned.
+VARIANT_MUTATIONS = 2
+
+
+def check_compatible(genome: object, genome_config: object, label: str = "genome") -> None:
+    """Raise ``ValueError`` unless ``genome`` fits the config's inputs and outputs."""
+    if not hasattr(genome, "nodes") or not hasattr(genome, "connections"):
+        raise ValueError(f"{label} is not a NEAT genome")
+    inputs = set(genome_config.input_keys)
+    outputs = set(genome_config.output_keys)
+    missing = outputs - set(genome.nodes)
+    if missing:
+        raise ValueError(f"{label} lacks output nodes {sorted(missing)}")
+    for i, o in genome.connections:
+        if (i < 0 and i not in inputs) or o < 0:
+            raise ValueError(f"{label} has connection {(i, o)} incompatible with the config")
+
+
+def reconcile_genomes(genomes: Sequence[object], genome_config: object) -> List[object]:
+    """Copies of ``genomes`` whose hidden node ids do not collide across sources."""
+    outputs = set(genome_config.output_keys)
+    next_id = itertools.count(max(outputs) + 1)
+    reconciled = []
+    for genome in genomes:
+        g = copy.deepcopy(genome)
+        # Inputs (negative ids) and outputs keep theirs.
+        mapping = {k: next(next_id) for k in sorted(g.nodes) if k not in outputs}
+        nodes = {}
+        for k, ng in g.nodes.items():
+            ng.key = mapping.get(k, k)
+            nodes[ng.key] = ng
+        connections = {}
+        for (i, o), cg in g.connections.items():
+            cg.key = (mapping.get(i, i), mapping.get(o, o))
+            connections[cg.key] = cg
+        g.nodes, g.connections = nodes, connections
+        reconciled.append(g)
+    return reconciled
+
+
+def seed_population(pop: neat.Population, config: neat.Config, sources: Sequence[object]) -> None:
+    """Replace ``pop``'s random initial population with ``sources`` and mutated variants.
+
+    Each source appears once unchanged; the rest of the population cycles
+    through the sources, each copy mutated ``VARIANT_MUTATIONS`` times.
+    """
+    gc = config.genome_config
+    sources = reconcile_genomes(list(sources)[: config.pop_size], gc)
+    max_node = max(k for g in sources for k in g.nodes)
+    gc.node_indexer = itertools.count(max_node + 1)
+
+    reproduction = pop.reproduction
+    population = {}
+    for n in range(config.pop_size):
+        g = copy.deepcopy(sources[n % len(sources)])
+        g.key = next(reproduction.genome_indexer)
+        g.fitness = None
+        if n >= len(sources):
+            for _ in range(VARIANT_MUTATIONS):
+                g.mutate(gc)
+        population[g.key] = g
+        reproduction.ancestors[g.key] = tuple()
+
+    pop.population = population
+    pop.species.speciate(config, pop.population, pop.generation)
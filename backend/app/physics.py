@@ -9,6 +9,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 # ---------------- Canvas / world ----------------
 CANVAS_WIDTH = 600
 CANVAS_HEIGHT = 150
@@ -81,6 +83,7 @@ class DinoState:
 # the NEAT config expects exactly NUM_INPUTS.
 NUM_INPUTS = 6
 NUM_OUTPUTS = 3  # [jump, duck, noop]
+ACTIONS = ("jump", "duck", "noop")  # output index -> action name
 
 
 def normalize_sensors(
@@ -100,3 +103,27 @@ def normalize_sensors(
         max(0.0, min(1.0, (speed - INITIAL_SPEED) / (MAX_SPEED - INITIAL_SPEED + 1e-9))),
         max(0.0, min(1.0, (GROUND_Y - dino_y) / 100.0)),
     ]
+
+
+def normalize_sensors_array(
+    dist_next: np.ndarray,
+    obs_width: np.ndarray,
+    obs_height: np.ndarray,
+    obs_y: np.ndarray,
+    speed: np.ndarray,
+    dino_y: np.ndarray,
+) -> np.ndarray:
+    """Vectorized :func:`normalize_sensors`; returns an ``(N, NUM_INPUTS)`` array.
+
+    Performs the same float64 operations in the same order as the scalar
+    version, so each row is bit-identical to ``normalize_sensors``.
+    """
+    cols = (
+        dist_next / CANVAS_WIDTH,
+        obs_width / 100.0,
+        obs_height / 100.0,
+        obs_y / CANVAS_HEIGHT,
+        (speed - INITIAL_SPEED) / (MAX_SPEED - INITIAL_SPEED + 1e-9),
+        (GROUND_Y - dino_y) / 100.0,
+    )
+    return np.clip(np.stack(cols, axis=1), 0.0, 1.0)
@@ -3,6 +3,11 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
+from ..services.eval_pool import eval_pool
+from ..services.generation_history import generation_history
+from ..services.loop_monitor import loop_monitor
+from ..services.replay_verifier import replay_verifier
+
 router = APIRouter(tags=["health"])
 
 
@@ -13,4 +18,10 @@ async def health() -> dict:
 
 @router.get("/ready")
 async def ready() -> dict:
-    return {"status": "ready"}
+    return {
+        "status": "ready",
+        "eval_pool": eval_pool.stats(),
+        "loop_lag": loop_monitor.stats(),
+        "generation_history": generation_history.stats(),
+        "replay_verifier": replay_verifier.stats(),
+    }
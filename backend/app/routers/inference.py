@@ -1,29 +1,46 @@
-"""AI inference: REST single-shot decide + WebSocket autopilot stream."""
+"""AI inference: REST single-shot + batched decide, WebSocket autopilot stream.
+
+``/ws/play`` speaks JSON by default. Clients that offer the ``dino.bin.v1``
+subprotocol instead send binary frames of ``<I6f`` (uint32 frame counter +
+six float32 sensors) and receive ``<B`` (action index into
+``physics.ACTIONS``), followed by ``<3f`` outputs when connected with
+``?outputs=true``. Decisions from all connections are micro-batched per
+model by ``inference_scheduler``.
+"""
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+import struct
+from typing import List
+
+import numpy as np
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.exceptions import RequestValidationError
 from loguru import logger
+from pydantic import ValidationError
 
-from ..neat.inference import build_net, decide
-from ..schemas import DecisionRequest, DecisionResponse
+from .. import physics as P
+from ..config import get_settings
+from ..db import AsyncSessionLocal
+from ..neat.inference import decide, decide_batch
+from ..schemas import (
+    BatchDecisionRequest,
+    BatchDecisionResponse,
+    DecisionRequest,
+    DecisionResponse,
+    ModelDecisions,
+)
+from ..services.inference_scheduler import inference_scheduler
 from ..services.model_store import model_store
+from ..services.net_cache import net_cache
+from ..services.play_sessions import play_sessions
 
 router = APIRouter(prefix="/api", tags=["inference"])
 
-# Net cache keyed by model_id. Public so the models router can invalidate it on delete.
-net_cache: dict[str, object] = {}
-
-
 def _load_net(model_id: str):
-    if model_id in net_cache:
-        return net_cache[model_id]
     try:
-        genome, config = model_store.load_genome(model_id)
+        return net_cache.get(model_id)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail="Model file missing") from exc
-    net = build_net(genome, config)
-    net_cache[model_id] = net
-    return net
 
 
 @router.post("/decision", response_model=DecisionResponse)
@@ -33,9 +50,99 @@ async def decision(req: DecisionRequest) -> DecisionResponse:
     return DecisionResponse(action=action, outputs=outputs)
 
 
+_ROW_BYTES = P.NUM_INPUTS * 4  # one packed float32 sensor row
+_MAX_BATCH_MODELS = 16
+
+
+@router.post(
+    "/decision/batch",
+    response_model=BatchDecisionResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": BatchDecisionRequest.model_json_schema()},
+                "application/octet-stream": {"schema": {"type": "string", "format": "binary"}},
+            },
+        }
+    },
+)
+async def decision_batch(
+    request: Request,
+    model_id: List[str] = Query(default=[]),
+    include_outputs: bool = Query(default=True),
+) -> BatchDecisionResponse:
+    """Decide many sensor rows against one or more models in one pass per model.
+
+    JSON bodies follow ``BatchDecisionRequest``. ``application/octet-stream``
+    bodies are packed little-endian float32 rows of ``NUM_INPUTS`` values;
+    models then come from repeated ``model_id`` query parameters.
+    """
+    max_rows = get_settings().max_decision_batch_rows
+    body = await request.body()
+    if request.headers.get("content-type", "").startswith("application/octet-stream"):
+        if not model_id:
+            raise HTTPException(status_code=422, detail="model_id query parameter required")
+        if len(body) % _ROW_BYTES:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Body must be packed float32 rows of {P.NUM_INPUTS} values",
+            )
+        if len(body) // _ROW_BYTES > max_rows:
+            raise HTTPException(status_code=413, detail=f"At most {max_rows} rows per batch")
+        model_ids = model_id
+        sensors = np.frombuffer(body, dtype="<f4").reshape(-1, P.NUM_INPUTS).astype(np.float64)
+    else:
+        try:
+            req = BatchDecisionRequest.model_validate_json(body)
+        except ValidationError as exc:
+            raise RequestValidationError(exc.errors(include_url=False)) from exc
+        if len(req.sensors) > max_rows:
+            raise HTTPException(status_code=413, detail=f"At most {max_rows} rows per batch")
+        if any(len(row) != P.NUM_INPUTS for row in req.sensors):
+            raise HTTPException(
+                status_code=422, detail=f"Every sensor row needs {P.NUM_INPUTS} values"
+            )
+        model_ids = req.model_ids
+        include_outputs = req.include_outputs
+        sensors = np.array(req.sensors, dtype=np.float64).reshape(-1, P.NUM_INPUTS)
+
+    if len(model_ids) > _MAX_BATCH_MODELS:
+        raise HTTPException(status_code=422, detail=f"At most {_MAX_BATCH_MODELS} models per batch")
+
+    results = []
+    for mid in dict.fromkeys(model_ids):
+        idx, outputs = decide_batch(_load_net(mid), sensors)
+        results.append(
+            ModelDecisions(
+                model_id=mid,
+                actions=[P.ACTIONS[i] for i in idx.tolist()],
+                outputs=outputs.tolist() if include_outputs else None,
+            )
+        )
+    return BatchDecisionResponse(rows=len(sensors), results=results)
+
+
+BINARY_SUBPROTOCOL = "dino.bin.v1"
+_SENSOR_FRAME = struct.Struct(f"<I{P.NUM_INPUTS}f")
+_ACTION_FRAME = struct.Struct("<B")
+_ACTION_OUTPUTS_FRAME = struct.Struct(f"<B{P.NUM_OUTPUTS}f")
+_ACTION_CODES = {name: i for i, name in enumerate(P.ACTIONS)}
+
+
+@router.get("/inference/stats")
+async def inference_stats() -> dict:
+    return {
+        "sessions": play_sessions.snapshot(),
+        "scheduler": inference_scheduler.stats(),
+        "net_cache": net_cache.stats(),
+    }
+
+
 @router.websocket("/ws/play/{model_id}")
-async def play_ws(ws: WebSocket, model_id: str) -> None:
-    await ws.accept()
+async def play_ws(ws: WebSocket, model_id: str, outputs: bool = False) -> None:
+    binary = BINARY_SUBPROTOCOL in ws.scope.get("subprotocols", [])
+    await ws.accept(subprotocol=BINARY_SUBPROTOCOL if binary else None)
     try:
         net = _load_net(model_id)
     except HTTPException as exc:
@@ -44,21 +151,61 @@ async def play_ws(ws: WebSocket, model_id: str) -> None:
         finally:
             await ws.close()
         return
+    # Feeds NET_CACHE_WARMUP_BY=recent; one write per session, not per frame.
+    async with AsyncSessionLocal() as db:
+        await model_store.mark_played(db, model_id)
 
+    session = play_sessions.open(model_id, BINARY_SUBPROTOCOL if binary else "json")
     try:
-        while True:
-            msg = await ws.receive_json()
-            sensors = msg.get("sensors")
-            if not isinstance(sensors, list):
-                await ws.send_json({"type": "error", "message": "sensors required"})
-                continue
-            try:
-                action, outputs = decide(net, [float(x) for x in sensors])
-            except Exception as exc:  # pragma: no cover
-                await ws.send_json({"type": "error", "message": str(exc)})
-                continue
-            await ws.send_json({"type": "action", "action": action, "outputs": outputs})
+        if binary:
+            await _play_binary(ws, model_id, net, session, outputs)
+        else:
+            await _play_json(ws, model_id, net, session)
     except WebSocketDisconnect:
-        logger.debug("play ws disconnected")
+        logger.debug("play ws disconnected after {} frames", session.frames)
     except Exception as exc:  # pragma: no cover
         logger.exception("play ws error: {}", exc)
+    finally:
+        play_sessions.close(session)
+
+
+async def _play_json(ws: WebSocket, model_id: str, net, session) -> None:
+    while True:
+        msg = await ws.receive_json()
+        sensors = msg.get("sensors")
+        if not isinstance(sensors, list):
+            await ws.send_json({"type": "error", "message": "sensors required"})
+            continue
+        try:
+            action, outputs = await inference_scheduler.decide(
+                model_id, net, [float(x) for x in sensors]
+            )
+        except Exception as exc:  # pragma: no cover
+            await ws.send_json({"type": "error", "message": str(exc)})
+            continue
+        session.record_frame()
+        await ws.send_json({"type": "action", "action": action, "outputs": outputs})
+
+
+async def _play_binary(ws: WebSocket, model_id: str, net, session, with_outputs: bool) -> None:
+    while True:
+        msg = await ws.receive()
+        if msg["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(msg.get("code", 1000))
+        data = msg.get("bytes")
+        if data is None or len(data) != _SENSOR_FRAME.size:
+            await ws.send_json(
+                {"type": "error", "message": f"expected {_SENSOR_FRAME.size}-byte sensor frames"}
+            )
+            continue
+        frame_no, *sensors = _SENSOR_FRAME.unpack(data)
+        try:
+            action, outputs = await inference_scheduler.decide(model_id, net, sensors)
+        except Exception as exc:
+            await ws.send_json({"type": "error", "message": str(exc)})
+            continue
+        session.record_frame(frame_no)
+        if with_outputs:
+            await ws.send_bytes(_ACTION_OUTPUTS_FRAME.pack(_ACTION_CODES[action], *outputs))
+        else:
+            await ws.send_bytes(_ACTION_FRAME.pack(_ACTION_CODES[action]))
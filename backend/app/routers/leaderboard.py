@@ -3,13 +3,14 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import desc, select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import desc, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_session
 from ..models_db import LeaderboardEntry
-from ..schemas import LeaderboardEntryOut, LeaderboardSubmitRequest
+from ..schemas import LeaderboardEntryOut, LeaderboardSubmitRequest, VerificationStatus
+from ..services.replay_verifier import VerificationJob, replay_verifier
 
 router = APIRouter(prefix="/api/leaderboard", tags=["leaderboard"])
 
@@ -18,25 +19,62 @@ router = APIRouter(prefix="/api/leaderboard", tags=["leaderboard"])
 async def submit(
     req: LeaderboardSubmitRequest, session: AsyncSession = Depends(get_session)
 ) -> LeaderboardEntryOut:
+    if req.actions is not None and req.seed is None:
+        raise HTTPException(status_code=422, detail="actions need the seed they were played on")
+    if req.seed is not None and req.actions is None and not (req.mode == "ai" and req.model_id):
+        raise HTTPException(status_code=422, detail="a seed needs its actions, or an AI model to replay")
     row = LeaderboardEntry(
         player_name=req.player_name,
         score=req.score,
         mode=req.mode,
         model_id=req.model_id,
+        replay_seed=req.seed,
+        replay_actions=req.actions,
+        verification="pending" if req.seed is not None else None,
     )
     session.add(row)
     await session.commit()
     await session.refresh(row)
+    if req.seed is not None:
+        replay_verifier.submit(VerificationJob(row.id, row.score, req.seed, req.actions, req.model_id))
     return LeaderboardEntryOut.model_validate(row)
 
 
+@router.get("/verifier")
+async def verifier_stats() -> dict:
+    """Replay verification queue, batch and throughput counters."""
+    return replay_verifier.stats()
+
+
+@router.get("/{entry_id}/verification", response_model=VerificationStatus)
+async def verification_status(
+    entry_id: int, session: AsyncSession = Depends(get_session)
+) -> VerificationStatus:
+    row = await session.get(LeaderboardEntry, entry_id)
+    if row is None or row.verification is None:
+        raise HTTPException(status_code=404, detail="No replay verification for this entry")
+    return VerificationStatus(
+        entry_id=row.id,
+        status=row.verification,
+        score=row.score,
+        verified_score=row.verified_score,
+        note=row.verification_note,
+        verified_at=row.verified_at,
+    )
+
+
 @router.get("", response_model=List[LeaderboardEntryOut])
 async def top(
     mode: Optional[str] = Query(default=None, pattern="^(human|ai)$"),
     limit: int = Query(default=25, ge=1, le=100),
     session: AsyncSession = Depends(get_session),
 ) -> List[LeaderboardEntryOut]:
-    stmt = select(LeaderboardEntry).order_by(desc(LeaderboardEntry.score), LeaderboardEntry.created_at)
+    stmt = (
+        select(LeaderboardEntry)
+        # Entries whose replay disproved the score are off the board.
+        .where(or_(LeaderboardEntry.verification.is_(None), LeaderboardEntry.verification != "rejected"))
+        .order_by(desc(LeaderboardEntry.score), LeaderboardEntry.created_at)
+    )
     if mode:
         stmt = stmt.where(LeaderboardEntry.mode == mode)
     stmt = stmt.limit(limit)
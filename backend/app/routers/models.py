@@ -13,7 +13,6 @@ from ..db import get_session
 from ..neat.inference import genome_to_graph
 from ..schemas import GenomeGraph, ModelInfo, ModelUpdateRequest
 from ..services.model_store import model_store
-from . import inference as inference_router
 
 router = APIRouter(prefix="/api/models", tags=["models"])
 
@@ -37,7 +36,6 @@ async def delete_model(model_id: str, session: AsyncSession = Depends(get_sessio
     ok = await model_store.delete(session, model_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Model not found")
-    inference_router.net_cache.pop(model_id, None)
     return {"status": "deleted"}
 
 
@@ -0,0 +1,40 @@
+"""Hyperparameter sweep endpoints."""
+from __future__ import annotations
+
+from typing import List
+
+from fastapi import APIRouter, HTTPException
+
+from ..schemas import SweepRequest, SweepStatus
+from ..services.sweep_manager import sweep_manager
+
+router = APIRouter(prefix="/api/sweeps", tags=["sweeps"])
+
+
+@router.post("", response_model=SweepStatus)
+async def start_sweep(req: SweepRequest) -> SweepStatus:
+    try:
+        sweep = await sweep_manager.start(req)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return sweep.summary()
+
+
+@router.get("", response_model=List[SweepStatus])
+async def list_sweeps() -> List[SweepStatus]:
+    return await sweep_manager.list_sweeps()
+
+
+@router.get("/{sweep_id}", response_model=SweepStatus)
+async def get_sweep(sweep_id: str) -> SweepStatus:
+    status = await sweep_manager.get(sweep_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Sweep not found")
+    return status
+
+
+@router.post("/{sweep_id}/stop")
+async def stop_sweep(sweep_id: str) -> dict:
+    if not await sweep_manager.stop(sweep_id):
+        raise HTTPException(status_code=400, detail="Sweep is not running")
+    return {"status": "stopping"}
@@ -2,16 +2,29 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Response, WebSocket, WebSocketDisconnect
 from loguru import logger
 
 from ..schemas import (
+    GenerationPage,
+    Replay,
+    ReplayInfo,
+    SubscriberStats,
+    TrainingMetrics,
+    TrainingRunStatus,
     TrainingStartRequest,
     TrainingStartResponse,
     TrainingStatusResponse,
 )
+from ..services.fanout import Subscription
+from ..services.generation_history import generation_history
 from ..services.training_manager import training_manager
+from ..simulator import get_course
 
 router = APIRouter(prefix="/api/training", tags=["training"])
 
@@ -19,10 +32,14 @@ router = APIRouter(prefix="/api/training", tags=["training"])
 @router.post("/start", response_model=TrainingStartResponse)
 async def start_training(req: TrainingStartRequest) -> TrainingStartResponse:
     try:
-        run_id = await training_manager.start(req)
+        run = await training_manager.start(req)
+    except LookupError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
     except RuntimeError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
-    return TrainingStartResponse(run_id=run_id, status="running")
+    return TrainingStartResponse(run_id=run.run_id, status=run.state)
 
 
 @router.post("/stop")
@@ -35,27 +52,135 @@ async def stop_training() -> dict:
 
 @router.get("/status", response_model=TrainingStatusResponse)
 async def training_status() -> TrainingStatusResponse:
-    r = training_manager._current_report
+    latest = training_manager.latest()
+    r = latest.current_report if latest else None
     return TrainingStatusResponse(
         active=training_manager.is_active,
         run_id=training_manager.run_id,
         generation=r.generation if r else 0,
         best_fitness=r.best_fitness if r else 0.0,
+        runs=training_manager.runs(),
+    )
+
+
+@router.get("/runs", response_model=list[TrainingRunStatus])
+async def list_runs() -> list[TrainingRunStatus]:
+    return training_manager.runs()
+
+
+@router.get("/runs/{run_id}/generations", response_model=GenerationPage)
+async def run_generations(
+    run_id: str,
+    after: Optional[int] = Query(default=None, ge=0, description="Cursor: last generation already seen"),
+    start: Optional[int] = Query(default=None, ge=0),
+    end: Optional[int] = Query(default=None, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> GenerationPage:
+    """A run's stored generation events, oldest first."""
+    if not await training_manager.run_exists(run_id):
+        raise HTTPException(status_code=404, detail="Unknown training run")
+    items = await generation_history.page(run_id, after, start, end, limit + 1)
+    more = len(items) > limit
+    items = items[:limit]
+    return GenerationPage(
+        run_id=run_id, items=items, next_cursor=items[-1].generation if more else None
     )
 
 
+@router.get("/runs/{run_id}/replays", response_model=list[ReplayInfo])
+async def run_replays(run_id: str) -> list[ReplayInfo]:
+    """Generations with a recorded champion episode."""
+    if not await training_manager.run_exists(run_id):
+        raise HTTPException(status_code=404, detail="Unknown training run")
+    return [
+        ReplayInfo(generation=generation, **json.loads(data))
+        for generation, data in await generation_history.replays(run_id)
+    ]
+
+
+# Resuming a run from a checkpoint re-records the generations after it, so a
+# replay can change under its URL: caches keep it but revalidate by ETag.
+_REVALIDATE = "public, no-cache"
+
+
+@router.get("/runs/{run_id}/replays/{generation}", response_model=Replay)
+async def run_replay(
+    run_id: str, generation: int, if_none_match: Optional[str] = Header(default=None)
+) -> Response:
+    """One generation champion's recorded episode, for client-side playback."""
+    data = await generation_history.replay(run_id, generation)
+    if data is None:
+        raise HTTPException(status_code=404, detail="No replay for this generation")
+    replay = Replay(run_id=run_id, generation=generation, **json.loads(data))
+    replay.obstacles = get_course(replay.seed, replay.max_frames).spawns(replay.frames + 1)
+    body = replay.model_dump_json()
+    etag = f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": _REVALIDATE}
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+@router.get("/subscribers", response_model=list[SubscriberStats])
+async def list_subscribers() -> list[SubscriberStats]:
+    """Training-event subscribers with their backlog and delivery lag."""
+    return [SubscriberStats(**s) for s in training_manager.hub.stats()]
+
+
+@router.get("/{run_id}/status", response_model=TrainingRunStatus)
+async def run_status(run_id: str) -> TrainingRunStatus:
+    run = training_manager.get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Unknown training run")
+    return run.status()
+
+
+@router.get("/{run_id}/metrics", response_model=TrainingMetrics)
+async def run_metrics(run_id: str) -> TrainingMetrics:
+    metrics = await training_manager.metrics(run_id)
+    if metrics is None:
+        raise HTTPException(status_code=404, detail="Unknown training run")
+    return metrics
+
+
+@router.post("/{run_id}/pause", response_model=TrainingStartResponse)
+async def pause_training(run_id: str) -> TrainingStartResponse:
+    if not await training_manager.pause(run_id):
+        raise HTTPException(status_code=409, detail="Training run is not running")
+    return TrainingStartResponse(run_id=run_id, status="paused")
+
+
+@router.post("/{run_id}/resume", response_model=TrainingStartResponse)
+async def resume_training(run_id: str) -> TrainingStartResponse:
+    try:
+        run = await training_manager.resume(run_id)
+    except LookupError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return TrainingStartResponse(run_id=run_id, status=run.state)
+
+
+@router.post("/{run_id}/stop")
+async def stop_run(run_id: str) -> dict:
+    if not await training_manager.stop(run_id):
+        raise HTTPException(status_code=400, detail="Training run is not active")
+    return {"status": "stopping"}
+
+
 # ----------------------------------------------------------------------
 
 
-@router.websocket("/ws/training")
-async def training_ws(ws: WebSocket) -> None:
-    await ws.accept()
-    queue = await training_manager.subscribe()
+def _client_name(ws: WebSocket) -> str:
+    return f"ws {ws.client.host}:{ws.client.port}" if ws.client else "ws"
+
+
+async def _stream(ws: WebSocket, sub: Subscription) -> None:
     try:
         while True:
             try:
-                evt = await asyncio.wait_for(queue.get(), timeout=25.0)
-                await ws.send_json(evt)
+                evt = await asyncio.wait_for(sub.get(), timeout=25.0)
+                await ws.send_text(evt.data)  # encoded once, shared by every subscriber
             except asyncio.TimeoutError:
                 # Send keepalive ping
                 await ws.send_json({"type": "ping"})
@@ -63,5 +188,29 @@ async def training_ws(ws: WebSocket) -> None:
         logger.debug("training ws disconnected")
     except Exception as exc:  # pragma: no cover
         logger.exception("training ws error: {}", exc)
+
+
+@router.websocket("/ws/training")
+async def training_ws(ws: WebSocket) -> None:
+    """Events of every run."""
+    await ws.accept()
+    sub = await training_manager.subscribe(name=_client_name(ws))
+    try:
+        await _stream(ws, sub)
+    finally:
+        training_manager.unsubscribe(sub)
+
+
+@router.websocket("/ws/training/{run_id}")
+async def training_run_ws(ws: WebSocket, run_id: str, after: Optional[int] = None) -> None:
+    """Events of one run, replaying its history first (past generation ``after``)."""
+    await ws.accept()
+    try:
+        sub = await training_manager.subscribe(run_id, after=after, name=_client_name(ws))
+    except LookupError:
+        await ws.close(code=4404)
+        return
+    try:
+        await _stream(ws, sub)
     finally:
-        training_manager.unsubscribe(queue)
+        training_manager.unsubscribe(sub)
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -13,7 +13,21 @@ class TrainingStartRequest(BaseModel):
     mutation_rate: float = Field(default=0.8, ge=0.0, le=1.0)
     survival_threshold: float = Field(default=0.2, ge=0.05, le=0.9)
     compatibility_threshold: float = Field(default=3.0, ge=0.5, le=10.0)
+    # neat-python's RNG is process-wide: the seed is applied only when no other
+    # run trains in the same process, and reproducible only while none starts.
     seed: Optional[int] = Field(default=None)
+    # Stop evaluating genomes that can no longer reach the previous generation's
+    # survival cutoff; their fitness is a censored lower bound.
+    racing: bool = False
+    # "steady_state" breeds and replaces genomes continuously instead of in
+    # generational waves; reports still arrive every population_size evaluations.
+    evolution: Literal["generational", "steady_state"] = "generational"
+    # Warm start: saved model ids whose genomes (plus mutated variants) form
+    # the initial population instead of random genomes.
+    source_model_ids: List[str] = Field(default_factory=list, max_length=16)
+    # Share of the worker budget relative to other concurrent runs; higher
+    # priorities also leave the queue first.
+    priority: int = Field(default=1, ge=1, le=10)
     run_name: Optional[str] = Field(default=None, max_length=120)
 
 
@@ -22,15 +36,85 @@ class TrainingStartResponse(BaseModel):
     status: str
 
 
+class SweepSpace(BaseModel):
+    """Candidate values per hyperparameter; bounds as in ``TrainingStartRequest``."""
+
+    population_size: List[int] = Field(default_factory=lambda: [50], min_length=1, max_length=16)
+    survival_threshold: List[float] = Field(default_factory=lambda: [0.2], min_length=1, max_length=16)
+    compatibility_threshold: List[float] = Field(default_factory=lambda: [3.0], min_length=1, max_length=16)
+    mutation_rate: List[float] = Field(default_factory=lambda: [0.8], min_length=1, max_length=16)
+
+
+class SweepRequest(BaseModel):
+    name: Optional[str] = Field(default=None, max_length=80)
+    # "grid" runs every combination of ``space``; "random" draws ``samples`` of them.
+    search: Literal["grid", "random"] = "grid"
+    space: SweepSpace = Field(default_factory=SweepSpace)
+    samples: int = Field(default=8, ge=1, le=64)
+    repeats: int = Field(default=1, ge=1, le=5)  # runs per variant, seeds seed+0..repeats-1
+    # With a seed, trials run one at a time so each has neat-python's RNG to
+    # itself; a run started outside the sweep can still overlap one, see
+    # ``TrainingStartRequest.seed``.
+    seed: Optional[int] = Field(default=None)
+    max_generations: int = Field(default=30, ge=1, le=500)
+    racing: bool = False
+    evolution: Literal["generational", "steady_state"] = "generational"
+    # Median stopping: after ``grace_generations``, stop a run whose best fitness
+    # is below the median of other runs at the same generation.
+    early_stopping: bool = True
+    grace_generations: int = Field(default=5, ge=1, le=500)
+
+
+class SweepVariantResult(BaseModel):
+    rank: int
+    params: dict[str, float]
+    mean_best_fitness: float = 0.0
+    std_best_fitness: float = 0.0
+    trials: int = 0
+    completed: int = 0
+    early_stopped: int = 0
+    best_model_id: Optional[str] = None
+    run_ids: list[str] = Field(default_factory=list)
+    curves: list[list[float]] = Field(default_factory=list)  # best fitness per generation, per repeat
+
+
+class SweepStatus(BaseModel):
+    sweep_id: str
+    name: str
+    status: str  # running|finished|stopped|interrupted|error
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    total_trials: int = 0
+    finished_trials: int = 0
+    best_fitness: float = 0.0
+    best_model_id: Optional[str] = None
+    variants: list[SweepVariantResult] = Field(default_factory=list)  # ranked
+
+
 class TrainingUpdate(BaseModel):
     run_id: str
-    type: Literal["generation", "finished", "stopped", "error", "start"]
-    generation: int = 0
+    type: Literal[
+        "generation", "progress", "finished", "stopped", "error", "start", "queued", "paused", "resumed"
+    ]
+    generation: int = 0  # progress: the generation being evaluated
+    evaluated: int = 0  # progress: genomes with a fitness so far, of population_size
+    frames_simulated: int = 0
     best_fitness: float = 0.0
     mean_fitness: float = 0.0
     species_count: int = 0
     population_size: int = 0
     elapsed_seconds: float = 0.0
+    cache_hit_rate: float = 0.0  # share of the generation served by the fitness cache
+    censored: int = 0  # racing: genomes whose fitness is a lower bound
+    frames_saved: int = 0  # racing: simulated frames skipped
+    worker_idle_seconds: float = 0.0  # evaluation pool capacity left unused
+    load_imbalance: float = 0.0  # evaluation wall time over an even split, minus 1
+    phase_seconds: dict[str, float] = Field(default_factory=dict)  # wall seconds per training phase
+    frames_per_second: float = 0.0  # simulated frames per evaluation second
+    genomes_per_second: float = 0.0
+    worker_utilization: list[float] = Field(default_factory=list)  # busy share per worker process
+    mean_genome_size: float = 0.0  # nodes + enabled connections
+    max_genome_size: int = 0
     best_genome_id: Optional[str] = None
     model_id: Optional[str] = None
     message: Optional[str] = None
@@ -46,6 +130,23 @@ class DecisionResponse(BaseModel):
     outputs: list[float]
 
 
+class BatchDecisionRequest(BaseModel):
+    model_ids: list[str] = Field(min_length=1, max_length=16)
+    sensors: list[list[float]]
+    include_outputs: bool = True
+
+
+class ModelDecisions(BaseModel):
+    model_id: str
+    actions: list[Literal["jump", "duck", "noop"]]
+    outputs: Optional[list[list[float]]] = None
+
+
+class BatchDecisionResponse(BaseModel):
+    rows: int
+    results: list[ModelDecisions]
+
+
 class ModelInfo(BaseModel):
     id: str
     name: str
@@ -73,6 +174,12 @@ class LeaderboardSubmitRequest(BaseModel):
     score: int = Field(ge=0)
     mode: Literal["human", "ai"] = "human"
     model_id: Optional[str] = None
+    # Optional proof of the score: the simulator seed played and the run-length
+    # encoded action log ("<count><j|d|n>" runs), replayed server-side. AI
+    # entries may send just the seed: ``model_id`` is then played on the
+    # headless course of that seed, which is not the browser's course.
+    seed: Optional[int] = Field(default=None, ge=0, le=2**32 - 1)
+    actions: Optional[str] = Field(default=None, max_length=65536)
 
 
 class LeaderboardEntryOut(BaseModel):
@@ -82,12 +189,89 @@ class LeaderboardEntryOut(BaseModel):
     mode: str
     model_id: Optional[str]
     created_at: datetime
+    verification: Optional[str] = None  # pending|verified|rejected; None without a replay log
 
     model_config = {"from_attributes": True}
 
 
+class VerificationStatus(BaseModel):
+    entry_id: int
+    status: Literal["pending", "verified", "rejected"]
+    score: int  # claimed
+    verified_score: Optional[int] = None  # the replay's score
+    note: Optional[str] = None  # why it was rejected
+    verified_at: Optional[datetime] = None
+
+
+class TrainingRunStatus(BaseModel):
+    run_id: str
+    state: Literal["queued", "running", "paused", "finished", "stopped", "error"]
+    priority: int = 1
+    workers: int = 0  # current share of the worker budget
+    generation: int = 0
+    max_generations: int = 0
+    best_fitness: float = 0.0
+    run_name: Optional[str] = None
+
+
+class TrainingMetrics(BaseModel):
+    """Performance summary of a run, accumulated over its generations."""
+
+    generations: int = 0
+    phase_seconds: dict[str, float] = Field(default_factory=dict)  # totals per phase
+    frames_per_second: float = 0.0  # means over generations
+    genomes_per_second: float = 0.0
+    worker_utilization: float = 0.0
+    mean_genome_size: float = 0.0  # latest generation
+    max_genome_size: int = 0  # largest seen
+
+
+class GenerationPage(BaseModel):
+    run_id: str
+    items: list[TrainingUpdate]  # generation events, in order
+    next_cursor: Optional[int] = None  # pass as ``after`` for the next page; None at the end
+
+
+class ReplayInfo(BaseModel):
+    generation: int
+    frames: int
+    fitness: float
+
+
+class Replay(BaseModel):
+    """A generation champion's episode, rebuilt client-side from seed and actions."""
+
+    run_id: str
+    generation: int
+    seed: int
+    max_frames: int
+    actions: str  # run-length encoded: "<count><j|d|n>" runs, one action per step
+    frames: int
+    fitness: float
+    # (frame, kind, y, width, height) per obstacle spawn: the seeded world,
+    # for clients whose RNG differs from the simulator's
+    obstacles: list[tuple[int, str, float, float, float]] = Field(default_factory=list)
+
+
+class SubscriberStats(BaseModel):
+    """Delivery state of one training-event subscriber."""
+
+    id: int
+    name: str = ""
+    run_id: Optional[str] = None  # None: subscribed to every run
+    connected_seconds: float = 0.0
+    pending: int = 0
+    delivered: int = 0
+    coalesced: int = 0  # generation ticks replaced by a newer one before delivery
+    dropped: int = 0
+    last_lag_ms: float = 0.0  # publish to dequeue
+    mean_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+
+
 class TrainingStatusResponse(BaseModel):
     active: bool
-    run_id: Optional[str] = None
+    run_id: Optional[str] = None  # most recently started active run
     generation: int = 0
     best_fitness: float = 0.0
+    runs: list[TrainingRunStatus] = Field(default_factory=list)
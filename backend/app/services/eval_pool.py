@@ -0,0 +1,189 @@
+"""Long-lived multiprocessing pool for genome evaluation.
+
+Started once in ``main.lifespan`` and shared by every training run, so short
+runs do not pay for process spawn and re-importing neat/numpy. Workers warm
+the evaluation courses and the base NEAT config in their initializer and are
+recycled after ``max_tasks_per_child`` chunks to bound memory. A pool with
+tasks in flight is never pinged or restarted: a ping would queue behind them,
+and a restart would lose them. A task still unanswered after
+``TASK_TIMEOUT_SECONDS`` (its worker died) no longer counts as in flight; the
+next ``ensure_healthy`` restarts the pool. Tasks lost that way, or with a
+pool closed or replaced under them, fail through their ``error_callback``.
+"""
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from multiprocessing.pool import Pool
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from ..config import get_settings
+from ..neat.config_registry import get_config
+from ..neat.trainer import EVAL_MAX_FRAMES, EVAL_SEEDS, RESULT_TIMEOUT_SECONDS
+from ..simulator import _stacked_courses, get_course
+
+
+def _init_worker(config_path: str, seeds: Sequence[int], max_frames: int) -> None:
+    # Runs once per worker process; everything here is lru-cached module state.
+    get_config(path=Path(config_path))
+    for seed in seeds:
+        get_course(seed, max_frames)
+    _stacked_courses(tuple(seeds), max_frames)
+
+
+class EvaluationPool:
+    """A warm ``multiprocessing.Pool`` with health checks and restarts."""
+
+    HEALTH_TIMEOUT_SECONDS = 5.0
+    # Runs give up on a result after this long, so the task is lost by then.
+    TASK_TIMEOUT_SECONDS = RESULT_TIMEOUT_SECONDS
+
+    def __init__(self, workers: int, max_tasks_per_child: Optional[int] = None) -> None:
+        self.workers = workers
+        self.max_tasks_per_child = max_tasks_per_child or None
+        self._pool: Optional[Pool] = None
+        self._lock = threading.Lock()
+        self.started_at: Optional[float] = None
+        self.restarts = 0
+        self.tasks = 0
+        # task id -> (deadline, error callback), until the task completes or is abandoned
+        self._outstanding: Dict[int, Tuple[float, Callable[[BaseException], None]]] = {}
+        self._task_ids = itertools.count()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 1 and sys.platform != "win32"
+
+    @property
+    def running(self) -> bool:
+        return self._pool is not None
+
+    @property
+    def busy(self) -> bool:
+        """Tasks are in flight and not yet past their deadline."""
+        now = time.monotonic()
+        return any(deadline > now for deadline, _ in list(self._outstanding.values()))
+
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if not self.enabled or self._pool is not None:
+            return
+        t0 = time.perf_counter()
+        self._pool = multiprocessing.Pool(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(str(get_settings().neat_config_path), EVAL_SEEDS, EVAL_MAX_FRAMES),
+            maxtasksperchild=self.max_tasks_per_child,
+        )
+        self.started_at = time.time()
+        logger.info(
+            "Evaluation pool started with {} workers in {:.2f}s",
+            self.workers,
+            time.perf_counter() - t0,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        self._abandon("Evaluation pool was closed")
+        pool.close()
+        # join() has no timeout; give workers a bounded grace period.
+        joiner = threading.Thread(target=pool.join, daemon=True)
+        joiner.start()
+        joiner.join(self.HEALTH_TIMEOUT_SECONDS)
+        if joiner.is_alive():
+            logger.warning("Evaluation pool did not drain; terminating workers")
+            pool.terminate()
+        logger.info("Evaluation pool stopped")
+
+    def healthy(self) -> bool:
+        """Round-trip a trivial task through the pool."""
+        pool = self._pool
+        if pool is None:
+            return False
+        try:
+            pool.apply_async(os.getpid).get(self.HEALTH_TIMEOUT_SECONDS)
+            return True
+        except Exception as exc:
+            logger.warning("Evaluation pool health check failed: {}", exc)
+            return False
+
+    def ensure_healthy(self) -> bool:
+        """Start or restart the pool if needed; False when parallelism is disabled."""
+        if not self.enabled:
+            return False
+        if self._pool is not None and self.busy:
+            return True
+        if self._pool is not None and not self._outstanding and self.healthy():
+            return True
+        if self._pool is not None:
+            if self._outstanding:
+                logger.warning("{} evaluation tasks were lost; restarting the pool", len(self._outstanding))
+            self.restarts += 1
+            with self._lock:
+                pool, self._pool = self._pool, None
+            pool.terminate()
+            self._abandon("Evaluation pool was restarted")
+        self.start()
+        return True
+
+    def _abandon(self, reason: str) -> None:
+        """Fail every task still in flight; their results will never arrive."""
+        with self._lock:
+            failures, self._outstanding = list(self._outstanding.values()), {}
+        for _, fail in failures:
+            fail(RuntimeError(reason))
+
+    # ------------------------------------------------------------------
+    def apply_async(self, fn: Callable, args: tuple, callback=None, error_callback=None):
+        """Run one task; ``callback``/``error_callback`` fire on the pool's result thread."""
+        if self._pool is None:
+            raise RuntimeError("Evaluation pool is not running")
+        task_id = next(self._task_ids)
+
+        # Whichever of completion and ``_abandon`` claims the task first reports it.
+        def finish(result) -> None:
+            if self._outstanding.pop(task_id, None) is not None and callback is not None:
+                callback(result)
+
+        def fail(exc: BaseException) -> None:
+            entry = self._outstanding.pop(task_id, None)
+            if entry is not None:
+                entry[1](exc)
+
+        with self._lock:
+            self._outstanding[task_id] = (
+                time.monotonic() + self.TASK_TIMEOUT_SECONDS,
+                error_callback or (lambda exc: None),
+            )
+        self.tasks += 1
+        return self._pool.apply_async(fn, args, callback=finish, error_callback=fail)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "workers": self.workers,
+            "max_tasks_per_child": self.max_tasks_per_child,
+            "tasks": self.tasks,
+            "in_flight": len(self._outstanding),
+            "restarts": self.restarts,
+            "uptime_seconds": round(time.time() - self.started_at, 1)
+            if self._pool is not None and self.started_at
+            else 0.0,
+        }
+
+
+eval_pool = EvaluationPool(
+    workers=get_settings().resolve_workers(),
+    max_tasks_per_child=get_settings().eval_pool_max_tasks_per_child,
+)
@@ -0,0 +1,213 @@
+"""Fan-out of training events to many subscribers.
+
+Each ``TrainingUpdate`` is serialized once into an ``Event``; every
+subscriber queues a reference to the same encoded text, so WebSocket
+handlers send it as-is. Subscribers that fall behind get latest-value
+coalescing for ticks (generation and progress events): once a backlog
+builds up, a tick replaces the run's newest undelivered event when that is
+a tick of the same type. Terminal events (finished/stopped/error) are never
+coalesced or dropped. Nobody is disconnected for being slow.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from ..schemas import TrainingUpdate
+
+TERMINAL_EVENTS = frozenset({"finished", "stopped", "error"})
+TICK_EVENTS = frozenset({"generation", "progress"})
+
+
+@dataclass(frozen=True)
+class Event:
+    update: TrainingUpdate
+    data: str  # JSON text, shared by every subscriber
+    published_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def encode(cls, update: TrainingUpdate) -> "Event":
+        return cls(update, update.model_dump_json())
+
+    @classmethod
+    def decode(cls, data: str) -> "Event":
+        """A stored event; published at time 0 so replaying it adds no lag."""
+        return cls(TrainingUpdate.model_validate_json(data), data, published_at=0.0)
+
+    @property
+    def type(self) -> str:
+        return self.update.type
+
+    @property
+    def run_id(self) -> str:
+        return self.update.run_id
+
+
+class Subscription:
+    """One consumer's pending events plus its delivery and lag counters.
+
+    ``coalesce_after`` pending events switch ticks to latest-value delivery;
+    past ``max_pending`` the oldest non-terminal events are dropped.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(
+        self,
+        topic: Optional[str],
+        *,
+        name: str = "",
+        coalesce: bool = True,
+        coalesce_after: int = 32,
+        max_pending: int = 1024,
+    ) -> None:
+        self.id = next(self._ids)
+        self.topic = topic
+        self.name = name
+        self.coalesce = coalesce
+        self.coalesce_after = coalesce_after
+        self.max_pending = max_pending
+        self.created_at = time.monotonic()
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._lag_total = 0.0
+        self._lagged = 0
+        # Slots are one-element lists so a queued tick can be replaced in place.
+        self._pending: deque[list] = deque()
+        # run id -> its newest pending event, when that event is a tick
+        self._tick_slots: Dict[str, list] = {}
+        self._ready = asyncio.Event()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def offer(self, event: Event, coalesce: bool = True) -> None:
+        if event.type in TICK_EVENTS:
+            slot = self._tick_slots.get(event.run_id)
+            if (
+                slot is not None
+                and slot[0].type == event.type
+                and coalesce
+                and self.coalesce
+                and len(self._pending) >= self.coalesce_after
+            ):
+                slot[0] = event
+                self.coalesced += 1
+                return
+            slot = [event]
+            self._tick_slots[event.run_id] = slot
+        else:
+            # Later ticks must not overtake this event.
+            self._tick_slots.pop(event.run_id, None)
+            slot = [event]
+        self._pending.append(slot)
+        if len(self._pending) > self.max_pending:
+            self._drop_oldest()
+        self._ready.set()
+
+    def _drop_oldest(self) -> None:
+        for i, slot in enumerate(self._pending):
+            if slot[0].type not in TERMINAL_EVENTS:
+                del self._pending[i]
+                if self._tick_slots.get(slot[0].run_id) is slot:
+                    del self._tick_slots[slot[0].run_id]
+                self.dropped += 1
+                return
+
+    def prepend(self, events: Iterable[Event]) -> None:
+        """Queue ``events`` ahead of everything pending (replayed history)."""
+        self._pending.extendleft([event] for event in reversed(list(events)))
+        if self._pending:
+            self._ready.set()
+
+    def get_nowait(self) -> Event:
+        if not self._pending:
+            raise asyncio.QueueEmpty
+        slot = self._pending.popleft()
+        event = slot[0]
+        if self._tick_slots.get(event.run_id) is slot:
+            del self._tick_slots[event.run_id]
+        self.delivered += 1
+        if event.published_at >= self.created_at:  # replayed history has no lag to speak of
+            lag = time.monotonic() - event.published_at
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self._lag_total += lag
+            self._lagged += 1
+        return event
+
+    async def get(self) -> Event:
+        while not self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+        return self.get_nowait()
+
+    def stats(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "run_id": self.topic,
+            "connected_seconds": time.monotonic() - self.created_at,
+            "pending": len(self._pending),
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "last_lag_ms": self.last_lag * 1000.0,
+            "mean_lag_ms": self._lag_total / self._lagged * 1000.0 if self._lagged else 0.0,
+            "max_lag_ms": self.max_lag * 1000.0,
+        }
+
+
+class FanoutHub:
+    """Subscriptions by topic: a run id, or ``None`` for every run."""
+
+    def __init__(self, coalesce_after: int = 32, max_pending: int = 1024) -> None:
+        self.coalesce_after = coalesce_after
+        self.max_pending = max_pending
+        self._topics: Dict[Optional[str], set[Subscription]] = {}
+
+    def subscribe(
+        self,
+        topic: Optional[str],
+        replay: Iterable[Event] = (),
+        *,
+        name: str = "",
+        coalesce: bool = True,
+    ) -> Subscription:
+        sub = Subscription(
+            topic,
+            name=name,
+            coalesce=coalesce,
+            coalesce_after=self.coalesce_after,
+            max_pending=self.max_pending,
+        )
+        for event in replay:
+            sub.offer(event, coalesce=False)  # history is replayed in full
+        self._topics.setdefault(topic, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._topics.get(sub.topic)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del self._topics[sub.topic]
+
+    def publish(self, event: Event) -> None:
+        for topic in (event.run_id, None):
+            for sub in self._topics.get(topic, ()):
+                sub.offer(event)
+
+    def subscriptions(self) -> List[Subscription]:
+        return [sub for subs in self._topics.values() for sub in subs]
+
+    def stats(self) -> List[dict]:
+        return [sub.stats() for sub in self.subscriptions()]
@@ -0,0 +1,235 @@
+"""Per-generation training history in the ``generation_stats`` table.
+
+Generation events are queued in memory and group-committed, together with
+the latest ``TrainingRun`` progress columns, every ``batch_size`` rows or
+``flush_interval`` seconds after the first queued row, whichever comes first. Reads
+flush first, so they always see every generation reported so far. Each row
+also keeps the generation champion's ``Recording``, when the trainer made one.
+
+A batch that fails to commit is written again row by row. Only a row the
+database rejects (say, a duplicate generation) is dropped; rows and run
+updates that failed for any other reason are queued again and retried with
+exponential backoff.
+"""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from ..config import get_settings
+from ..db import AsyncSessionLocal
+from ..models_db import GenerationStat, TrainingRun
+from ..schemas import TrainingUpdate
+from ..simulator import Recording
+from .fanout import Event
+
+
+class GenerationHistory:
+    MAX_RETRY_SECONDS = 60.0
+
+    def __init__(self, batch_size: int = 10, flush_interval: float = 2.0) -> None:
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._rows: List[dict] = []
+        self._runs: Dict[str, dict] = {}  # run id -> TrainingRun values to update
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._retry_delay = 0.0  # seconds before the next retry; 0 while writes succeed
+        self.flushes = 0
+        self.rows_written = 0
+        self.rows_dropped = 0
+        self.retries = 0
+        self.flush_seconds_total = 0.0
+
+    @property
+    def pending(self) -> int:
+        return len(self._rows)
+
+    def add(self, event: Event, replay: Optional[Recording] = None, **run_values) -> None:
+        """Queue a generation event, its replay and the run's new progress columns."""
+        update = event.update
+        self._rows.append(
+            {
+                "run_id": update.run_id,
+                "generation": update.generation,
+                "best_fitness": update.best_fitness,
+                "mean_fitness": update.mean_fitness,
+                "species_count": update.species_count,
+                "elapsed_seconds": update.elapsed_seconds,
+                "created_at": datetime.utcnow(),
+                "update_json": event.data,
+                "replay_json": json.dumps(dataclasses.asdict(replay)) if replay is not None else None,
+            }
+        )
+        if run_values:
+            self._runs.setdefault(update.run_id, {}).update(run_values)
+        if len(self._rows) >= self.batch_size and not self._retry_delay:
+            self._flush_soon()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self._flush_soon)
+
+    def _flush_soon(self) -> None:
+        task = asyncio.create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        """Write everything queued so far in one transaction."""
+        async with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            rows, runs = self._rows, self._runs
+            self._rows, self._runs = [], {}
+            if not rows and not runs:
+                return
+            t0 = time.perf_counter()
+            try:
+                async with AsyncSessionLocal() as session:
+                    if rows:
+                        await session.execute(insert(GenerationStat), rows)
+                    for run_id, values in runs.items():
+                        await session.execute(
+                            update(TrainingRun).where(TrainingRun.id == run_id).values(**values)
+                        )
+                    await session.commit()
+            except Exception as exc:
+                logger.warning("Writing {} generation row(s) failed ({}); writing them one by one", len(rows), exc)
+                await self._write_each(rows, runs)
+                return
+            self._retry_delay = 0.0
+            self.flushes += 1
+            self.rows_written += len(rows)
+            self.flush_seconds_total += time.perf_counter() - t0
+
+    async def _write_each(self, rows: List[dict], runs: Dict[str, dict]) -> None:
+        """Fallback for a failed batch: one transaction per row and per run."""
+        retry_rows: List[dict] = []
+        retry_runs: Dict[str, dict] = {}
+        for row in rows:
+            try:
+                async with AsyncSessionLocal() as session:
+                    await session.execute(insert(GenerationStat), [row])
+                    await session.commit()
+                self.rows_written += 1
+            except IntegrityError as exc:
+                self.rows_dropped += 1
+                logger.error(
+                    "Dropped generation {} of run {}: {}", row["generation"], row["run_id"], exc.orig
+                )
+            except Exception:
+                retry_rows.append(row)
+        for run_id, values in runs.items():
+            try:
+                async with AsyncSessionLocal() as session:
+                    await session.execute(update(TrainingRun).where(TrainingRun.id == run_id).values(**values))
+                    await session.commit()
+            except Exception:
+                retry_runs[run_id] = values
+        if not retry_rows and not retry_runs:
+            self._retry_delay = 0.0
+            return
+
+        # Queue them again ahead of anything added meanwhile; newer run values win.
+        self._rows = retry_rows + self._rows
+        for run_id, values in retry_runs.items():
+            self._runs[run_id] = {**values, **self._runs.get(run_id, {})}
+        self.retries += 1
+        self._retry_delay = min(self.MAX_RETRY_SECONDS, max(self.flush_interval, 2 * self._retry_delay))
+        logger.warning(
+            "{} generation row(s) could not be written; retrying in {:.0f}s", len(retry_rows), self._retry_delay
+        )
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_later(self._retry_delay, self._flush_soon)
+
+    async def discard_after(self, run_id: str, generation: int) -> None:
+        """Forget generations past ``generation``, which a resumed run will report again."""
+        await self.flush()
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                delete(GenerationStat).where(
+                    GenerationStat.run_id == run_id, GenerationStat.generation > generation
+                )
+            )
+            await session.commit()
+
+    async def _fetch(
+        self,
+        run_id: str,
+        after: Optional[int] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        await self.flush()
+        query = select(GenerationStat.update_json).where(GenerationStat.run_id == run_id)
+        if after is not None:
+            query = query.where(GenerationStat.generation > after)
+        if start is not None:
+            query = query.where(GenerationStat.generation >= start)
+        if end is not None:
+            query = query.where(GenerationStat.generation <= end)
+        query = query.order_by(GenerationStat.generation).limit(limit)
+        async with AsyncSessionLocal() as session:
+            return list((await session.execute(query)).scalars().all())
+
+    async def page(
+        self,
+        run_id: str,
+        after: Optional[int] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[TrainingUpdate]:
+        """Generation events in order: past the ``after`` cursor, within ``[start, end]``."""
+        rows = await self._fetch(run_id, after, start, end, limit)
+        return [TrainingUpdate.model_validate_json(data) for data in rows]
+
+    async def events(self, run_id: str, after: Optional[int], through: int) -> List[Event]:
+        """Stored generation events ``(after, through]``, still encoded, for replay."""
+        return [Event.decode(data) for data in await self._fetch(run_id, after, end=through)]
+
+    async def replay(self, run_id: str, generation: int) -> Optional[str]:
+        """The stored ``Recording`` JSON of one generation, if it has one."""
+        await self.flush()
+        query = select(GenerationStat.replay_json).where(
+            GenerationStat.run_id == run_id, GenerationStat.generation == generation
+        )
+        async with AsyncSessionLocal() as session:
+            return (await session.execute(query)).scalar_one_or_none()
+
+    async def replays(self, run_id: str) -> List[Tuple[int, str]]:
+        """``(generation, Recording JSON)`` of every recorded generation, in order."""
+        await self.flush()
+        query = (
+            select(GenerationStat.generation, GenerationStat.replay_json)
+            .where(GenerationStat.run_id == run_id, GenerationStat.replay_json.is_not(None))
+            .order_by(GenerationStat.generation)
+        )
+        async with AsyncSessionLocal() as session:
+            return [tuple(row) for row in (await session.execute(query)).all()]
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._rows),
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "rows_dropped": self.rows_dropped,
+            "retries": self.retries,
+            "mean_flush_ms": self.flush_seconds_total / self.flushes * 1000.0 if self.flushes else 0.0,
+        }
+
+
+generation_history = GenerationHistory(
+    get_settings().generation_stats_batch, get_settings().generation_stats_flush_seconds
+)
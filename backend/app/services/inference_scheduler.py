@@ -0,0 +1,121 @@
+"""Cross-connection micro-batching of autopilot decisions.
+
+Every /ws/play connection asks for one decision per frame. Instead of running
+each tiny activation on its own, requests are parked for a short window,
+grouped by net, and each group runs as one batched activation. Grouping is by
+net object rather than model id, so a connection still holding the net of a
+re-uploaded model is answered by that net. Malformed sensor rows are rejected
+before they are queued; if a batch fails anyway, its rows are decided one by
+one so only the failing request sees the error.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from .. import physics as P
+from ..config import get_settings
+from ..neat.inference import decide, decide_batch
+
+# Upper bounds of the batch-size histogram buckets; the last bucket is open.
+_BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+@dataclass
+class _Pending:
+    model_id: str
+    net: object
+    sensors: Sequence[float]
+    future: asyncio.Future
+    enqueued: float
+
+
+class InferenceScheduler:
+    """Collects decisions for ``window_seconds`` and flushes them per net."""
+
+    def __init__(self, window_seconds: float) -> None:
+        self.window_seconds = window_seconds
+        self._pending: dict[int, List[_Pending]] = {}  # id(net) -> requests
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self.batches = 0
+        self.decisions = 0
+        self.max_batch = 0
+        self.batch_histogram = [0] * (len(_BATCH_BUCKETS) + 1)
+        self.queue_seconds_total = 0.0
+        self.queue_seconds_max = 0.0
+
+    async def decide(self, model_id: str, net: object, sensors: Sequence[float]) -> Tuple[str, List[float]]:
+        if len(sensors) != P.NUM_INPUTS:
+            raise ValueError(f"expected {P.NUM_INPUTS} sensors, got {len(sensors)}")
+        if self.window_seconds <= 0:
+            return decide(net, sensors)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        # Queued nets stay referenced, so their ids cannot be reused meanwhile.
+        self._pending.setdefault(id(net), []).append(
+            _Pending(model_id, net, sensors, future, enqueued=time.perf_counter())
+        )
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        now = time.perf_counter()
+        for items in pending.values():
+            try:
+                idx, outputs = decide_batch(items[0].net, np.array([p.sensors for p in items], dtype=np.float64))
+                results = [(P.ACTIONS[i], out) for i, out in zip(idx.tolist(), outputs.tolist())]
+            except Exception as exc:
+                logger.warning(
+                    "Batched decision for {} failed ({}); deciding rows one by one", items[0].model_id, exc
+                )
+                results = []
+                for p in items:
+                    try:
+                        results.append(decide(p.net, p.sensors))
+                    except Exception as row_exc:
+                        results.append(row_exc)
+            for p, result in zip(items, results):
+                if not p.future.done():  # connection may have gone away
+                    if isinstance(result, Exception):
+                        p.future.set_exception(result)
+                    else:
+                        p.future.set_result(result)
+                waited = now - p.enqueued
+                self.queue_seconds_total += waited
+                self.queue_seconds_max = max(self.queue_seconds_max, waited)
+            self._record_batch(len(items))
+
+    def _record_batch(self, size: int) -> None:
+        self.batches += 1
+        self.decisions += size
+        self.max_batch = max(self.max_batch, size)
+        for i, bound in enumerate(_BATCH_BUCKETS):
+            if size <= bound:
+                self.batch_histogram[i] += 1
+                break
+        else:
+            self.batch_histogram[-1] += 1
+
+    def stats(self) -> dict:
+        labels = [f"<={b}" for b in _BATCH_BUCKETS] + [f">{_BATCH_BUCKETS[-1]}"]
+        return {
+            "window_ms": self.window_seconds * 1000.0,
+            "batches": self.batches,
+            "decisions": self.decisions,
+            "mean_batch_size": self.decisions / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch,
+            "batch_size_histogram": dict(zip(labels, self.batch_histogram)),
+            "mean_queue_ms": 1000.0 * self.queue_seconds_total / self.decisions if self.decisions else 0.0,
+            "max_queue_ms": 1000.0 * self.queue_seconds_max,
+        }
+
+
+inference_scheduler = InferenceScheduler(get_settings().inference_batch_window_ms / 1000.0)
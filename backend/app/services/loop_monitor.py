@@ -0,0 +1,72 @@
+"""Event-loop lag monitor.
+
+A background task sleeps for a fixed interval and records how late it wakes
+up. Anything that blocks the loop (a CPU-bound call, a thread holding the
+GIL) shows up as lag, which bounds the extra latency every request and
+WebSocket frame served by the loop saw at that moment.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+from ..config import get_settings
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float = 0.05, window: int = 1200) -> None:
+        self.interval = interval
+        self._lags: deque[float] = deque(maxlen=window)  # seconds, most recent window
+        self._task: Optional[asyncio.Task] = None
+        self.samples = 0
+        self.max_lag = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.interval > 0 and not self.running:
+            self._task = asyncio.create_task(self._sample())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def reset(self) -> None:
+        self._lags.clear()
+        self.samples = 0
+        self.max_lag = 0.0
+
+    async def _sample(self) -> None:
+        while True:
+            t0 = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - t0 - self.interval)
+            self._lags.append(lag)
+            self.samples += 1
+            self.max_lag = max(self.max_lag, lag)
+
+    def stats(self) -> dict:
+        lags = np.fromiter(self._lags, dtype=np.float64)
+        p50, p99 = np.percentile(lags, [50, 99]) * 1000.0 if lags.size else (0.0, 0.0)
+        return {
+            "running": self.running,
+            "interval_ms": self.interval * 1000.0,
+            "samples": self.samples,
+            "p50_ms": float(p50),
+            "p99_ms": float(p99),
+            "max_ms": self.max_lag * 1000.0,
+        }
+
+
+loop_monitor = LoopLagMonitor(get_settings().loop_lag_interval_ms / 1000.0)
@@ -6,10 +6,10 @@ import pickle
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from loguru import logger
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import get_settings
@@ -26,10 +26,19 @@ class ModelStore:
         self.settings = get_settings()
         self.models_dir: Path = self.settings.models_dir
         self.models_dir.mkdir(parents=True, exist_ok=True)
+        self._listeners: list[Callable[[str], None]] = []
 
     def path_for(self, model_id: str) -> Path:
         return self.models_dir / f"{model_id}.pkl"
 
+    def on_change(self, listener: Callable[[str], None]) -> None:
+        """Register ``listener(model_id)``, called whenever a model file is written or deleted."""
+        self._listeners.append(listener)
+
+    def _notify(self, model_id: str) -> None:
+        for listener in self._listeners:
+            listener(model_id)
+
     # ------------------------------------------------------------------
     async def save_genome(
         self,
@@ -45,6 +54,7 @@ class ModelStore:
         path = self.path_for(model_id)
         blob = pickle.dumps(genome)
         path.write_bytes(blob)
+        self._notify(model_id)
 
         num_nodes = len(getattr(genome, "nodes", {}) or {})
         num_conn = sum(1 for c in (getattr(genome, "connections", {}) or {}).values() if getattr(c, "enabled", True))
@@ -83,6 +93,7 @@ class ModelStore:
             raise ValueError("Uploaded object is not a NEAT genome")
         model_id = str(uuid.uuid4())
         self.path_for(model_id).write_bytes(raw_bytes)
+        self._notify(model_id)
 
         num_nodes = len(genome.nodes)
         num_conn = sum(1 for c in genome.connections.values() if getattr(c, "enabled", True))
@@ -106,6 +117,24 @@ class ModelStore:
         res = await session.execute(select(Model).order_by(Model.created_at.desc()))
         return list(res.scalars().all())
 
+    async def top_model_ids(self, session: AsyncSession, n: int, by: str = "fitness") -> list[str]:
+        """Ids of the best (``by="fitness"``) or most recently played (``by="recent"``) models.
+
+        Models never played rank after played ones, newest first.
+        """
+        if by == "recent":
+            order = (Model.last_played_at.desc().nulls_last(), Model.created_at.desc())
+        else:
+            order = (Model.fitness.desc(),)
+        res = await session.execute(select(Model.id).order_by(*order).limit(n))
+        return list(res.scalars().all())
+
+    async def mark_played(self, session: AsyncSession, model_id: str) -> None:
+        await session.execute(
+            update(Model).where(Model.id == model_id).values(last_played_at=datetime.utcnow())
+        )
+        await session.commit()
+
     async def get(self, session: AsyncSession, model_id: str) -> Optional[Model]:
         res = await session.execute(select(Model).where(Model.id == model_id))
         return res.scalar_one_or_none()
@@ -117,6 +146,7 @@ class ModelStore:
         path = self.path_for(model_id)
         if path.exists():
             path.unlink()
+        self._notify(model_id)
         await session.execute(delete(Model).where(Model.id == model_id))
         await session.commit()
         return True
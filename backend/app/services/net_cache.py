@@ -0,0 +1,136 @@
+"""Bounded LRU cache of compiled nets for the inference endpoints.
+
+Entries are keyed by the sha256 of the model file, so identical uploads share
+one compiled net and a rewritten file can never serve a stale one. The cache
+is bounded by entry count and by estimated bytes, and listens to
+``model_store`` so deletes and writes invalidate automatically.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from loguru import logger
+
+from ..config import get_settings
+from ..db import AsyncSessionLocal
+from ..neat.compiled import CompiledNet
+from ..neat.config_registry import get_config
+from ..neat.inference import build_net
+from .model_store import model_store
+
+# Rough per-entry cost of the Python objects around the NumPy arrays.
+_ENTRY_OVERHEAD_BYTES = 1024
+
+
+@dataclass
+class _Entry:
+    net: CompiledNet
+    nbytes: int
+    model_ids: set[str] = field(default_factory=set)
+
+
+class NetCache:
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()  # sha256 -> entry
+        self._by_model: dict[str, str] = {}  # model_id -> sha256
+        self._bytes = 0
+        self._lock = threading.Lock()  # warmup runs in a worker thread
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        model_store.on_change(self.invalidate)
+
+    # ------------------------------------------------------------------
+    def get(self, model_id: str) -> CompiledNet:
+        """Return the compiled net for ``model_id``; raises FileNotFoundError."""
+        with self._lock:
+            sha = self._by_model.get(model_id)
+            if sha is not None and sha in self._entries:
+                self._entries.move_to_end(sha)
+                self.hits += 1
+                return self._entries[sha].net
+            self.misses += 1
+
+        raw = model_store.path_for(model_id).read_bytes()
+        sha = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            entry = self._entries.get(sha)
+        if entry is None:
+            net = build_net(pickle.loads(raw), get_config())
+            entry = _Entry(net=net, nbytes=net.nbytes + _ENTRY_OVERHEAD_BYTES)
+        with self._lock:
+            if sha not in self._entries:
+                self._entries[sha] = entry
+                self._bytes += entry.nbytes
+            self._entries.move_to_end(sha)
+            entry.model_ids.add(model_id)
+            self._by_model[model_id] = sha
+            self._evict()
+        return entry.net
+
+    def invalidate(self, model_id: str) -> None:
+        with self._lock:
+            sha = self._by_model.pop(model_id, None)
+            entry = self._entries.get(sha) if sha else None
+            if entry is None:
+                return
+            entry.model_ids.discard(model_id)
+            if not entry.model_ids:
+                del self._entries[sha]
+                self._bytes -= entry.nbytes
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.nbytes
+            for mid in entry.model_ids:
+                self._by_model.pop(mid, None)
+            self.evictions += 1
+
+    # ------------------------------------------------------------------
+    async def warmup(self, count: int, by: str = "fitness") -> int:
+        """Preload the top ``count`` models; returns how many were loaded."""
+        if count <= 0:
+            return 0
+        async with AsyncSessionLocal() as session:
+            model_ids = await model_store.top_model_ids(session, count, by=by)
+        loaded = 0
+        for model_id in model_ids:
+            try:
+                await asyncio.to_thread(self.get, model_id)
+                loaded += 1
+            except Exception as exc:
+                logger.warning("Net cache warmup skipped {}: {}", model_id, exc)
+        # Warmup loads are not player traffic.
+        with self._lock:
+            self.misses -= loaded
+        return loaded
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "models": len(self._by_model),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+net_cache = NetCache(
+    max_entries=get_settings().net_cache_max_entries,
+    max_bytes=get_settings().net_cache_max_bytes,
+)
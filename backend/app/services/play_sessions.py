@@ -0,0 +1,70 @@
+"""Per-connection frame-rate accounting for the /ws/play autopilot stream."""
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class PlaySession:
+    model_id: str
+    protocol: str  # "json" | subprotocol name
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    started_at: float = field(default_factory=time.monotonic)
+    frames: int = 0
+    frames_skipped: int = 0  # gaps in the client's frame counter (binary only)
+    fps: float = 0.0
+    _last_frame_no: Optional[int] = field(default=None, init=False, repr=False)
+    _window_start: float = field(default_factory=time.monotonic, init=False, repr=False)
+    _window_frames: int = field(default=0, init=False, repr=False)
+
+    # Frames/s is recomputed once per window so the hot path stays a counter bump.
+    WINDOW_SECONDS = 1.0
+
+    def record_frame(self, frame_no: Optional[int] = None) -> None:
+        self.frames += 1
+        self._window_frames += 1
+        if frame_no is not None:
+            if self._last_frame_no is not None and frame_no > self._last_frame_no + 1:
+                self.frames_skipped += frame_no - self._last_frame_no - 1
+            self._last_frame_no = frame_no
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed >= self.WINDOW_SECONDS:
+            self.fps = self._window_frames / elapsed
+            self._window_start = now
+            self._window_frames = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "id": self.id,
+            "model_id": self.model_id,
+            "protocol": self.protocol,
+            "frames": self.frames,
+            "frames_skipped": self.frames_skipped,
+            "fps": round(self.fps, 2),
+            "age_seconds": round(time.monotonic() - self.started_at, 2),
+        }
+
+
+class PlaySessionRegistry:
+    """Live /ws/play connections, for the inference stats endpoint."""
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, PlaySession] = {}
+
+    def open(self, model_id: str, protocol: str) -> PlaySession:
+        session = PlaySession(model_id=model_id, protocol=protocol)
+        self._sessions[session.id] = session
+        return session
+
+    def close(self, session: PlaySession) -> None:
+        self._sessions.pop(session.id, None)
+
+    def snapshot(self) -> list[dict]:
+        return [s.snapshot() for s in self._sessions.values()]
+
+
+play_sessions = PlaySessionRegistry()
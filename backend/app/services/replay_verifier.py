@@ -0,0 +1,266 @@
+"""Background verification of leaderboard scores by replaying action logs.
+
+A submission carrying a seed and a run-length-encoded action log (see
+``simulator.encode_actions``) is queued here instead of being trusted. Queued
+logs are replayed in batches in a worker process: every log of a seed steps
+through one ``BatchDinoSimulator`` in lockstep, so a batch replays whole
+episodes far faster than real time.
+
+An AI submission may carry its ``model_id`` and a seed without a log; the
+model is then played on the headless course of that seed and must reach the
+claimed score there. The browser draws its obstacles with its own RNG, so a
+browser game is never replayed as such: an AI entry is verified when its
+model earns the score on the server's course, and a human entry only when
+its log was recorded on the simulator. At most ``concurrency`` batches are in
+flight; submissions arriving meanwhile wait and form the next batch. API
+handlers only enqueue. An entry ends ``verified`` when its replay reaches the
+claimed score and ``rejected`` otherwise; entries still pending at shutdown
+are queued again on startup.
+"""
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+from sqlalchemy import select, update
+
+from ..config import get_settings
+from ..db import AsyncSessionLocal
+from ..models_db import LeaderboardEntry
+from ..neat.compiled import PackedNets, pack_nets, unpack_nets
+from ..simulator import ACTION_NOOP, BatchDinoSimulator, action_codes
+from .net_cache import net_cache
+
+
+@dataclass
+class ReplayResult:
+    frames: int = 0
+    score: float = 0.0
+    error: Optional[str] = None  # the log could not be replayed
+
+
+@dataclass
+class VerificationJob:
+    entry_id: int
+    claimed: int  # submitted score
+    seed: int
+    actions: Optional[str]  # None: play ``model_id`` instead
+    model_id: Optional[str] = None
+
+
+def replay_logs(logs: Sequence[Tuple[int, str]], max_frames: int) -> List[ReplayResult]:
+    """Worker entry point: replay ``(seed, actions)`` logs, one lockstep batch per seed.
+
+    An episode ends when the dino crashes, its log runs out or it reaches
+    ``max_frames``; actions logged after a crash are ignored.
+    """
+    results: List[Optional[ReplayResult]] = [None] * len(logs)
+    by_seed: Dict[int, List[Tuple[int, np.ndarray]]] = {}
+    for i, (seed, actions) in enumerate(logs):
+        try:
+            codes = action_codes(actions, max_frames)
+        except ValueError as exc:
+            results[i] = ReplayResult(error=str(exc))
+            continue
+        by_seed.setdefault(seed, []).append((i, codes))
+
+    for seed, rows in by_seed.items():
+        lengths = np.array([len(codes) for _, codes in rows])
+        table = np.full((len(rows), max(1, lengths.max())), ACTION_NOOP, dtype=np.int8)
+        for row, (_, codes) in enumerate(rows):
+            table[row, : len(codes)] = codes
+        sim = BatchDinoSimulator([seed] * len(rows), max_frames=max_frames)
+        sim.stop(lengths == 0)
+        t = 0
+        while sim.alive.any():
+            sim.step(table[:, t])
+            t += 1
+            sim.stop(lengths <= t)
+        for row, (i, _) in enumerate(rows):
+            results[i] = ReplayResult(frames=int(sim.frames[row]), score=float(sim.score[row]))
+    return results
+
+
+def replay_models(packed: PackedNets, runs: Sequence[Tuple[int, int]], max_frames: int) -> List[ReplayResult]:
+    """Worker entry point: play ``(packed net index, seed)`` autopilot runs in one lockstep batch."""
+    nets = unpack_nets(packed)
+    sim = BatchDinoSimulator([seed for _, seed in runs], max_frames=max_frames)
+    rows: Dict[int, List[int]] = {}
+    for row, (i, _) in enumerate(runs):
+        rows.setdefault(i, []).append(row)
+    actions = np.full(sim.n, ACTION_NOOP)
+    while sim.alive.any():
+        sensors = sim.sensors()
+        for i, own in rows.items():
+            actions[own] = nets[i].activate_batch(sensors[own]).argmax(axis=1)
+        sim.step(actions)
+    return [ReplayResult(frames=int(sim.frames[row]), score=float(sim.score[row])) for row in range(len(runs))]
+
+
+def judge(claimed: int, result: ReplayResult) -> Tuple[str, Optional[str]]:
+    """``(verification, note)`` for a claimed score; scores are shown floored."""
+    if result.error is not None:
+        return "rejected", result.error
+    if claimed > int(result.score):
+        return "rejected", f"claimed {claimed} but the replay scores {int(result.score)}"
+    return "verified", None
+
+
+class ReplayVerifier:
+    def __init__(
+        self, workers: int = 1, batch_size: int = 64, concurrency: int = 2, max_frames: int = 60 * 60 * 3
+    ) -> None:
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self.max_frames = max_frames
+        self._pending: Deque[VerificationJob] = deque()
+        self._in_flight = 0
+        self._tasks: set[asyncio.Task] = set()
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self.batches = 0
+        self.episodes = 0
+        self.frames = 0
+        self.verified = 0
+        self.rejected = 0
+        self.failed = 0  # jobs whose batch errored; retried on the next startup
+        self.busy_seconds = 0.0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(self, job: VerificationJob) -> None:
+        self._pending.append(job)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._pending and self._in_flight < self.concurrency:
+            batch = [self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))]
+            self._in_flight += 1
+            task = asyncio.create_task(self._process(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned like the training subprocess: nothing of the API process is inherited.
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def _process(self, batch: List[VerificationJob]) -> None:
+        try:
+            t0 = time.perf_counter()
+            results = await self._replay(batch)
+            self.busy_seconds += time.perf_counter() - t0
+            await self._store(batch, results)
+        except Exception as exc:
+            if isinstance(exc, concurrent.futures.process.BrokenProcessPool):
+                self._executor = None
+            logger.exception("Replay verification of {} leaderboard entries failed", len(batch))
+            self.failed += len(batch)
+        finally:
+            self._in_flight -= 1
+            self._dispatch()
+
+    async def _replay(self, batch: List[VerificationJob]) -> List[ReplayResult]:
+        loop = asyncio.get_running_loop()
+        results: List[Optional[ReplayResult]] = [None] * len(batch)
+        logged = [i for i, job in enumerate(batch) if job.actions is not None]
+        if logged:
+            replayed = await loop.run_in_executor(
+                self._pool(), replay_logs, [(batch[i].seed, batch[i].actions) for i in logged], self.max_frames
+            )
+            for i, result in zip(logged, replayed):
+                results[i] = result
+
+        nets, index, played = [], {}, []
+        for i, job in enumerate(batch):
+            if job.actions is not None:
+                continue
+            if job.model_id not in index:
+                try:
+                    nets.append(await asyncio.to_thread(net_cache.get, job.model_id))
+                except FileNotFoundError:
+                    results[i] = ReplayResult(error="model file missing")
+                    continue
+                index[job.model_id] = len(nets) - 1
+            played.append(i)
+        if played:
+            runs = [(index[batch[i].model_id], batch[i].seed) for i in played]
+            replayed = await loop.run_in_executor(self._pool(), replay_models, pack_nets(nets), runs, self.max_frames)
+            for i, result in zip(played, replayed):
+                results[i] = result
+        return results
+
+    async def _store(self, batch: List[VerificationJob], results: List[ReplayResult]) -> None:
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as session:
+            for job, result in zip(batch, results):
+                verification, note = judge(job.claimed, result)
+                await session.execute(
+                    update(LeaderboardEntry)
+                    .where(LeaderboardEntry.id == job.entry_id)
+                    .values(
+                        verification=verification,
+                        verified_score=None if result.error else int(result.score),
+                        verification_note=note,
+                        verified_at=now,
+                    )
+                )
+                if verification == "verified":
+                    self.verified += 1
+                else:
+                    self.rejected += 1
+                self.frames += result.frames
+            await session.commit()
+        self.batches += 1
+        self.episodes += len(batch)
+
+    async def recover(self) -> int:
+        """Queue entries left pending by a previous process; returns how many."""
+        async with AsyncSessionLocal() as session:
+            rows = (
+                await session.execute(
+                    select(LeaderboardEntry).where(LeaderboardEntry.verification == "pending")
+                )
+            ).scalars().all()
+        for row in rows:
+            self.submit(VerificationJob(row.id, row.score, row.replay_seed, row.replay_actions, row.model_id))
+        return len(rows)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "in_flight_batches": self._in_flight,
+            "batches": self.batches,
+            "episodes": self.episodes,
+            "verified": self.verified,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            # Simulated game time over replay wall time, at the game's 60 frames/s.
+            "realtime_factor": self.frames / 60.0 / self.busy_seconds if self.busy_seconds else 0.0,
+        }
+
+
+replay_verifier = ReplayVerifier(
+    workers=get_settings().leaderboard_verify_workers,
+    batch_size=get_settings().leaderboard_verify_batch,
+    concurrency=get_settings().leaderboard_verify_concurrency,
+    max_frames=get_settings().leaderboard_replay_max_frames,
+)
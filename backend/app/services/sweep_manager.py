@@ -0,0 +1,293 @@
+"""Hyperparameter sweeps built on the training scheduler.
+
+A sweep expands a grid (or a random sample of it) into variants, runs each
+variant ``repeats`` times as ordinary training runs, follows their events to
+record fitness curves and stops runs early under the median stopping rule.
+Only the best model of each variant is kept.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import random
+import shutil
+import statistics
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+from loguru import logger
+from sqlalchemy import select, update
+
+from ..config import get_settings
+from ..db import AsyncSessionLocal
+from ..models_db import Sweep
+from ..schemas import SweepRequest, SweepStatus, SweepVariantResult, TrainingStartRequest
+from .model_store import model_store
+from .training_manager import training_manager
+
+PARAMS = ("population_size", "survival_threshold", "compatibility_threshold", "mutation_rate")
+_TERMINAL = ("finished", "stopped", "error")
+
+
+def expand_space(req: SweepRequest, rng: random.Random) -> List[Dict[str, float]]:
+    """Variant parameter sets: the full grid, or ``samples`` distinct draws from it."""
+    grid = [
+        dict(zip(PARAMS, values))
+        for values in itertools.product(*(dict.fromkeys(getattr(req.space, p)) for p in PARAMS))
+    ]
+    if req.search == "random":
+        grid = rng.sample(grid, min(req.samples, len(grid)))
+    return grid
+
+
+def should_stop(curve: Sequence[float], peers: Sequence[Sequence[float]], grace: int, min_peers: int = 2) -> bool:
+    """Median stopping rule on best-fitness curves."""
+    g = len(curve)
+    if g < grace:
+        return False
+    at_g = [p[g - 1] for p in peers if len(p) >= g]
+    return len(at_g) >= min_peers and curve[-1] < statistics.median(at_g)
+
+
+@dataclass
+class _Trial:
+    variant: int
+    repeat: int
+    req: TrainingStartRequest
+    run_id: Optional[str] = None
+    state: str = "pending"  # pending|running|finished|stopped|early_stopped|error
+    curve: List[float] = field(default_factory=list)
+    model_id: Optional[str] = None
+
+
+@dataclass
+class _Sweep:
+    sweep_id: str
+    name: str
+    req: SweepRequest
+    params: List[Dict[str, float]]
+    trials: List[_Trial]
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    status: str = "running"
+    stopping: bool = False
+    task: Optional[asyncio.Task] = None
+
+    def summary(self) -> SweepStatus:
+        variants = []
+        for v, params in enumerate(self.params):
+            trials = [t for t in self.trials if t.variant == v]
+            scored = [t for t in trials if t.curve]
+            finals = [t.curve[-1] for t in scored]
+            best = max(scored, key=lambda t: t.curve[-1], default=None)
+            variants.append(
+                SweepVariantResult(
+                    rank=0,
+                    params=params,
+                    mean_best_fitness=statistics.fmean(finals) if finals else 0.0,
+                    std_best_fitness=statistics.pstdev(finals) if finals else 0.0,
+                    trials=len(trials),
+                    completed=sum(t.state == "finished" for t in trials),
+                    early_stopped=sum(t.state == "early_stopped" for t in trials),
+                    best_model_id=best.model_id if best else None,
+                    run_ids=[t.run_id for t in trials if t.run_id],
+                    curves=[t.curve for t in trials],
+                )
+            )
+        variants.sort(key=lambda r: r.mean_best_fitness, reverse=True)
+        for rank, result in enumerate(variants, start=1):
+            result.rank = rank
+        top = variants[0] if variants and variants[0].curves else None
+        return SweepStatus(
+            sweep_id=self.sweep_id,
+            name=self.name,
+            status=self.status,
+            created_at=self.created_at,
+            finished_at=self.finished_at,
+            total_trials=len(self.trials),
+            finished_trials=sum(t.state not in ("pending", "running") for t in self.trials),
+            best_fitness=max((max(c) for c in (t.curve for t in self.trials) if c), default=0.0),
+            best_model_id=top.best_model_id if top else None,
+            variants=variants,
+        )
+
+
+class SweepManager:
+    def __init__(self) -> None:
+        self.settings = get_settings()
+        self._sweeps: Dict[str, _Sweep] = {}
+
+    async def start(self, req: SweepRequest) -> _Sweep:
+        """Validate, persist and launch a sweep; ``ValueError`` for an unusable request."""
+        base_seed = req.seed if req.seed is not None else random.randrange(2**31)
+        params = expand_space(req, random.Random(base_seed))
+        if len(params) * req.repeats > self.settings.max_sweep_trials:
+            raise ValueError(
+                f"Sweep has {len(params) * req.repeats} runs; the limit is {self.settings.max_sweep_trials}"
+            )
+        sweep_id = str(uuid.uuid4())
+        name = req.name or f"sweep-{sweep_id[:8]}"
+        trials = [
+            _Trial(
+                variant=v,
+                repeat=r,
+                req=TrainingStartRequest(
+                    **p,
+                    max_generations=req.max_generations,
+                    seed=base_seed + r,
+                    racing=req.racing,
+                    evolution=req.evolution,
+                    run_name=f"{name}-v{v + 1}r{r + 1}",
+                ),
+            )
+            for v, p in enumerate(params)
+            for r in range(req.repeats)
+        ]
+        sweep = _Sweep(sweep_id, name, req.model_copy(update={"seed": base_seed}), params, trials)
+        async with AsyncSessionLocal() as session:
+            session.add(
+                Sweep(
+                    id=sweep_id,
+                    name=name,
+                    status="running",
+                    config_json=sweep.req.model_dump_json(),
+                    results_json=sweep.summary().model_dump_json(),
+                    created_at=sweep.created_at,
+                )
+            )
+            await session.commit()
+        self._sweeps[sweep_id] = sweep
+        sweep.task = asyncio.create_task(self._drive(sweep))
+        return sweep
+
+    async def stop(self, sweep_id: str) -> bool:
+        sweep = self._sweeps.get(sweep_id)
+        if sweep is None or sweep.status != "running":
+            return False
+        sweep.stopping = True
+        for trial in sweep.trials:
+            if trial.state == "running" and trial.run_id:
+                await training_manager.stop(trial.run_id)
+        return True
+
+    async def get(self, sweep_id: str) -> Optional[SweepStatus]:
+        sweep = self._sweeps.get(sweep_id)
+        if sweep is not None:
+            return sweep.summary()
+        async with AsyncSessionLocal() as session:
+            row = await session.get(Sweep, sweep_id)
+        return self._from_row(row) if row is not None else None
+
+    async def list_sweeps(self) -> List[SweepStatus]:
+        async with AsyncSessionLocal() as session:
+            rows = (await session.execute(select(Sweep).order_by(Sweep.created_at.desc()))).scalars().all()
+        return [
+            self._sweeps[row.id].summary() if row.id in self._sweeps else self._from_row(row)
+            for row in rows
+        ]
+
+    @staticmethod
+    def _from_row(row: Sweep) -> SweepStatus:
+        status = SweepStatus.model_validate_json(row.results_json)
+        return status.model_copy(update={"status": row.status, "finished_at": row.finished_at})
+
+    async def recover_stale(self) -> int:
+        """Mark sweeps left running by a previous process as interrupted."""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                update(Sweep).where(Sweep.status == "running").values(status="interrupted")
+            )
+            await session.commit()
+        return result.rowcount or 0
+
+    # ------------------------------------------------------------------
+    async def _drive(self, sweep: _Sweep) -> None:
+        # Keep as many trials in flight as the scheduler runs concurrently;
+        # queuing the whole sweep would starve other users' runs. Seeded
+        # trials run one at a time: a seed only takes when the run is alone.
+        parallel = 1 if sweep.req.seed is not None else max(1, self.settings.max_concurrent_runs)
+        pending = list(sweep.trials)
+        running: set[asyncio.Task] = set()
+        try:
+            while pending or running:
+                while pending and len(running) < parallel and not sweep.stopping:
+                    running.add(asyncio.create_task(self._run_trial(sweep, pending.pop(0))))
+                if not running:
+                    break
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+                await self._persist(sweep)
+            sweep.status = "stopped" if sweep.stopping else "finished"
+            await self._prune_models(sweep)
+        except Exception:
+            logger.exception("Sweep {} failed", sweep.sweep_id)
+            sweep.status = "error"
+            for task in running:
+                task.cancel()
+        finally:
+            sweep.finished_at = datetime.utcnow()
+            await self._persist(sweep)
+            del self._sweeps[sweep.sweep_id]
+
+    async def _run_trial(self, sweep: _Sweep, trial: _Trial) -> None:
+        while True:
+            try:
+                run = await training_manager.start(trial.req)
+                break
+            except RuntimeError:  # training queue full: wait for room
+                await asyncio.sleep(1.0)
+        trial.run_id, trial.state = run.run_id, "running"
+        sub = await training_manager.subscribe(run.run_id, name=f"sweep {sweep.sweep_id}", coalesce=False)
+        early = False
+        try:
+            while True:
+                evt = (await sub.get()).update
+                if evt.type == "generation":
+                    trial.curve.append(evt.best_fitness)
+                    peers = [t.curve for t in sweep.trials if t is not trial]
+                    if (
+                        sweep.req.early_stopping
+                        and not early
+                        and should_stop(trial.curve, peers, sweep.req.grace_generations)
+                    ):
+                        early = True
+                        logger.info("Sweep {} stops {} early", sweep.sweep_id, trial.req.run_name)
+                        await training_manager.stop(run.run_id)
+                elif evt.type in _TERMINAL:
+                    trial.model_id = evt.model_id
+                    trial.state = "early_stopped" if early and evt.type == "stopped" else evt.type
+                    return
+        finally:
+            training_manager.unsubscribe(sub)
+
+    async def _persist(self, sweep: _Sweep) -> None:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(Sweep)
+                .where(Sweep.id == sweep.sweep_id)
+                .values(
+                    status=sweep.status,
+                    results_json=sweep.summary().model_dump_json(),
+                    finished_at=sweep.finished_at,
+                )
+            )
+            await session.commit()
+
+    async def _prune_models(self, sweep: _Sweep) -> None:
+        """Keep each variant's best model; drop the rest and stopped runs' checkpoints."""
+        keep = {v.best_model_id for v in sweep.summary().variants}
+        async with AsyncSessionLocal() as session:
+            for trial in sweep.trials:
+                if trial.model_id and trial.model_id not in keep:
+                    await model_store.delete(session, trial.model_id)
+        for trial in sweep.trials:
+            if trial.run_id:
+                await asyncio.to_thread(
+                    shutil.rmtree, self.settings.checkpoints_dir / trial.run_id, True
+                )
+
+
+sweep_manager = SweepManager()
@@ -1,13 +1,15 @@
-"""Singleton training manager with WebSocket broadcast fan-out."""
+"""Training run scheduler with per-run WebSocket broadcast fan-out."""
 from __future__ import annotations
 
 import asyncio
-import json
+import shutil
+import time
 import uuid
-from collections import deque
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence, Union
 
 from loguru import logger
 from sqlalchemy import update
@@ -15,70 +17,210 @@ from sqlalchemy import update
 from ..config import get_settings
 from ..db import AsyncSessionLocal
 from ..models_db import TrainingRun
-from ..neat.trainer import GenerationReport, NeatTrainer
-from ..schemas import TrainingStartRequest, TrainingUpdate
+from ..neat import checkpoint
+from ..neat.config_registry import get_config
+from ..neat.trainer import GenerationReport, NeatTrainer, ProgressReport
+from ..neat.warm_start import check_compatible
+from ..schemas import TrainingMetrics, TrainingRunStatus, TrainingStartRequest, TrainingUpdate
+from .eval_pool import eval_pool
+from .fanout import TERMINAL_EVENTS, Event, FanoutHub, Subscription
+from .generation_history import generation_history
 from .model_store import model_store
+from .training_process import ProcessTrainer
+
+# Finished runs kept in memory for status and WebSocket replay.
+_RETAINED_RUNS = 20
+_ACTIVE_STATES = ("queued", "running", "paused")
+
+
+def fair_shares(budget: int, weights: Sequence[int]) -> List[int]:
+    """Split ``budget`` workers by ``weights`` (largest remainder), at least 1 each."""
+    if not weights:
+        return []
+    total = sum(weights)
+    exact = [budget * w / total for w in weights]
+    shares = [int(x) for x in exact]
+    by_remainder = sorted(range(len(weights)), key=lambda i: exact[i] - shares[i], reverse=True)
+    for i in by_remainder[: budget - sum(shares)]:
+        shares[i] += 1
+    return [max(1, n) for n in shares]
+
+
+def record_metrics(metrics: TrainingMetrics, update: TrainingUpdate) -> None:
+    """Fold one generation's update into a run's performance summary."""
+    metrics.generations += 1
+    n = metrics.generations
+    for phase, seconds in update.phase_seconds.items():
+        metrics.phase_seconds[phase] = metrics.phase_seconds.get(phase, 0.0) + seconds
+    utilization = update.worker_utilization
+    mean_utilization = sum(utilization) / len(utilization) if utilization else 0.0
+    metrics.frames_per_second += (update.frames_per_second - metrics.frames_per_second) / n
+    metrics.genomes_per_second += (update.genomes_per_second - metrics.genomes_per_second) / n
+    metrics.worker_utilization += (mean_utilization - metrics.worker_utilization) / n
+    metrics.mean_genome_size = update.mean_genome_size
+    metrics.max_genome_size = max(metrics.max_genome_size, update.max_genome_size)
+
+
+def merge_replay(others: Sequence[Event], generations: Sequence[Event], after: Optional[int]) -> List[Event]:
+    """A run's replay in emission order.
+
+    Non-generation events carry the generation they were emitted at and
+    follow that generation's event. With an ``after`` cursor only what came
+    later is replayed, except terminal events, which always are.
+    """
+    if after is not None:
+        others = [e for e in others if e.update.generation > after or e.type in TERMINAL_EVENTS]
+    # Stable sort: events at the same position keep their original order.
+    return sorted([*generations, *others], key=lambda e: (e.update.generation, e.type != "generation"))
+
+
+@dataclass
+class _Run:
+    run_id: str
+    req: TrainingStartRequest
+    message: str
+    seed_genomes: list = field(default_factory=list)
+    resume_from: Optional[Path] = None
+    state: str = "queued"  # queued|running|paused|finished|stopped|error
+    workers: int = 0
+    trainer: Optional[Union[NeatTrainer, ProcessTrainer]] = None
+    task: Optional[asyncio.Task] = None
+    # Recent non-generation events; generations are replayed from the database.
+    history: deque = field(default_factory=lambda: deque(maxlen=100))
+    current_report: Optional[GenerationReport] = None
+    metrics: TrainingMetrics = field(default_factory=TrainingMetrics)
+    queued_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def active(self) -> bool:
+        return self.state in _ACTIVE_STATES
+
+    @property
+    def generation(self) -> int:
+        """Generations completed, counting those before a checkpoint resume."""
+        if self.current_report is not None:
+            return self.current_report.generation
+        return checkpoint.generation_of(self.resume_from) if self.resume_from else 0
+
+    def status(self) -> TrainingRunStatus:
+        r = self.current_report
+        return TrainingRunStatus(
+            run_id=self.run_id,
+            state=self.state,
+            priority=self.req.priority,
+            workers=self.workers if self.state == "running" else 0,
+            generation=self.generation,
+            max_generations=self.req.max_generations,
+            best_fitness=r.best_fitness if r else 0.0,
+            run_name=self.req.run_name,
+        )
 
 
 class TrainingManager:
-    """One active run at a time. Subscribers receive JSON events."""
+    """Queues runs, runs up to ``max_concurrent_runs`` of them at once and
+    divides the worker budget among running runs by priority.
+
+    Subscribers receive encoded events through a ``FanoutHub``, either for
+    one run or for all of them.
+    """
 
     def __init__(self) -> None:
         self.settings = get_settings()
-        self._task: Optional[asyncio.Task] = None
-        self._trainer: Optional[NeatTrainer] = None
-        self._run_id: Optional[str] = None
-        self._subscribers: set[asyncio.Queue] = set()
-        self._history: deque[dict] = deque(maxlen=100)
-        self._current_report: Optional[GenerationReport] = None
+        self._runs: "OrderedDict[str, _Run]" = OrderedDict()
+        self.hub = FanoutHub()
         self._lock = asyncio.Lock()
 
     # ------------------------------------------------------------------
     @property
     def is_active(self) -> bool:
-        return self._task is not None and not self._task.done()
+        return any(run.active for run in self._runs.values())
 
     @property
     def run_id(self) -> Optional[str]:
-        return self._run_id if self.is_active else None
-
-    async def subscribe(self) -> asyncio.Queue:
-        q: asyncio.Queue = asyncio.Queue(maxsize=256)
-        # replay history on connect
-        for evt in self._history:
-            await q.put(evt)
-        self._subscribers.add(q)
-        return q
-
-    def unsubscribe(self, q: asyncio.Queue) -> None:
-        self._subscribers.discard(q)
-
-    async def _broadcast(self, update: TrainingUpdate) -> None:
-        payload = json.loads(update.model_dump_json())
-        self._history.append(payload)
-        dead: list[asyncio.Queue] = []
-        for q in list(self._subscribers):
-            try:
-                q.put_nowait(payload)
-            except asyncio.QueueFull:
-                dead.append(q)
-        for q in dead:
-            self._subscribers.discard(q)
+        latest = self.latest()
+        return latest.run_id if latest is not None and latest.active else None
+
+    def latest(self) -> Optional[_Run]:
+        """Most recently queued active run, else the most recent run."""
+        runs = list(self._runs.values())
+        active = [run for run in runs if run.active]
+        return (active or runs or [None])[-1]
+
+    def get(self, run_id: str) -> Optional[_Run]:
+        return self._runs.get(run_id)
+
+    def runs(self) -> List[TrainingRunStatus]:
+        return [run.status() for run in self._runs.values()]
+
+    async def subscribe(
+        self,
+        run_id: Optional[str] = None,
+        *,
+        after: Optional[int] = None,
+        name: str = "",
+        coalesce: bool = True,
+    ) -> Subscription:
+        """Events of ``run_id`` (``LookupError`` if unknown), or of every active run.
+
+        The run's history is replayed first: generations from the database,
+        past the ``after`` cursor when given, merged with its other events.
+        ``coalesce=False`` is for consumers that need every generation and
+        are known to keep up.
+        """
+        if run_id is not None:
+            run = self._runs.get(run_id)
+            if run is None:
+                raise LookupError(f"Unknown training run {run_id}")
+            runs = [run]
+        else:
+            runs = [run for run in self._runs.values() if run.active]
+            after = None  # generation cursors are per run
+        # Subscribe before reading history: anything published from now on
+        # arrives live, everything up to this point comes from the snapshot.
+        sub = self.hub.subscribe(run_id, name=name, coalesce=coalesce)
+        snapshot = [(run, list(run.history), run.generation) for run in runs]
+        try:
+            replay = []
+            for run, others, through in snapshot:
+                stored = await generation_history.events(run.run_id, after, through)
+                replay.extend(merge_replay(others, stored, after))
+        except BaseException:
+            self.hub.unsubscribe(sub)
+            raise
+        sub.prepend(replay)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        self.hub.unsubscribe(sub)
+
+    async def _broadcast(self, run: _Run, update: TrainingUpdate) -> None:
+        self._publish(run, update)
+
+    def _publish(self, run: _Run, update: TrainingUpdate, retain: bool = True) -> None:
+        """Fan out a non-generation event; ``retain`` keeps it for replay."""
+        event = Event.encode(update)
+        if retain:
+            run.history.append(event)
+        self.hub.publish(event)
+
+    async def _set_status(self, run_id: str, **values) -> None:
+        async with AsyncSessionLocal() as session:
+            await session.execute(update(TrainingRun).where(TrainingRun.id == run_id).values(**values))
+            await session.commit()
 
     # ------------------------------------------------------------------
-    async def start(self, req: TrainingStartRequest) -> str:
+    async def start(self, req: TrainingStartRequest) -> _Run:
         async with self._lock:
-            if self.is_active:
-                raise RuntimeError("A training run is already active")
+            queued = sum(run.state == "queued" for run in self._runs.values())
+            if queued >= self.settings.training_queue_limit:
+                raise RuntimeError("Training queue is full")
 
+            seeds = await asyncio.to_thread(self._load_sources, req.source_model_ids)
             run_id = str(uuid.uuid4())
-            self._run_id = run_id
-            self._history.clear()
-
             async with AsyncSessionLocal() as session:
                 row = TrainingRun(
                     id=run_id,
-                    status="running",
+                    status="queued",
                     population_size=req.population_size,
                     max_generations=req.max_generations,
                     best_fitness=0.0,
@@ -89,62 +231,308 @@ class TrainingManager:
                 session.add(row)
                 await session.commit()
 
-            self._trainer = NeatTrainer(
-                base_config_path=self.settings.neat_config_path,
-                population_size=req.population_size,
-                max_generations=req.max_generations,
-                survival_threshold=req.survival_threshold,
-                compatibility_threshold=req.compatibility_threshold,
-                workers=self.settings.resolve_workers(),
+            message = f"Starting {req.max_generations} generations"
+            if seeds:
+                message += f" from {len(seeds)} saved model(s)"
+            run = _Run(run_id=run_id, req=req, message=message, seed_genomes=seeds)
+            await self._enqueue(run)
+            return run
+
+    def _load_sources(self, model_ids: list[str]) -> list[object]:
+        """Genomes of the warm-start models; ``LookupError``/``ValueError`` when unusable."""
+        genome_config = get_config(path=self.settings.neat_config_path).genome_config
+        genomes = []
+        for model_id in dict.fromkeys(model_ids):
+            if not model_store.path_for(model_id).exists():
+                raise LookupError(f"Model {model_id} not found")
+            genome, _ = model_store.load_genome(model_id)
+            check_compatible(genome, genome_config, label=f"Model {model_id}")
+            genomes.append(genome)
+        return genomes
+
+    async def resume(self, run_id: str) -> _Run:
+        """Continue a paused run, or a stopped/interrupted one from its latest checkpoint.
+
+        Raises ``LookupError`` for an unknown run or one without checkpoints,
+        ``RuntimeError`` when the run is already queued or running. A resumed
+        run replays its original random sequence only if no other run trains
+        in its process (see ``checkpoint.Checkpoint.restore``).
+        """
+        async with self._lock:
+            run = self._runs.get(run_id)
+            if run is not None and run.state == "paused":
+                # Back through the queue so the concurrency limit still holds.
+                run.state = "queued"
+                run.queued_at = time.monotonic()
+                await self._set_status(run_id, status="queued")
+                await self._schedule()
+                return run
+            if run is not None and run.active:
+                raise RuntimeError(f"Training run {run_id} is already {run.state}")
+
+            async with AsyncSessionLocal() as session:
+                row = await session.get(TrainingRun, run_id)
+                if row is None:
+                    raise LookupError(f"Unknown training run {run_id}")
+                path = checkpoint.latest(self.settings.checkpoints_dir / run_id)
+                if path is None:
+                    raise LookupError(f"No checkpoint for training run {run_id}")
+                req = TrainingStartRequest.model_validate_json(row.config_json)
+                metrics = TrainingMetrics.model_validate_json(row.metrics_json or "{}")
+                generation = checkpoint.generation_of(path)
+                row.status = "queued"
+                row.finished_at = None
+                row.current_generation = generation
+                await session.commit()
+            # Generations after the checkpoint will be reported again.
+            await generation_history.discard_after(run_id, generation)
+
+            self._runs.pop(run_id, None)
+            run = _Run(
+                run_id=run_id,
+                req=req,
+                message=f"Resuming from generation {generation}",
+                resume_from=path,
+                metrics=metrics,
             )
+            await self._enqueue(run)
+            return run
 
+    async def run_exists(self, run_id: str) -> bool:
+        if run_id in self._runs:
+            return True
+        async with AsyncSessionLocal() as session:
+            return await session.get(TrainingRun, run_id) is not None
+
+    async def metrics(self, run_id: str) -> Optional[TrainingMetrics]:
+        """Performance summary of a run, live or persisted; None if unknown."""
+        run = self._runs.get(run_id)
+        if run is not None:
+            return run.metrics
+        async with AsyncSessionLocal() as session:
+            row = await session.get(TrainingRun, run_id)
+        if row is None:
+            return None
+        return TrainingMetrics.model_validate_json(row.metrics_json or "{}")
+
+    async def pause(self, run_id: str) -> bool:
+        """Hold a running run at its next generation boundary and free its workers."""
+        async with self._lock:
+            run = self._runs.get(run_id)
+            if run is None or run.state != "running" or run.trainer is None:
+                return False
+            run.trainer.pause()
+            run.state = "paused"
+            await self._set_status(run_id, status="paused")
             await self._broadcast(
+                run,
                 TrainingUpdate(
                     run_id=run_id,
-                    type="start",
-                    population_size=req.population_size,
-                    message=f"Starting {req.max_generations} generations",
+                    type="paused",
+                    generation=run.current_report.generation if run.current_report else 0,
+                    message="Paused",
+                ),
+            )
+            await self._schedule()
+            return True
+
+    async def stop(self, run_id: Optional[str] = None) -> bool:
+        """Stop one run, or every active run when ``run_id`` is None."""
+        async with self._lock:
+            if run_id is None:
+                targets = [run for run in self._runs.values() if run.active]
+            else:
+                targets = [run for run in (self._runs.get(run_id),) if run is not None and run.active]
+            for run in targets:
+                if run.trainer is not None:
+                    run.trainer.request_stop()
+                    continue
+                # Never started: just leave the queue.
+                run.state = "stopped"
+                await self._set_status(run.run_id, status="stopped", finished_at=datetime.utcnow())
+                await self._broadcast(
+                    run, TrainingUpdate(run_id=run.run_id, type="stopped", message="Removed from queue")
                 )
+            return bool(targets)
+
+    async def recover_stale(self) -> int:
+        """Mark runs left active by a previous process as interrupted."""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                update(TrainingRun)
+                .where(TrainingRun.status.in_(_ACTIVE_STATES))
+                .values(status="interrupted")
             )
+            await session.commit()
+        return result.rowcount or 0
+
+    # ------------------------------------------------------------------
+    async def _enqueue(self, run: _Run) -> None:
+        self._runs[run.run_id] = run
+        await self._broadcast(
+            run,
+            TrainingUpdate(
+                run_id=run.run_id,
+                type="queued",
+                population_size=run.req.population_size,
+                message=run.message,
+            ),
+        )
+        await self._schedule()
+
+    async def _schedule(self) -> None:
+        """Start (or unpause) queued runs up to the concurrency limit, then rebalance.
+
+        Caller holds ``self._lock``.
+        """
+        running = [run for run in self._runs.values() if run.state == "running"]
+        queued = sorted(
+            (run for run in self._runs.values() if run.state == "queued"),
+            key=lambda run: (-run.req.priority, run.queued_at),
+        )
+        starting = queued[: max(0, self.settings.max_concurrent_runs - len(running))]
+        for run in starting:
+            run.state = "running"
+        self._rebalance()
+
+        pool_ok = False
+        if any(run.trainer is None for run in starting):
+            pool_ok = await asyncio.to_thread(eval_pool.ensure_healthy)
+        for run in starting:
+            await self._set_status(run.run_id, status="running")
+            if run.trainer is not None:  # paused earlier
+                run.trainer.unpause()
+                await self._broadcast(
+                    run,
+                    TrainingUpdate(
+                        run_id=run.run_id,
+                        type="resumed",
+                        generation=run.current_report.generation if run.current_report else 0,
+                        message="Resumed",
+                    ),
+                )
+            else:
+                self._launch(run, pool_ok)
 
-            self._task = asyncio.create_task(self._run_loop(run_id, req))
-            return run_id
+    def _rebalance(self) -> None:
+        running = [run for run in self._runs.values() if run.state == "running"]
+        shares = fair_shares(self.settings.worker_budget(), [run.req.priority for run in running])
+        for run, share in zip(running, shares):
+            run.workers = share
+            if run.trainer is not None:
+                run.trainer.set_workers(share)
 
-    async def stop(self) -> bool:
-        if not self.is_active or self._trainer is None:
-            return False
-        self._trainer.request_stop()
-        return True
+    def _launch(self, run: _Run, pool_ok: bool) -> None:
+        req = run.req
+        # Without the shared pool evaluation is serial; keep it off the API
+        # process so it cannot hold the GIL the event loop needs.
+        trainer_cls = NeatTrainer if pool_ok or not self.settings.training_subprocess else ProcessTrainer
+        hz = self.settings.training_progress_hz
+        run.trainer = trainer_cls(
+            base_config_path=self.settings.neat_config_path,
+            population_size=req.population_size,
+            max_generations=req.max_generations,
+            survival_threshold=req.survival_threshold,
+            compatibility_threshold=req.compatibility_threshold,
+            mutation_rate=req.mutation_rate,
+            seed=req.seed,
+            workers=run.workers,
+            pool=eval_pool if pool_ok else None,
+            fitness_cache_size=self.settings.fitness_cache_size,
+            racing=req.racing,
+            mode=req.evolution,
+            checkpoint_dir=self.settings.checkpoints_dir / run.run_id,
+            checkpoint_every_generations=self.settings.checkpoint_every_generations,
+            checkpoint_every_seconds=self.settings.checkpoint_every_seconds,
+            checkpoint_keep=self.settings.checkpoint_keep,
+            resume_from=run.resume_from,
+            seed_genomes=run.seed_genomes,
+            progress_interval=1.0 / hz if hz > 0 else 0.0,
+            record_replays=self.settings.training_record_replays,
+        )
+        run.seed_genomes = []
+        run.task = asyncio.create_task(self._run_loop(run))
+
+    def _prune(self) -> None:
+        finished = [run_id for run_id, run in self._runs.items() if not run.active]
+        for run_id in finished[: max(0, len(finished) - _RETAINED_RUNS)]:
+            del self._runs[run_id]
 
     # ------------------------------------------------------------------
-    async def _run_loop(self, run_id: str, req: TrainingStartRequest) -> None:
+    async def _run_loop(self, run: _Run) -> None:
+        run_id, req, trainer = run.run_id, run.req, run.trainer
         try:
+            await self._broadcast(
+                run,
+                TrainingUpdate(
+                    run_id=run_id,
+                    type="start",
+                    population_size=req.population_size,
+                    message=run.message,
+                ),
+            )
+
             async def on_gen(report: GenerationReport) -> None:
-                self._current_report = report
-                async with AsyncSessionLocal() as session:
-                    await session.execute(
-                        update(TrainingRun)
-                        .where(TrainingRun.id == run_id)
-                        .values(
-                            current_generation=report.generation,
-                            best_fitness=report.best_fitness,
-                        )
-                    )
-                    await session.commit()
-                await self._broadcast(
+                run.current_report = report
+                evt = TrainingUpdate(
+                    run_id=run_id,
+                    type="generation",
+                    generation=report.generation,
+                    best_fitness=report.best_fitness,
+                    mean_fitness=report.mean_fitness,
+                    species_count=report.species_count,
+                    population_size=report.population_size,
+                    elapsed_seconds=report.elapsed_seconds,
+                    cache_hit_rate=report.cache_hit_rate,
+                    censored=report.censored,
+                    frames_saved=report.frames_saved,
+                    worker_idle_seconds=report.worker_idle_seconds,
+                    load_imbalance=report.load_imbalance,
+                    frames_simulated=report.frames_simulated,
+                    phase_seconds=report.phase_seconds,
+                    frames_per_second=report.frames_per_second,
+                    genomes_per_second=report.genomes_per_second,
+                    worker_utilization=report.worker_utilization,
+                    mean_genome_size=report.mean_genome_size,
+                    max_genome_size=report.max_genome_size,
+                )
+                record_metrics(run.metrics, evt)
+                # No awaits from here on: a subscriber sees this generation either
+                # in the stored history or live, never both or neither.
+                t0 = time.perf_counter()
+                event = Event.encode(evt)
+                generation_history.add(
+                    event,
+                    replay=report.replay,
+                    current_generation=report.generation,
+                    best_fitness=report.best_fitness,
+                    metrics_json=run.metrics.model_dump_json(),
+                )
+                self.hub.publish(event)
+                # Counted from the next generation on; an event cannot carry its own cost.
+                phases = run.metrics.phase_seconds
+                phases["publish"] = phases.get("publish", 0.0) + time.perf_counter() - t0
+
+            def on_progress(report: ProgressReport) -> None:
+                # Live only: progress ticks are not replayed to late subscribers.
+                self._publish(
+                    run,
                     TrainingUpdate(
                         run_id=run_id,
-                        type="generation",
+                        type="progress",
                         generation=report.generation,
+                        evaluated=report.evaluated,
+                        population_size=report.total,
                         best_fitness=report.best_fitness,
                         mean_fitness=report.mean_fitness,
-                        species_count=report.species_count,
-                        population_size=report.population_size,
-                        elapsed_seconds=report.elapsed_seconds,
-                    )
+                        frames_simulated=report.frames_simulated,
+                    ),
+                    retain=False,
                 )
 
-            best_genome = await self._trainer.run(on_generation=on_gen)
+            best_genome = await trainer.run(on_generation=on_gen, on_progress=on_progress)
+            stopped = trainer.stop_requested
+            await generation_history.flush()  # the curve is complete before the run is marked done
 
             # Auto-save best model
             model_id = None
@@ -156,48 +544,43 @@ class TrainingManager:
                         best_genome,
                         name=name,
                         fitness=float(best_genome.fitness or 0.0),
-                        generations=self._current_report.generation if self._current_report else 0,
+                        generations=run.current_report.generation if run.current_report else 0,
                     )
                     model_id = model_row.id
 
-            async with AsyncSessionLocal() as session:
-                await session.execute(
-                    update(TrainingRun)
-                    .where(TrainingRun.id == run_id)
-                    .values(
-                        status="finished" if not self._trainer._stop_flag else "stopped",
-                        finished_at=datetime.utcnow(),
-                        model_id=model_id,
-                    )
+            if not stopped:
+                # Finished runs cannot be resumed; stopped ones keep their checkpoints.
+                await asyncio.to_thread(
+                    shutil.rmtree, self.settings.checkpoints_dir / run_id, True
                 )
-                await session.commit()
 
+            run.state = "stopped" if stopped else "finished"
+            await self._set_status(
+                run_id, status=run.state, finished_at=datetime.utcnow(), model_id=model_id
+            )
             await self._broadcast(
+                run,
                 TrainingUpdate(
                     run_id=run_id,
-                    type="finished" if not self._trainer._stop_flag else "stopped",
-                    generation=self._current_report.generation if self._current_report else 0,
-                    best_fitness=self._current_report.best_fitness if self._current_report else 0.0,
+                    type=run.state,
+                    generation=run.current_report.generation if run.current_report else 0,
+                    best_fitness=run.current_report.best_fitness if run.current_report else 0.0,
                     model_id=model_id,
                     message=f"Training complete. Model id: {model_id}",
-                )
+                ),
             )
 
         except Exception as exc:  # pragma: no cover
-            logger.exception("Training run failed")
-            async with AsyncSessionLocal() as session:
-                await session.execute(
-                    update(TrainingRun)
-                    .where(TrainingRun.id == run_id)
-                    .values(status="error", finished_at=datetime.utcnow())
-                )
-                await session.commit()
-            await self._broadcast(
-                TrainingUpdate(run_id=run_id, type="error", message=str(exc))
-            )
+            logger.exception("Training run {} failed", run_id)
+            run.state = "error"
+            await self._set_status(run_id, status="error", finished_at=datetime.utcnow())
+            await self._broadcast(run, TrainingUpdate(run_id=run_id, type="error", message=str(exc)))
         finally:
-            self._task = None
-            self._trainer = None
+            run.task = None
+            run.trainer = None
+            async with self._lock:
+                self._prune()
+                await self._schedule()
 
 
 training_manager = TrainingManager()
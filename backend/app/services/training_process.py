@@ -0,0 +1,166 @@
+"""Run a ``NeatTrainer`` in a dedicated subprocess.
+
+Serial evaluation in a thread of the API process holds the GIL for most of
+every generation, which shows up as event-loop lag on ``/ws/play`` and the
+REST endpoints. ``ProcessTrainer`` runs the same trainer in a child process
+and mirrors the ``NeatTrainer`` control surface, so ``TrainingManager`` can
+use either. Messages cross a duplex pipe: generation reports and the final
+genome come back, stop/pause/unpause commands go out.
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+import time
+import traceback
+from typing import Optional
+
+from loguru import logger
+
+from ..neat.trainer import NeatTrainer, ProgressCallback, ProgressListener
+
+
+def _child_main(kwargs: dict, conn) -> None:
+    trainer = NeatTrainer(**kwargs)
+
+    def commands() -> None:
+        while True:
+            try:
+                cmd = conn.recv()
+            except (EOFError, OSError):
+                trainer.request_stop()  # parent went away
+                return
+            if cmd == "stop":
+                trainer.request_stop()
+            elif cmd == "pause":
+                trainer.pause()
+            elif cmd == "unpause":
+                trainer.unpause()
+
+    threading.Thread(target=commands, name="trainer-commands", daemon=True).start()
+
+    async def on_generation(report) -> None:
+        conn.send(("generation", (report, time.time())))
+
+    def on_progress(report) -> None:
+        conn.send(("progress", report))
+
+    try:
+        best = asyncio.run(trainer.run(on_generation=on_generation, on_progress=on_progress))
+        conn.send(("done", (best, trainer.stop_requested)))
+    except BaseException:
+        conn.send(("error", traceback.format_exc()))
+
+
+class ProcessTrainer:
+    """``NeatTrainer`` stand-in that trains in a child process.
+
+    Evaluation inside the child is serial (``workers=1``): the child is a
+    daemon process and cannot own a pool, and this path is only used when
+    the shared evaluation pool is unavailable.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        kwargs.pop("pool", None)
+        kwargs["workers"] = 1
+        self._kwargs = kwargs
+        self.workers = 1
+        self._conn = None
+        self._process: Optional[multiprocessing.Process] = None
+        self._stop_requested = False
+        self._paused = False
+
+    # -- NeatTrainer control surface ------------------------------------
+    @property
+    def stop_requested(self) -> bool:
+        return self._stop_requested
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    def request_stop(self) -> None:
+        self._stop_requested = True
+        self._send("stop")
+
+    def pause(self) -> None:
+        self._paused = True
+        self._send("pause")
+
+    def unpause(self) -> None:
+        self._paused = False
+        self._send("unpause")
+
+    def set_workers(self, workers: int) -> None:
+        pass  # always serial in the child
+
+    def _send(self, cmd: str) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.send(cmd)
+            except (BrokenPipeError, OSError):
+                pass
+
+    # ------------------------------------------------------------------
+    async def run(
+        self,
+        on_generation: Optional[ProgressCallback] = None,
+        on_progress: Optional[ProgressListener] = None,
+    ) -> Optional[object]:
+        loop = asyncio.get_running_loop()
+        ctx = multiprocessing.get_context("spawn")
+        parent, child = ctx.Pipe(duplex=True)
+        self._process = ctx.Process(
+            target=_child_main, args=(self._kwargs, child), name="neat-trainer", daemon=True
+        )
+        await asyncio.to_thread(self._process.start)
+        child.close()
+        self._conn = parent
+        # Commands issued before the child existed.
+        if self._paused:
+            self._send("pause")
+        if self._stop_requested:
+            self._send("stop")
+
+        messages: asyncio.Queue = asyncio.Queue()
+
+        def reader() -> None:
+            while True:
+                try:
+                    msg = parent.recv()
+                except (EOFError, OSError):
+                    msg = ("exit", None)
+                loop.call_soon_threadsafe(messages.put_nowait, msg)
+                if msg[0] not in ("generation", "progress"):
+                    return
+
+        threading.Thread(target=reader, name="trainer-reader", daemon=True).start()
+        try:
+            while True:
+                kind, payload = await messages.get()
+                if kind == "generation":
+                    report, sent_at = payload
+                    report.phase_seconds["ipc"] = max(0.0, time.time() - sent_at)
+                    if on_generation:
+                        await on_generation(report)
+                elif kind == "progress":
+                    if on_progress:
+                        on_progress(payload)
+                elif kind == "done":
+                    best, self._stop_requested = payload
+                    return best
+                elif kind == "error":
+                    raise RuntimeError(f"Training process failed:\n{payload}")
+                else:
+                    await asyncio.to_thread(self._process.join, 5.0)
+                    raise RuntimeError(
+                        f"Training process exited unexpectedly (code {self._process.exitcode})"
+                    )
+        finally:
+            self._conn = None
+            parent.close()
+            await asyncio.to_thread(self._process.join, 5.0)
+            if self._process.is_alive():
+                logger.warning("Training process did not exit; terminating")
+                self._process.terminate()
@@ -3,13 +3,27 @@
 Mirrors the frontend `GameEngine` physics exactly. Pure Python (no pygame),
 fully seedable, returns a sensor vector each step compatible with
 ``physics.NUM_INPUTS``.
+
+Obstacles, speed and score depend only on the frame count, never on what the
+dino does, so each ``(seed, max_frames)`` world is generated once into a
+read-only ``ObstacleCourse`` (LRU-cached per process by ``get_course``) and
+replayed by both simulators. ``BatchDinoSimulator`` is a NumPy
+structure-of-arrays variant that steps many episodes in lockstep and is
+frame-for-frame identical to ``DinoSimulator``. A ``Recording`` stores an
+episode as its seed plus run-length-encoded actions, enough for
+``replay_episode`` to rebuild it.
 """
 from __future__ import annotations
 
+import itertools
 import math
 import random
+import re
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional
+from functools import cached_property, lru_cache
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from . import physics as P
 
@@ -39,25 +53,69 @@ class SimState:
     clear_timer: int = P.CLEAR_TIME
 
 
+def _draw_gap(rng: random.Random, kind: str, width: float, speed: float) -> int:
+    """Chromium-parity: gap is chosen once per previous-obstacle, in
+    [min_gap, min_gap * MAX_GAP_COEFFICIENT] where
+    min_gap = round(prev.width * speed + type_min * GAP_COEFFICIENT)."""
+    type_min = P.OBSTACLE_MIN_GAP.get(kind, P.MIN_GAP)
+    min_gap = round(width * speed + type_min * P.GAP_COEFFICIENT)
+    max_gap = round(min_gap * P.MAX_GAP_COEFFICIENT)
+    return rng.randint(min_gap, max_gap)
+
+
+def _draw_obstacle(rng: random.Random, score: float) -> Tuple[str, int, int, int]:
+    """Draw the next obstacle's ``(kind, y, width, height)``.
+
+    Shared by both simulators so they consume the RNG stream identically.
+    """
+    kinds = ["cactus_small", "cactus_large"]
+    if score >= P.PTERODACTYL_MIN_SCORE:
+        kinds.append("pterodactyl")
+    kind = rng.choice(kinds)
+
+    if kind == "cactus_small":
+        count = rng.randint(1, P.MAX_OBSTACLE_DUPLICATION)
+        w = P.CACTUS_SMALL_WIDTH * count
+        h = P.CACTUS_SMALL_HEIGHT
+        y = P.GROUND_Y - h
+    elif kind == "cactus_large":
+        count = rng.randint(1, P.MAX_OBSTACLE_DUPLICATION)
+        w = P.CACTUS_LARGE_WIDTH * count
+        h = P.CACTUS_LARGE_HEIGHT
+        y = P.GROUND_Y - h
+    else:  # pterodactyl
+        w = P.PTERODACTYL_WIDTH
+        h = P.PTERODACTYL_HEIGHT
+        y = rng.choice(P.PTERODACTYL_Y_POSITIONS) - h
+    return kind, y, w, h
+
+
 class DinoSimulator:
-    """Deterministic, seedable headless simulator."""
+    """Deterministic, seedable headless simulator.
+
+    With ``course`` the obstacle world is replayed from the precomputed
+    timeline instead of being spawned live; results are identical.
+    """
 
-    def __init__(self, seed: Optional[int] = None, max_frames: int = 60 * 60 * 3):
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        max_frames: int = 60 * 60 * 3,
+        course: Optional["ObstacleCourse"] = None,
+    ):
+        if course is not None and course.max_frames < max_frames:
+            raise ValueError("course is shorter than max_frames")
         self.rng = random.Random(seed if seed is not None else 0)
         self.max_frames = max_frames
+        self.course = course
         self.state = SimState()
 
     # ------------------------------------------------------------------
     def _required_gap(self, prev: Obstacle) -> int:
-        """Chromium-parity: gap is chosen once per previous-obstacle, in
-        [min_gap, min_gap * MAX_GAP_COEFFICIENT] where
-        min_gap = round(prev.width * speed + type_min * GAP_COEFFICIENT)."""
+        """Gap required after ``prev``; drawn lazily, then cached on it."""
         if prev.next_gap > 0:
             return prev.next_gap
-        type_min = P.OBSTACLE_MIN_GAP.get(prev.kind, P.MIN_GAP)
-        min_gap = round(prev.width * self.state.speed + type_min * P.GAP_COEFFICIENT)
-        max_gap = round(min_gap * P.MAX_GAP_COEFFICIENT)
-        prev.next_gap = self.rng.randint(min_gap, max_gap)
+        prev.next_gap = _draw_gap(self.rng, prev.kind, prev.width, self.state.speed)
         return prev.next_gap
 
     def _maybe_spawn(self) -> None:
@@ -73,26 +131,7 @@ class DinoSimulator:
             if prev.x + prev.width > P.CANVAS_WIDTH - gap:
                 return
 
-        kinds = ["cactus_small", "cactus_large"]
-        if s.score >= P.PTERODACTYL_MIN_SCORE:
-            kinds.append("pterodactyl")
-        kind = self.rng.choice(kinds)
-
-        if kind == "cactus_small":
-            count = self.rng.randint(1, P.MAX_OBSTACLE_DUPLICATION)
-            w = P.CACTUS_SMALL_WIDTH * count
-            h = P.CACTUS_SMALL_HEIGHT
-            y = P.GROUND_Y - h
-        elif kind == "cactus_large":
-            count = self.rng.randint(1, P.MAX_OBSTACLE_DUPLICATION)
-            w = P.CACTUS_LARGE_WIDTH * count
-            h = P.CACTUS_LARGE_HEIGHT
-            y = P.GROUND_Y - h
-        else:  # pterodactyl
-            w = P.PTERODACTYL_WIDTH
-            h = P.PTERODACTYL_HEIGHT
-            y = self.rng.choice(P.PTERODACTYL_Y_POSITIONS) - h
-
+        kind, y, w, h = _draw_obstacle(self.rng, s.score)
         s.obstacles.append(Obstacle(
             x=float(P.CANVAS_WIDTH), y=float(y),
             width=float(w), height=float(h), kind=kind,
@@ -135,6 +174,12 @@ class DinoSimulator:
             o.x -= s.speed
         s.obstacles = [o for o in s.obstacles if o.x + o.width > -5]
 
+    def _advance_clock(self) -> None:
+        s = self.state
+        s.score += s.speed * P.SCORE_PER_FRAME
+        s.speed = min(P.MAX_SPEED, s.speed + P.ACCELERATION)
+        s.frames += 1
+
     def _check_collision(self) -> bool:
         s = self.state
         # Tight sub-rect hitbox matches frontend Dino.getBox() insets.
@@ -160,18 +205,19 @@ class DinoSimulator:
             return None
         return min(ahead, key=lambda o: o.x)
 
-    def sensors(self) -> List[float]:
-        s = self.state
+    def obstacle_inputs(self) -> Tuple[float, float, float, float]:
+        """Raw ``(distance, width, height, y)`` of the next obstacle."""
         nxt = self.next_obstacle()
         if nxt is None:
-            dist = float(P.CANVAS_WIDTH)
-            ow = oh = 0.0
-            oy = float(P.GROUND_Y)
+            return float(P.CANVAS_WIDTH), 0.0, 0.0, float(P.GROUND_Y)
+        return nxt.x - P.DINO_X, nxt.width, nxt.height, nxt.y
+
+    def sensors(self) -> List[float]:
+        s = self.state
+        if self.course is not None:
+            dist, ow, oh, oy = self.course.obstacle_rows[s.frames]
         else:
-            dist = nxt.x - P.DINO_X
-            ow = nxt.width
-            oh = nxt.height
-            oy = nxt.y
+            dist, ow, oh, oy = self.obstacle_inputs()
         return P.normalize_sensors(dist, ow, oh, oy, s.speed, s.dino_y)
 
     # ------------------------------------------------------------------
@@ -181,16 +227,17 @@ class DinoSimulator:
             return False
 
         self._update_dino(action)
-        self._update_obstacles()
-        self._maybe_spawn()
+        if self.course is not None:
+            s.obstacles = self.course.obstacle_frames[s.frames + 1]
+        else:
+            self._update_obstacles()
+            self._maybe_spawn()
 
         if self._check_collision():
             s.alive = False
             return False
 
-        s.score += s.speed * P.SCORE_PER_FRAME
-        s.speed = min(P.MAX_SPEED, s.speed + P.ACCELERATION)
-        s.frames += 1
+        self._advance_clock()
         if s.frames >= self.max_frames:
             s.alive = False
             return False
@@ -203,3 +250,371 @@ class DinoSimulator:
             self.step(action)
         # fitness = score + small survival bonus
         return float(self.state.score) + self.state.frames * 0.01
+
+
+# ----------------------------------------------------------------------
+# Precomputed obstacle courses
+# ----------------------------------------------------------------------
+_KINDS = ("cactus_small", "cactus_large", "pterodactyl")
+COURSE_CACHE_SIZE = 32
+
+
+class ObstacleCourse:
+    """Read-only obstacle timeline for one ``(seed, max_frames)`` world.
+
+    Row ``k`` of every array describes the world after ``k`` completed
+    frames: ``speed``/``score`` are ``(F + 1,)``, obstacle geometry is
+    ``(F + 1, slots)`` with an ``active`` mask, and ``next_obstacle`` holds
+    the raw ``(distance, width, height, y)`` sensor inputs. Generated by
+    running the live spawner once without a dino, which never influences
+    the world.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int],
+        max_frames: int,
+        speed: np.ndarray,
+        score: np.ndarray,
+        obs_x: np.ndarray,
+        obs_y: np.ndarray,
+        obs_w: np.ndarray,
+        obs_h: np.ndarray,
+        obs_kind: np.ndarray,
+        active: np.ndarray,
+        next_obstacle: np.ndarray,
+    ) -> None:
+        self.seed = seed
+        self.max_frames = max_frames
+        self.speed = speed
+        self.score = score
+        self.obs_x = obs_x
+        self.obs_y = obs_y
+        self.obs_w = obs_w
+        self.obs_h = obs_h
+        self.obs_kind = obs_kind
+        self.active = active
+        self.next_obstacle = next_obstacle
+        # Hitbox edges (x1, x2, y1, y2) per slot; empty slots sit at +inf so
+        # they can never overlap the dino.
+        self.boxes = np.where(
+            active[..., None],
+            np.stack([obs_x, obs_x + obs_w, obs_y, obs_y + obs_h], axis=-1),
+            np.inf,
+        )
+        # The five world-only sensor columns; only the dino height varies.
+        self.sensor_base = P.normalize_sensors_array(
+            next_obstacle[:, 0], next_obstacle[:, 1], next_obstacle[:, 2], next_obstacle[:, 3],
+            speed, np.zeros_like(speed),
+        )[:, :5]
+        for arr in (
+            speed, score, obs_x, obs_y, obs_w, obs_h, obs_kind, active, next_obstacle,
+            self.boxes, self.sensor_base,
+        ):
+            arr.flags.writeable = False
+
+    @property
+    def slots(self) -> int:
+        return self.obs_x.shape[1]
+
+    @classmethod
+    def generate(cls, seed: Optional[int], max_frames: int) -> "ObstacleCourse":
+        sim = DinoSimulator(seed=seed, max_frames=max_frames)
+        s = sim.state
+        speed = [s.speed]
+        score = [s.score]
+        frames: List[list] = [[]]
+        rows = [sim.obstacle_inputs()]
+        for _ in range(max_frames):
+            sim._update_obstacles()
+            sim._maybe_spawn()
+            sim._advance_clock()
+            speed.append(s.speed)
+            score.append(s.score)
+            frames.append([(o.x, o.y, o.width, o.height, o.kind) for o in s.obstacles])
+            rows.append(sim.obstacle_inputs())
+
+        slots = max(1, max(len(f) for f in frames))
+        shape = (max_frames + 1, slots)
+        obs = {name: np.zeros(shape) for name in ("x", "y", "w", "h")}
+        kind = np.zeros(shape, dtype=np.int8)
+        active = np.zeros(shape, dtype=bool)
+        for k, frame in enumerate(frames):
+            for j, (x, y, w, h, name) in enumerate(frame):
+                obs["x"][k, j] = x
+                obs["y"][k, j] = y
+                obs["w"][k, j] = w
+                obs["h"][k, j] = h
+                kind[k, j] = _KINDS.index(name)
+                active[k, j] = True
+        return cls(
+            seed, max_frames, np.array(speed), np.array(score),
+            obs["x"], obs["y"], obs["w"], obs["h"], kind, active, np.array(rows),
+        )
+
+    # Python-object views for the scalar simulator, built on first use.
+    @cached_property
+    def obstacle_frames(self) -> Tuple[Tuple[Obstacle, ...], ...]:
+        frames = []
+        for k in range(self.max_frames + 1):
+            frames.append(tuple(
+                Obstacle(x, y, w, h, _KINDS[c])
+                for x, y, w, h, c in zip(
+                    self.obs_x[k, self.active[k]].tolist(),
+                    self.obs_y[k, self.active[k]].tolist(),
+                    self.obs_w[k, self.active[k]].tolist(),
+                    self.obs_h[k, self.active[k]].tolist(),
+                    self.obs_kind[k, self.active[k]].tolist(),
+                )
+            ))
+        return tuple(frames)
+
+    @cached_property
+    def obstacle_rows(self) -> List[Tuple[float, float, float, float]]:
+        return [tuple(row) for row in self.next_obstacle.tolist()]
+
+    def spawns(self, frames: Optional[int] = None) -> List[Tuple[int, str, float, float, float]]:
+        """``(frame, kind, y, width, height)`` of each obstacle spawned by ``frames``.
+
+        Spawns enter at ``CANVAS_WIDTH`` and then move with ``speed``, so this
+        list describes the whole world to a client with a different RNG.
+        """
+        last = self.max_frames if frames is None else min(frames, self.max_frames)
+        new = self.active[: last + 1] & (self.obs_x[: last + 1] == P.CANVAS_WIDTH)
+        return [
+            (f, _KINDS[self.obs_kind[f, s]], float(self.obs_y[f, s]), float(self.obs_w[f, s]), float(self.obs_h[f, s]))
+            for f, s in zip(*(idx.tolist() for idx in np.nonzero(new)))
+        ]
+
+
+@lru_cache(maxsize=COURSE_CACHE_SIZE)
+def get_course(seed: Optional[int], max_frames: int) -> ObstacleCourse:
+    """Return the (per-process, LRU-cached) course for ``seed``."""
+    return ObstacleCourse.generate(seed, max_frames)
+
+
+@lru_cache(maxsize=COURSE_CACHE_SIZE)
+def _stacked_courses(seeds: Tuple[Optional[int], ...], max_frames: int) -> dict:
+    """Stack the courses for ``seeds`` into ``(C, F + 1, ...)`` arrays."""
+    courses = [get_course(s, max_frames) for s in seeds]
+    slots = max(c.slots for c in courses)
+    boxes = [
+        np.pad(c.boxes, ((0, 0), (0, slots - c.slots), (0, 0)), constant_values=np.inf)
+        for c in courses
+    ]
+    return {
+        "score": np.stack([c.score for c in courses]),
+        "sensor_base": np.stack([c.sensor_base for c in courses]),
+        "boxes": np.stack(boxes),
+    }
+
+
+# ----------------------------------------------------------------------
+# Vectorized batch simulator
+# ----------------------------------------------------------------------
+ACTION_JUMP, ACTION_DUCK, ACTION_NOOP = range(len(P.ACTIONS))
+
+
+class BatchDinoSimulator:
+    """Step N independent episodes in lockstep with vectorized NumPy updates.
+
+    Dino state lives in ``(N,)`` arrays; the obstacle world of each episode
+    is replayed from its seed's cached ``ObstacleCourse``, so every row
+    reproduces the scalar run frame-for-frame. All live episodes share the
+    same frame counter, which indexes the course timelines. Actions are
+    integer codes indexing ``physics.ACTIONS``.
+    """
+
+    def __init__(self, seeds: Sequence[Optional[int]], max_frames: int = 60 * 60 * 3) -> None:
+        n = len(seeds)
+        self.n = n
+        self.max_frames = max_frames
+        unique = tuple(dict.fromkeys(seeds))
+        self._course = np.array([unique.index(s) for s in seeds], dtype=np.int64)
+        self._world = _stacked_courses(unique, max_frames)
+        self._t = 0  # frame index shared by every live episode
+
+        self.dino_y = np.full(n, float(P.GROUND_Y - P.DINO_HEIGHT))
+        self.dino_vy = np.zeros(n)
+        self.is_ducking = np.zeros(n, dtype=bool)
+        self.frames = np.zeros(n, dtype=np.int64)
+        self.alive = np.ones(n, dtype=bool)
+
+    @property
+    def dino_w(self) -> np.ndarray:
+        return np.where(self.is_ducking, float(P.DINO_WIDTH_DUCK), float(P.DINO_WIDTH))
+
+    @property
+    def dino_h(self) -> np.ndarray:
+        return np.where(self.is_ducking, float(P.DINO_HEIGHT_DUCK), float(P.DINO_HEIGHT))
+
+    @property
+    def score(self) -> np.ndarray:
+        return self._world["score"][self._course, self.frames]
+
+    # ------------------------------------------------------------------
+    # Finished episodes keep being updated below (masking them out costs more
+    # than it saves); only ``frames`` and ``alive`` are frozen, and those are
+    # all that results are read from.
+    def _update_dino(self, actions: np.ndarray) -> None:
+        on_ground = self.dino_y >= P.GROUND_Y - P.DINO_HEIGHT - 0.001
+
+        jump = (actions == ACTION_JUMP) & on_ground & ~self.is_ducking
+        vy = np.where(jump, P.JUMP_VELOCITY, self.dino_vy)
+        duck = actions == ACTION_DUCK
+        # fast-fall when ducking mid-jump
+        vy = np.where(duck & ~on_ground, vy + P.GRAVITY * P.SPEED_DROP_COEFFICIENT, vy)
+        # Duck state (and hitbox size) only changes on the ground.
+        self.is_ducking = np.where(on_ground, duck, self.is_ducking)
+
+        # Apply gravity
+        vy = vy + P.GRAVITY
+        y = self.dino_y + vy
+
+        # Floor clamp
+        floor_y = P.GROUND_Y - self.dino_h
+        land = y > floor_y
+        self.dino_y = np.where(land, floor_y, y)
+        self.dino_vy = np.where(land, 0.0, vy)
+
+    def _check_collision(self, k: int) -> np.ndarray:
+        boxes = self._world["boxes"][self._course, k]  # (N, slots, 4)
+        # Tight sub-rect hitbox matches frontend Dino.getBox() insets.
+        pad_x = 3
+        pad_y = 4
+        dx1 = P.DINO_X + pad_x
+        dy1 = (self.dino_y + pad_y)[:, None]
+        dx2 = (P.DINO_X + self.dino_w - pad_x)[:, None]
+        dy2 = (self.dino_y + self.dino_h - pad_y)[:, None]
+        miss = (dx2 < boxes[..., 0]) | (dx1 > boxes[..., 1])
+        miss |= (dy2 < boxes[..., 2]) | (dy1 > boxes[..., 3])
+        return ~miss.all(axis=1)
+
+    # ------------------------------------------------------------------
+    def sensors(self) -> np.ndarray:
+        """Return an ``(N, NUM_INPUTS)`` sensor matrix, one row per episode."""
+        out = np.empty((self.n, P.NUM_INPUTS))
+        out[:, :5] = self._world["sensor_base"][self._course, self.frames]
+        # Column 5 of ``normalize_sensors``: dino height above the ground.
+        out[:, 5] = np.clip((P.GROUND_Y - self.dino_y) / 100.0, 0.0, 1.0)
+        return out
+
+    def step(self, actions) -> np.ndarray:
+        """Advance every live episode one frame; return the ``alive`` mask."""
+        if not self.alive.any():
+            return self.alive.copy()
+
+        self._update_dino(np.asarray(actions))
+        k = self._t + 1
+        ok = self.alive & ~self._check_collision(k)
+        self.frames[ok] = k
+        self._t = k
+        self.alive = ok if k < self.max_frames else np.zeros(self.n, dtype=bool)
+        return self.alive.copy()
+
+    def stop(self, mask: np.ndarray) -> None:
+        """End the episodes selected by ``mask`` at their current frame."""
+        self.alive = self.alive & ~mask
+
+    def fitness(self) -> np.ndarray:
+        """Per-episode fitness, same formula as ``DinoSimulator.run``."""
+        return self.score + self.frames * 0.01
+
+    def max_fitness(self) -> np.ndarray:
+        """Per-episode fitness if the dino survived to ``max_frames``."""
+        return self._world["score"][self._course, self.max_frames] + self.max_frames * 0.01
+
+    def run(self, policy: Callable[[np.ndarray], Sequence[int]]) -> np.ndarray:
+        """Run all episodes to completion.
+
+        ``policy`` receives the full ``(N, NUM_INPUTS)`` sensor matrix and
+        returns N action codes; rows of finished episodes are ignored.
+        """
+        while self.alive.any():
+            self.step(policy(self.sensors()))
+        return self.fitness()
+
+
+# ----------------------------------------------------------------------
+# Episode recordings
+# ----------------------------------------------------------------------
+_ACTION_LETTERS = "".join(name[0] for name in P.ACTIONS)  # indexed by action code
+_RECORDING = re.compile(f"(?:[1-9][0-9]*[{_ACTION_LETTERS}])*")
+_RUN = re.compile(f"([0-9]+)([{_ACTION_LETTERS}])")
+
+
+@dataclass(frozen=True)
+class Recording:
+    """One episode as its seed plus a run-length-encoded action stream.
+
+    ``actions`` is a string of ``<count><letter>`` runs (``j``ump, ``d``uck,
+    ``n``oop), e.g. ``"52n1j30n"``: the action taken before each step,
+    including the one the episode ended on. ``frames`` and ``fitness`` are
+    the recorded outcome, which a replay must reproduce.
+    """
+
+    seed: int
+    max_frames: int
+    actions: str
+    frames: int
+    fitness: float
+
+
+def encode_actions(codes: Iterable[int]) -> str:
+    """Run-length encode action codes (indexes into ``physics.ACTIONS``)."""
+    return "".join(
+        f"{sum(1 for _ in run)}{_ACTION_LETTERS[code]}" for code, run in itertools.groupby(codes)
+    )
+
+
+def action_codes(actions: str, limit: Optional[int] = None) -> np.ndarray:
+    """Action codes of an ``encode_actions`` string.
+
+    Raises ``ValueError`` if it is malformed or, checked before anything is
+    expanded, longer than ``limit`` steps.
+    """
+    if _RECORDING.fullmatch(actions) is None:
+        raise ValueError("malformed action stream")
+    runs = _RUN.findall(actions)
+    counts = [int(count) for count, _ in runs]
+    if limit is not None and sum(counts) > limit:
+        raise ValueError(f"action stream is longer than {limit} steps")
+    codes = np.array([_ACTION_LETTERS.index(letter) for _, letter in runs], dtype=np.int8)
+    return np.repeat(codes, counts)
+
+
+def decode_actions(actions: str) -> List[str]:
+    """Action names of an ``encode_actions`` string; ``ValueError`` if malformed."""
+    return [P.ACTIONS[code] for code in action_codes(actions).tolist()]
+
+
+def record_episode(
+    policy: Callable[[np.ndarray], Sequence[int]], seed: int, max_frames: int
+) -> Recording:
+    """Run one episode and record it; ``policy`` is as for ``BatchDinoSimulator.run``."""
+    sim = BatchDinoSimulator([seed], max_frames=max_frames)
+    codes: List[int] = []
+    while sim.alive[0]:
+        code = int(policy(sim.sensors())[0])
+        codes.append(code)
+        sim.step([code])
+    return Recording(
+        seed=seed,
+        max_frames=max_frames,
+        actions=encode_actions(codes),
+        frames=int(sim.frames[0]),
+        fitness=float(sim.fitness()[0]),
+    )
+
+
+def replay_episode(recording: Recording) -> DinoSimulator:
+    """Rebuild a recorded episode; returns the simulator in its final state."""
+    sim = DinoSimulator(
+        seed=recording.seed,
+        max_frames=recording.max_frames,
+        course=get_course(recording.seed, recording.max_frames),
+    )
+    for action in decode_actions(recording.actions):
+        if not sim.step(action):
+            break
+    return sim
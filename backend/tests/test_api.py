@@ -64,6 +64,65 @@ async def test_leaderboard_submit_and_list():
         assert any(row["player_name"] == "tester" for row in rows)
 
 
+@pytest.mark.asyncio
+async def test_leaderboard_verifies_replay_logs_in_background():
+    import asyncio
+
+    from app import physics as P
+    from app.simulator import record_episode
+
+    def smart(rows):
+        return [P.ACTIONS.index("jump" if rows[0][0] < 0.18 else "noop")]
+
+    from app.neat.compiled import pack_nets
+    from app.services.net_cache import net_cache
+    from app.services.replay_verifier import replay_models, replay_verifier
+
+    recording = record_episode(smart, 11, 3000)
+    honest = int(recording.fitness - recording.frames * 0.01)
+    await init_db()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        # Browser AI games send the model and seed; the model is played headless.
+        model_id = await _upload_model(ac, "verified-bot")
+        played = replay_models(pack_nets([net_cache.get(model_id)]), [(0, 11)], replay_verifier.max_frames)
+        model_score = int(played[0].score)
+        submissions = [
+            {"score": honest, "seed": 11, "actions": recording.actions},
+            {"score": honest + 50, "seed": 11, "actions": recording.actions},
+            {"score": 10, "seed": 11, "actions": "12q"},
+            {"score": model_score, "seed": 11, "model_id": model_id},
+            {"score": model_score + 50, "seed": 11, "model_id": model_id},
+            {"score": 1, "seed": 11, "model_id": "no-such-model"},
+        ]
+        ids = []
+        for extra in submissions:
+            r = await ac.post("/api/leaderboard", json={"player_name": "bot", "mode": "ai", **extra})
+            assert r.status_code == 200 and r.json()["verification"] == "pending"
+            ids.append(r.json()["id"])
+        r = await ac.post("/api/leaderboard", json={"player_name": "bot", "score": 1, "seed": 3})
+        assert r.status_code == 422
+        human = {"player_name": "p", "score": 1, "seed": 3, "model_id": model_id}
+        assert (await ac.post("/api/leaderboard", json=human)).status_code == 422
+
+        statuses = []
+        for _ in range(400):
+            statuses = [(await ac.get(f"/api/leaderboard/{i}/verification")).json() for i in ids]
+            if all(s["status"] != "pending" for s in statuses):
+                break
+            await asyncio.sleep(0.05)
+        assert [s["status"] for s in statuses] == ["verified", "rejected", "rejected"] * 2
+        assert statuses[0]["verified_score"] == statuses[1]["verified_score"] == honest
+        assert statuses[2]["note"] == "malformed action stream"
+        assert statuses[3]["verified_score"] == statuses[4]["verified_score"] == model_score
+        assert statuses[5]["note"] == "model file missing"
+        assert (await ac.get("/api/leaderboard/verifier")).json()["episodes"] >= 6
+
+        # Disproved scores drop off the board; verified ones stay.
+        board = {row["id"] for row in (await ac.get("/api/leaderboard?mode=ai&limit=100")).json()}
+        assert {ids[0], ids[3]} <= board and not board & {ids[1], ids[2], ids[4], ids[5]}
+
+
 @pytest.mark.asyncio
 async def test_upload_rejects_garbage():
     await init_db()
@@ -83,3 +142,354 @@ async def test_training_status_idle():
         assert r.status_code == 200
         body = r.json()
         assert body["active"] in (False, True)
+
+
+def _genome_bytes() -> bytes:
+    import pickle
+
+    import neat
+
+    from app.neat.config_registry import get_config
+
+    config = get_config()
+    genome = neat.DefaultGenome(1)
+    genome.configure_new(config.genome_config)
+    genome.fitness = 1.0
+    return pickle.dumps(genome)
+
+
+async def _upload_model(ac: AsyncClient, name: str = "tiny") -> str:
+    files = {"file": (f"{name}.pkl", _genome_bytes(), "application/octet-stream")}
+    r = await ac.post("/api/models/upload", data={"name": name, "notes": ""}, files=files)
+    assert r.status_code == 200
+    return r.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_batch_decision_json_and_binary():
+    import struct
+
+    await init_db()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        model_id = await _upload_model(ac)
+        rows = [[0.1 * i] * 6 for i in range(5)]
+
+        r = await ac.post("/api/decision/batch", json={"model_ids": [model_id], "sensors": rows})
+        assert r.status_code == 200
+        body = r.json()
+        assert body["rows"] == 5
+        result = body["results"][0]
+        assert len(result["actions"]) == 5 and len(result["outputs"]) == 5
+        single = await ac.post("/api/decision", json={"model_id": model_id, "sensors": rows[3]})
+        assert result["actions"][3] == single.json()["action"]
+
+        packed = b"".join(struct.pack("<6f", *row) for row in rows)
+        r = await ac.post(
+            f"/api/decision/batch?model_id={model_id}&include_outputs=false",
+            content=packed,
+            headers={"content-type": "application/octet-stream"},
+        )
+        assert r.status_code == 200
+        assert r.json()["results"][0]["actions"] == result["actions"]
+        assert r.json()["results"][0]["outputs"] is None
+
+        r = await ac.post(
+            f"/api/decision/batch?model_id={model_id}",
+            content=packed[:-1],
+            headers={"content-type": "application/octet-stream"},
+        )
+        assert r.status_code == 422
+
+        too_many = [[0.0] * 6] * 4097
+        r = await ac.post("/api/decision/batch", json={"model_ids": [model_id], "sensors": too_many})
+        assert r.status_code == 413
+
+
+def test_play_ws_binary_subprotocol():
+    import struct
+
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as client:
+        files = {"file": ("bin.pkl", _genome_bytes(), "application/octet-stream")}
+        model_id = client.post("/api/models/upload", data={"name": "bin"}, files=files).json()["id"]
+        sensors = [0.3, 0.2, 0.35, 0.6, 0.0, 0.0]
+
+        with client.websocket_connect(f"/api/ws/play/{model_id}") as ws:
+            ws.send_json({"sensors": sensors})
+            expected = ws.receive_json()
+
+        with client.websocket_connect(
+            f"/api/ws/play/{model_id}?outputs=true", subprotocols=["dino.bin.v1"]
+        ) as ws:
+            assert ws.accepted_subprotocol == "dino.bin.v1"
+            for frame_no in (1, 2, 4):
+                ws.send_bytes(struct.pack("<I6f", frame_no, *sensors))
+                code, *outputs = struct.unpack("<B3f", ws.receive_bytes())
+            assert ("jump", "duck", "noop")[code] == expected["action"]
+            assert outputs == pytest.approx(expected["outputs"], abs=1e-5)
+            stats = client.get("/api/inference/stats").json()["sessions"]
+            session = next(s for s in stats if s["protocol"] == "dino.bin.v1")
+            assert session["frames"] == 3 and session["frames_skipped"] == 1
+
+        # Playing a model makes it the first to warm up by recent use.
+        newer = client.post("/api/models/upload", data={"name": "unplayed"}, files=files).json()["id"]
+
+        async def recent():
+            from app.db import AsyncSessionLocal
+            from app.services.model_store import model_store
+
+            async with AsyncSessionLocal() as db:
+                return await model_store.top_model_ids(db, 2, by="recent")
+
+        assert client.portal.call(recent) == [model_id, newer]
+
+
+@pytest.mark.asyncio
+async def test_net_cache_hits_dedupes_and_invalidates():
+    from app.services.net_cache import net_cache
+
+    await init_db()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await _upload_model(ac, "cache-a")
+        before = net_cache.stats()
+        req = {"model_id": first, "sensors": [0.5] * 6}
+        assert (await ac.post("/api/decision", json=req)).status_code == 200
+        assert (await ac.post("/api/decision", json=req)).status_code == 200
+        after = (await ac.get("/api/inference/stats")).json()["net_cache"]
+        assert after["misses"] == before["misses"] + 1
+        assert after["hits"] == before["hits"] + 1
+
+        # Same bytes under another id share the compiled net.
+        files = {"file": ("dup.pkl", _model_bytes(first), "application/octet-stream")}
+        dup = (await ac.post("/api/models/upload", data={"name": "dup"}, files=files)).json()["id"]
+        assert net_cache.get(dup) is net_cache.get(first)
+
+        assert (await ac.delete(f"/api/models/{first}")).status_code == 200
+        assert net_cache.get(dup) is not None
+        r = await ac.post("/api/decision", json=req)
+        assert r.status_code == 404
+
+
+def _model_bytes(model_id: str) -> bytes:
+    from app.services.model_store import model_store
+
+    return model_store.path_for(model_id).read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_training_resume_requires_a_checkpoint():
+    await init_db()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        r = await ac.post("/api/training/no-such-run/resume")
+        assert r.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_training_scheduler_queues_pauses_and_resumes_runs():
+    import asyncio
+
+    from app.config import get_settings
+    from app.schemas import TrainingStartRequest
+    from app.services.training_manager import TrainingManager
+
+    await init_db()
+    manager = TrainingManager()
+    manager.settings = get_settings().model_copy(
+        update={"max_concurrent_runs": 1, "training_worker_budget": 4, "checkpoint_every_seconds": 0}
+    )
+    first = await manager.start(TrainingStartRequest(population_size=8, max_generations=2))
+    second = await manager.start(TrainingStartRequest(population_size=8, max_generations=2))
+    assert (first.state, first.workers, second.state) == ("running", 4, "queued")
+
+    # Pausing frees the only slot; resuming puts the run back in the queue.
+    assert await manager.pause(first.run_id)
+    assert (first.state, second.state) == ("paused", "running")
+    await manager.resume(first.run_id)
+    assert first.state == "queued"
+
+    sub = await manager.subscribe(first.run_id)
+    for _ in range(200):
+        if not manager.is_active:
+            break
+        await asyncio.sleep(0.05)
+    assert (first.state, second.state) == ("finished", "finished")
+    events = [sub.get_nowait().type for _ in range(sub.pending)]
+    assert events[:3] == ["queued", "start", "paused"]
+    assert events[-1] == "finished"
+
+
+@pytest.mark.asyncio
+async def test_sweep_runs_variants_and_ranks_them(monkeypatch):
+    import asyncio
+
+    from app.services.sweep_manager import sweep_manager
+
+    # Seeded trials must never overlap, or they would share the RNG.
+    in_flight = [0, 0]  # now, most
+    run_trial = sweep_manager._run_trial
+
+    async def counted(sweep, trial):
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        try:
+            await run_trial(sweep, trial)
+        finally:
+            in_flight[0] -= 1
+
+    monkeypatch.setattr(sweep_manager, "_run_trial", counted)
+    await init_db()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        body = {
+            "name": "tiny",
+            "space": {"population_size": [8], "mutation_rate": [0.2, 0.9]},
+            "seed": 5,
+            "max_generations": 2,
+        }
+        r = await ac.post("/api/sweeps", json=body)
+        assert r.status_code == 200
+        sweep_id = r.json()["sweep_id"]
+        assert r.json()["total_trials"] == 2
+
+        for _ in range(200):
+            status = (await ac.get(f"/api/sweeps/{sweep_id}")).json()
+            if status["status"] != "running":
+                break
+            await asyncio.sleep(0.05)
+        assert status["status"] == "finished"
+        variants = status["variants"]
+        assert [v["rank"] for v in variants] == [1, 2]
+        means = [v["mean_best_fitness"] for v in variants]
+        assert means == sorted(means, reverse=True)
+        assert all(len(v["curves"][0]) == 2 and v["best_model_id"] for v in variants)
+        assert status["best_model_id"] == variants[0]["best_model_id"]
+        assert in_flight[1] == 1
+
+        # 14 variants x 5 repeats is over the per-sweep run limit.
+        too_big = {**body, "repeats": 5, "space": {"population_size": list(range(8, 36, 2))}}
+        assert (await ac.post("/api/sweeps", json=too_big)).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_training_streams_and_persists_performance_metrics():
+    import asyncio
+
+    from app.services.training_manager import training_manager
+
+    await init_db()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        r = await ac.post("/api/training/start", json={"population_size": 8, "max_generations": 2})
+        run_id = r.json()["run_id"]
+        sub = await training_manager.subscribe(run_id)
+        events = []
+        while not events or events[-1]["type"] not in ("finished", "stopped", "error"):
+            events.append((await asyncio.wait_for(sub.get(), timeout=60)).update.model_dump())
+        training_manager.unsubscribe(sub)
+        generations = [e for e in events if e["type"] == "generation"]
+        assert len(generations) == 2
+        for evt in generations:
+            assert {"compile", "evaluate", "reproduce", "speciate"} <= set(evt["phase_seconds"])
+            assert evt["frames_per_second"] > 0 and evt["genomes_per_second"] > 0
+            assert evt["worker_utilization"] and all(0 < u <= 1 for u in evt["worker_utilization"])
+            assert evt["max_genome_size"] >= evt["mean_genome_size"] > 0
+
+        metrics = (await ac.get(f"/api/training/{run_id}/metrics")).json()
+        assert metrics["generations"] == 2
+        assert metrics["phase_seconds"]["evaluate"] > 0
+        assert (await ac.get("/api/training/no-such-run/metrics")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_generation_history_keeps_good_rows_when_a_batch_fails(monkeypatch):
+    from app.schemas import TrainingUpdate
+    from app.services import generation_history as module
+    from app.services.fanout import Event
+    from app.services.generation_history import GenerationHistory
+
+    def event(run_id, generation):
+        return Event.encode(TrainingUpdate(run_id=run_id, type="generation", generation=generation))
+
+    await init_db()
+    history = GenerationHistory(batch_size=100, flush_interval=60.0)
+    history.add(event("gh-a", 1))
+    await history.flush()
+
+    # A duplicate generation costs only its own row, not the other runs' rows.
+    for run_id, generation in (("gh-a", 1), ("gh-a", 2), ("gh-b", 1)):
+        history.add(event(run_id, generation))
+    await history.flush()
+    assert (history.rows_written, history.rows_dropped, history.pending) == (3, 1, 0)
+    assert [u.generation for u in await history.page("gh-a")] == [1, 2]
+    assert [u.generation for u in await history.page("gh-b")] == [1]
+
+    # Rows that failed for another reason are queued again and retried.
+    session_factory = module.AsyncSessionLocal
+
+    def unavailable():
+        raise OSError("database unavailable")
+
+    monkeypatch.setattr(module, "AsyncSessionLocal", unavailable)
+    history.add(event("gh-b", 2))
+    await history.flush()
+    assert (history.pending, history.retries) == (1, 1) and history._timer is not None
+    monkeypatch.setattr(module, "AsyncSessionLocal", session_factory)
+    assert [u.generation for u in await history.page("gh-b")] == [1, 2]
+    assert history.pending == 0 and history._timer is None
+
+
+@pytest.mark.asyncio
+async def test_generation_history_pages_and_replays_by_cursor():
+    import asyncio
+
+    from app.services.training_manager import training_manager
+
+    await init_db()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        r = await ac.post("/api/training/start", json={"population_size": 8, "max_generations": 3})
+        run_id = r.json()["run_id"]
+        for _ in range(400):
+            if (await ac.get(f"/api/training/{run_id}/status")).json()["state"] == "finished":
+                break
+            await asyncio.sleep(0.05)
+
+        url = f"/api/training/runs/{run_id}/generations"
+        page = (await ac.get(url, params={"limit": 2})).json()
+        assert [g["generation"] for g in page["items"]] == [1, 2]
+        assert page["next_cursor"] == 2
+        page = (await ac.get(url, params={"after": page["next_cursor"]})).json()
+        assert [g["generation"] for g in page["items"]] == [3] and page["next_cursor"] is None
+        page = (await ac.get(url, params={"start": 2, "end": 2})).json()
+        assert [g["generation"] for g in page["items"]] == [2]
+        assert page["items"][0]["best_fitness"] > 0
+        assert (await ac.get("/api/training/runs/no-such-run/generations")).status_code == 404
+
+        # Each generation's champion is recorded and served as cacheable static content.
+        replays = (await ac.get(f"/api/training/runs/{run_id}/replays")).json()
+        assert [r["generation"] for r in replays] == [1, 2, 3]
+        r = await ac.get(f"/api/training/runs/{run_id}/replays/3")
+        assert r.status_code == 200 and "no-cache" in r.headers["cache-control"]
+        replay = r.json()
+        assert replay["frames"] == replays[-1]["frames"] and replay["actions"]
+        assert replay["obstacles"][0][0] > 0 and replay["obstacles"][0][1].startswith("cactus")
+        r = await ac.get(
+            f"/api/training/runs/{run_id}/replays/3", headers={"If-None-Match": r.headers["etag"]}
+        )
+        assert r.status_code == 304
+        assert (await ac.get(f"/api/training/runs/{run_id}/replays/9")).status_code == 404
+
+    # Full replay: every event in order; with a cursor only what came after.
+    sub = await training_manager.subscribe(run_id)
+    replay = [sub.get_nowait().update for _ in range(sub.pending)]
+    assert [(e.type, e.generation) for e in replay] == [
+        ("queued", 0), ("start", 0), ("generation", 1), ("generation", 2), ("generation", 3), ("finished", 3)
+    ]
+    training_manager.unsubscribe(sub)
+    sub = await training_manager.subscribe(run_id, after=2)
+    assert [sub.get_nowait().type for _ in range(sub.pending)] == ["generation", "finished"]
+    training_manager.unsubscribe(sub)
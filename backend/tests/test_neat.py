@@ -0,0 +1,333 @@
+import random
+from pathlib import Path
+
+import neat
+import numpy as np
+import pytest
+
+from app.neat.compiled import compile_genome, pack_nets, unpack_nets
+from app.neat.config_registry import fresh_config
+from app.neat.inference import build_net, decide
+from app.neat.trainer import EVAL_MAX_FRAMES, EVAL_SEEDS, evaluate_genomes
+from app.simulator import DinoSimulator
+
+
+def _config() -> neat.Config:
+    return fresh_config()
+
+
+def _mutated_genomes(config: neat.Config, count: int = 12, mutations: int = 25) -> list:
+    random.seed(1234)
+    genomes = []
+    for key in range(count):
+        g = neat.DefaultGenome(key)
+        g.configure_new(config.genome_config)
+        for _ in range(mutations):
+            g.mutate(config.genome_config)
+        genomes.append(g)
+    return genomes
+
+
+def test_compiled_net_matches_feed_forward_network():
+    config = _config()
+    rng = np.random.default_rng(0)
+    inputs = rng.random((64, 6))
+    for g in _mutated_genomes(config):
+        ref = neat.nn.FeedForwardNetwork.create(g, config)
+        net = compile_genome(g, config)
+        expected = np.array([ref.activate(row) for row in inputs.tolist()])
+        np.testing.assert_allclose(net.activate_batch(inputs), expected, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(net.activate(inputs[0].tolist()), expected[0], rtol=0, atol=1e-12)
+
+
+def test_packed_nets_round_trip():
+    import pickle
+
+    config = _config()
+    rng = np.random.default_rng(1)
+    inputs = rng.random((16, 6))
+    nets = [compile_genome(g, config) for g in _mutated_genomes(config, count=8)]
+    packed = pickle.loads(pickle.dumps(pack_nets(nets)))
+    assert packed.count == len(nets)
+    for net, unpacked in zip(nets, unpack_nets(packed)):
+        np.testing.assert_array_equal(unpacked.activate_batch(inputs), net.activate_batch(inputs))
+
+
+def test_decide_returns_action_and_outputs():
+    config = _config()
+    net = build_net(_mutated_genomes(config, count=1)[0], config)
+    action, outputs = decide(net, [0.5] * 6)
+    assert action in ("jump", "duck", "noop")
+    assert len(outputs) == 3 and all(isinstance(x, float) for x in outputs)
+
+
+def test_evaluate_genomes_matches_scalar_simulation():
+    config = _config()
+    genomes = _mutated_genomes(config, count=6, mutations=5)
+    fitnesses = evaluate_genomes(genomes, config)
+    for g, fitness in zip(genomes, fitnesses):
+        ref = neat.nn.FeedForwardNetwork.create(g, config)
+
+        def policy(sensors):
+            outputs = ref.activate(sensors)
+            return ("jump", "duck", "noop")[outputs.index(max(outputs))]
+
+        scores = [DinoSimulator(seed=s, max_frames=EVAL_MAX_FRAMES).run(policy) for s in EVAL_SEEDS]
+        assert fitness == pytest.approx(sum(scores) / len(scores))
+
+
+def test_config_registry_overrides_in_memory():
+    from app.neat.config_registry import get_config
+
+    base = get_config()
+    assert get_config() is base
+    tuned = get_config({"pop_size": 12, "survival_threshold": 0.3, "compatibility_threshold": 2.5})
+    assert tuned is get_config({"compatibility_threshold": 2.5, "survival_threshold": 0.3, "pop_size": 12})
+    assert (tuned.pop_size, base.pop_size) == (12, 50)
+    assert tuned.reproduction_config.survival_threshold == 0.3
+    assert tuned.species_set_config.compatibility_threshold == 2.5
+    assert base.species_set_config.compatibility_threshold != 2.5
+    assert get_config({"conn_add_prob": 0.25}).genome_config.conn_add_prob == 0.25
+    assert base.genome_config.conn_add_prob == 0.5
+    with pytest.raises(KeyError):
+        get_config({"no_such_item": 1})
+
+
+def test_config_overrides_never_touch_disk(tmp_path):
+    import shutil
+
+    from app.config import get_settings
+    from app.neat.config_registry import get_config
+
+    path = tmp_path / "config.ini"
+    shutil.copy(get_settings().neat_config_path, path)
+    base = get_config(path=path)
+    path.unlink()  # variants are built from the parsed base alone
+    tuned = get_config({"pop_size": 7, "reset_on_extinction": "true", "conn_add_prob": 0.1}, path=path)
+    assert tuned.pop_size == 7 and tuned.reset_on_extinction is True
+    assert tuned.genome_config.conn_add_prob == 0.1
+    assert tuned.species_set_config is not base.species_set_config
+    assert (base.pop_size, base.genome_config.conn_add_prob) == (50, 0.5)
+
+    fresh = fresh_config({"pop_size": 12})
+    assert fresh.pop_size == 12 and fresh.genome_config is not get_config({"pop_size": 12}).genome_config
+
+
+def test_fitness_cache_reuses_identical_networks():
+    import copy
+
+    from app.neat.fitness_cache import FitnessCache, genome_signature
+    from app.neat.trainer import NeatTrainer
+
+    config = _config()
+    genomes = _mutated_genomes(config, count=4, mutations=5)
+    clone = copy.deepcopy(genomes[0])
+    clone.fitness = 123.0
+    assert genome_signature(clone) == genome_signature(genomes[0])
+    next(iter(clone.connections.values())).weight += 0.5
+    assert genome_signature(clone) != genome_signature(genomes[0])
+
+    trainer = NeatTrainer(Path("unused"), fitness_cache_size=16)
+    twin = copy.deepcopy(genomes[1])
+    assert trainer._evaluate(genomes + [twin], config, None).cache_hits == 0
+    assert twin.fitness == genomes[1].fitness
+    assert len(trainer.fitness_cache) == 4
+    expected = [g.fitness for g in genomes]
+    for g in genomes:
+        g.fitness = None
+    assert trainer._evaluate(genomes, config, None).cache_hits == 4
+    assert [g.fitness for g in genomes] == expected
+
+    bounded = FitnessCache(scope="s", max_entries=2)
+    for i in range(3):
+        bounded.put(bytes([i]), float(i))
+    assert bounded.get(bytes([0])) is None and bounded.get(bytes([2])) == 2.0
+
+
+def test_racing_censors_only_hopeless_genomes():
+    from app.neat.trainer import evaluate_nets
+
+    config = _config()
+    nets = [compile_genome(g, config) for g in _mutated_genomes(config, count=12, mutations=10)]
+    full = evaluate_nets(nets)
+    assert not any(full.censored) and full.frames_saved == 0
+
+    # Above a third of the best-case fitness, losing any one seed is fatal.
+    raced = evaluate_nets(nets, cutoff=200.0)
+    assert any(raced.censored) and raced.frames_saved > 0
+    assert raced.frames_simulated < full.frames_simulated
+    for exact, fitness, censored in zip(full.fitness, raced.fitness, raced.censored):
+        if censored:
+            assert fitness <= exact
+        else:
+            assert fitness == exact
+
+
+def test_serial_progress_counts_every_genome_sharing_a_net():
+    from app.neat.trainer import ProgressMeter, evaluate_nets
+
+    config = _config()
+    nets = [compile_genome(g, config) for g in _mutated_genomes(config, count=6, mutations=10)]
+    copies = [3, 1, 2, 1, 1, 4]
+    reports = []
+    meter = ProgressMeter(reports.append, generation=1, total=sum(copies), interval=0.0)
+    result = evaluate_nets(nets, progress=meter, copies=copies)
+    weighted = {}  # evaluated count -> mean fitness, for every set of finished nets
+    for done in range(1 << len(nets)):
+        picked = [i for i in range(len(nets)) if done >> i & 1]
+        count = sum(copies[i] for i in picked)
+        weighted.setdefault(count, []).append(
+            sum(result.fitness[i] * copies[i] for i in picked) / count if count else 0.0
+        )
+    assert any(r.evaluated for r in reports)
+    for r in reports:
+        assert r.evaluated in weighted and any(r.mean_fitness == pytest.approx(m) for m in weighted[r.evaluated])
+
+
+def test_steady_state_run_reports_every_population_of_evaluations():
+    import asyncio
+
+    from app.config import get_settings
+    from app.neat.trainer import NeatTrainer
+
+    random.seed(7)
+    trainer = NeatTrainer(
+        get_settings().neat_config_path, population_size=12, max_generations=3, mode="steady_state"
+    )
+    reports = []
+
+    async def on_generation(report):
+        reports.append(report)
+
+    best = asyncio.run(trainer.run(on_generation=on_generation))
+    assert [r.generation for r in reports] == [1, 2, 3]
+    assert all(r.population_size == 12 for r in reports)
+    # The champion is never culled, so best fitness never decreases.
+    assert [r.best_fitness for r in reports] == sorted(r.best_fitness for r in reports)
+    assert best.fitness == reports[-1].best_fitness
+
+
+@pytest.mark.parametrize("mode", ["generational", "steady_state"])
+def test_progress_reports_stream_within_each_generation(mode):
+    import asyncio
+
+    from app.config import get_settings
+    from app.neat.trainer import NeatTrainer
+
+    random.seed(3)
+    trainer = NeatTrainer(
+        get_settings().neat_config_path,
+        population_size=12,
+        max_generations=2,
+        mode=mode,
+        progress_interval=1e-6,  # report at every opportunity
+    )
+    events = []
+
+    async def on_generation(report):
+        events.append(("generation", report))
+
+    best = asyncio.run(
+        trainer.run(on_generation=on_generation, on_progress=lambda r: events.append(("progress", r)))
+    )
+    assert best is not None
+    for generation in (1, 2):
+        progress = [r for kind, r in events if kind == "progress" and r.generation == generation]
+        assert progress and all(r.total == 12 and 0 <= r.evaluated <= 12 for r in progress)
+        assert [r.evaluated for r in progress] == sorted(r.evaluated for r in progress)
+        assert progress[-1].evaluated > 0
+        assert [r.frames_simulated for r in progress] == sorted(r.frames_simulated for r in progress)
+        assert all(r.best_fitness >= r.mean_fitness for r in progress if r.evaluated)
+        # Every progress tick precedes the generation's report.
+        last = max(i for i, (kind, r) in enumerate(events) if kind == "progress" and r.generation == generation)
+        report = next(i for i, (kind, r) in enumerate(events) if kind == "generation" and r.generation == generation)
+        assert last < report
+
+
+def test_checkpoint_resume_continues_the_same_run(tmp_path, monkeypatch):
+    import asyncio
+
+    from app.config import get_settings
+    from app.neat import checkpoint
+    from app.neat import trainer as trainer_module
+    from app.neat.trainer import NeatTrainer
+
+    def train(max_generations, **kwargs):
+        trainer = NeatTrainer(
+            get_settings().neat_config_path,
+            population_size=10,
+            max_generations=max_generations,
+            checkpoint_every_seconds=0,
+            **kwargs,
+        )
+        reports = []
+
+        async def on_generation(report):
+            reports.append(report)
+
+        best = asyncio.run(trainer.run(on_generation=on_generation))
+        return best, reports
+
+    random.seed(11)
+    best, reports = train(4)
+
+    random.seed(11)
+    train(2, checkpoint_dir=tmp_path, checkpoint_every_generations=1, checkpoint_keep=1)
+    saved = checkpoint.list_checkpoints(tmp_path)
+    assert [checkpoint.generation_of(p) for p in saved] == [2]
+
+    random.seed(999)  # restored from the checkpoint
+    resumed_best, resumed = train(4, resume_from=saved[-1])
+    assert [r.generation for r in resumed] == [3, 4]
+    assert [r.best_fitness for r in resumed] == [r.best_fitness for r in reports[2:]]
+    assert resumed_best.fitness == best.fitness
+
+    # With another run active in the process, the shared RNG is left alone.
+    restored, seeded = [], []
+    monkeypatch.setattr(random, "setstate", restored.append)
+    monkeypatch.setattr(random, "seed", seeded.append)
+    monkeypatch.setattr(trainer_module, "_active_runs", 1)
+    train(3, resume_from=saved[-1])
+    train(1, seed=5)
+    assert restored == [] and seeded == [] and trainer_module._active_runs == 1
+
+
+def test_warm_start_reconciles_node_ids_and_keeps_sources():
+    import asyncio
+
+    from app.config import get_settings
+    from app.neat.trainer import NeatTrainer
+    from app.neat.warm_start import reconcile_genomes
+
+    config = _config()
+    # Trained in separate runs: each source numbers its hidden nodes from scratch.
+    sources = []
+    for _ in range(2):
+        own = _config()
+        g = _mutated_genomes(own, count=1)[0]
+        for _ in range(3):
+            g.mutate_add_node(own.genome_config)
+        sources.append(g)
+    assert set(sources[0].nodes) == set(sources[1].nodes)
+    reconciled = reconcile_genomes(sources, config.genome_config)
+    hidden = [set(g.nodes) - set(config.genome_config.output_keys) for g in reconciled]
+    assert hidden[0] and hidden[1] and not hidden[0] & hidden[1]
+    sensors = np.random.default_rng(0).uniform(0.0, 1.0, size=(8, config.genome_config.num_inputs))
+    for original, copy_ in zip(sources, reconciled):
+        np.testing.assert_allclose(
+            compile_genome(copy_, config).activate_batch(sensors),
+            compile_genome(original, config).activate_batch(sensors),
+        )
+
+    source_fitness = evaluate_genomes(sources, config)
+    trainer = NeatTrainer(
+        get_settings().neat_config_path, population_size=10, max_generations=1, seed_genomes=sources
+    )
+    reports = []
+
+    async def on_generation(report):
+        reports.append(report)
+
+    asyncio.run(trainer.run(on_generation=on_generation))
+    assert reports[0].population_size == 10
+    assert reports[0].best_fitness >= max(source_fitness)
@@ -0,0 +1,287 @@
+import asyncio
+import random
+import sys
+
+import neat
+import pytest
+
+from app.neat.config_registry import get_config
+from app.neat.inference import build_net, decide
+from app.services.inference_scheduler import InferenceScheduler
+
+
+def _net():
+    config = get_config()
+    genome = neat.DefaultGenome(1)
+    genome.configure_new(config.genome_config)
+    return build_net(genome, config)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_batches_concurrent_decisions_per_model():
+    nets = {"a": _net(), "b": _net()}
+    scheduler = InferenceScheduler(window_seconds=0.005)
+    rng = random.Random(3)
+    rows = [[rng.random() for _ in range(6)] for _ in range(12)]
+    models = ["a" if i % 3 else "b" for i in range(12)]
+
+    results = await asyncio.gather(
+        *(scheduler.decide(m, nets[m], row) for m, row in zip(models, rows))
+    )
+
+    for m, row, (action, outputs) in zip(models, rows, results):
+        ref_action, ref_outputs = decide(nets[m], row)
+        assert action == ref_action
+        assert outputs == pytest.approx(ref_outputs)
+    stats = scheduler.stats()
+    assert stats["batches"] == 2
+    assert stats["decisions"] == 12
+    assert stats["max_batch_size"] == 8
+
+
+@pytest.mark.asyncio
+async def test_scheduler_isolates_bad_frames_and_stale_nets():
+    old, new = _net(), _net()  # the same model id before and after a re-upload
+    scheduler = InferenceScheduler(window_seconds=0.005)
+    rng = random.Random(5)
+    rows = [[rng.random() for _ in range(6)] for _ in range(6)]
+
+    results = await asyncio.gather(
+        scheduler.decide("m", old, rows[0]),
+        scheduler.decide("m", new, rows[1]),
+        scheduler.decide("m", old, rows[2][:4]),  # wrong length: rejected before queueing
+        scheduler.decide("m", old, rows[3][:5] + ["x"]),  # fails the batch; decided alone
+        scheduler.decide("m", old, rows[4]),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[2], ValueError) and isinstance(results[3], Exception)
+    for i, net in ((0, old), (1, new), (4, old)):
+        assert results[i][0] == decide(net, rows[i])[0]
+        assert results[i][1] == pytest.approx(decide(net, rows[i])[1])
+    assert scheduler.stats()["batches"] == 2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="evaluation pool is disabled on Windows")
+def test_eval_pool_schedules_tasks_and_restarts():
+    from pathlib import Path
+
+    from app.neat.trainer import NeatTrainer, evaluate_genomes
+    from app.services.eval_pool import EvaluationPool
+
+    config = get_config()
+    genomes = []
+    for key in range(6):
+        g = neat.DefaultGenome(key)
+        g.configure_new(config.genome_config)
+        genomes.append(g)
+    serial = evaluate_genomes(genomes, config)
+
+    pool = EvaluationPool(workers=2, max_tasks_per_child=1)
+    try:
+        assert pool.ensure_healthy() and pool.healthy()
+        trainer = NeatTrainer(Path("unused"), workers=2, fitness_cache_size=0)
+        stats = trainer._evaluate(genomes, config, pool)
+        assert [g.fitness for g in genomes] == serial
+        assert stats.frames_simulated > 0 and stats.load_imbalance >= 0.0
+        # Episode lengths are remembered for longest-first ordering.
+        assert trainer._expected_frames(genomes[0], 0) < 2700
+        # Workers are recycled after every task batch and keep answering.
+        trainer._evaluate(genomes, config, pool)
+        assert [g.fitness for g in genomes] == serial
+
+        pool._pool.terminate()
+        assert not pool.healthy()
+        assert pool.ensure_healthy() and pool.stats()["restarts"] == 1
+    finally:
+        pool.close()
+    assert not pool.running
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="evaluation pool is disabled on Windows")
+def test_eval_pool_is_not_restarted_under_a_running_generation():
+    import threading
+    import time
+    from pathlib import Path
+
+    from app.neat.trainer import NeatTrainer, evaluate_genomes
+    from app.services.eval_pool import EvaluationPool
+
+    config = get_config()
+    genomes = []
+    for key in range(12):
+        g = neat.DefaultGenome(key)
+        g.configure_new(config.genome_config)
+        genomes.append(g)
+    serial = evaluate_genomes(genomes, config)
+
+    pool = EvaluationPool(workers=2)
+    # A ping queued behind a generation's tasks would time out at once.
+    pool.HEALTH_TIMEOUT_SECONDS = 0.001
+    try:
+        assert pool.ensure_healthy()
+        trainer = NeatTrainer(Path("unused"), workers=2, fitness_cache_size=0)
+        first_run = threading.Thread(target=trainer._evaluate, args=(genomes, config, pool))
+        first_run.start()
+        deadline = time.monotonic() + 30
+        while not pool.busy and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert pool.busy
+        # A second run starting now checks the pool the way ``_schedule`` does.
+        assert pool.ensure_healthy() and pool.restarts == 0
+        first_run.join(60)
+        assert not first_run.is_alive()
+        assert [g.fitness for g in genomes] == serial and not pool.busy
+
+        # Tasks lost with a replaced pool fail instead of hanging their run.
+        lost = []
+        pool.apply_async(time.sleep, (5,), error_callback=lost.append)
+        pool._pool.terminate()
+        pool._abandon("Evaluation pool was restarted")
+        assert len(lost) == 1 and isinstance(lost[0], RuntimeError) and not pool.busy
+
+        # A task whose worker died never answers; past its deadline it stops
+        # holding the pool busy and the next check restarts the pool.
+        pool.ensure_healthy()
+        restarts, pool.TASK_TIMEOUT_SECONDS = pool.restarts, 0.2
+        pool.apply_async(time.sleep, (30,), error_callback=lost.append)
+        assert pool.busy and pool.ensure_healthy() and pool.restarts == restarts
+        time.sleep(0.3)
+        assert not pool.busy
+        assert pool.ensure_healthy() and pool.restarts == restarts + 1
+        assert len(lost) == 2 and pool.stats()["in_flight"] == 0
+    finally:
+        pool.close()
+
+
+def test_fair_shares_split_budget_by_priority():
+    from app.services.training_manager import fair_shares
+
+    assert fair_shares(7, [1, 1]) == [4, 3]
+    assert fair_shares(8, [3, 1]) == [6, 2]
+    assert sum(fair_shares(10, [2, 5, 3])) == 10
+    # Every running run gets at least one worker, even over budget.
+    assert fair_shares(2, [1, 1, 1]) == [1, 1, 1]
+    assert fair_shares(4, []) == []
+
+
+def test_sweep_space_expansion_and_median_stopping():
+    from app.schemas import SweepRequest, SweepSpace
+    from app.services.sweep_manager import expand_space, should_stop
+
+    space = SweepSpace(population_size=[20, 40], mutation_rate=[0.5, 0.8, 0.5])
+    grid = expand_space(SweepRequest(space=space), random.Random(0))
+    assert len(grid) == 4  # duplicates collapse
+    assert {(p["population_size"], p["mutation_rate"]) for p in grid} == {
+        (20, 0.5), (20, 0.8), (40, 0.5), (40, 0.8)
+    }
+    sample = expand_space(SweepRequest(space=space, search="random", samples=3), random.Random(0))
+    assert len(sample) == 3 and all(p in grid for p in sample)
+
+    peers = [[5.0, 9.0, 12.0], [4.0, 8.0], [1.0]]
+    assert not should_stop([1.0], peers, grace=2)  # within grace
+    assert should_stop([1.0, 2.0], peers, grace=2)  # below median 8.5
+    assert not should_stop([1.0, 9.0], peers, grace=2)
+    assert not should_stop([0.0, 0.0, 0.0], peers, grace=2)  # one peer reached gen 3
+
+
+@pytest.mark.asyncio
+async def test_process_trainer_streams_reports_and_stops():
+    from app.config import get_settings
+    from app.neat.trainer import NeatTrainer
+    from app.services.loop_monitor import LoopLagMonitor
+    from app.services.training_process import ProcessTrainer
+
+    # Reference: the same serial training in a thread of this process.
+    monitor = LoopLagMonitor(interval=0.01)
+    monitor.start()
+    await NeatTrainer(
+        get_settings().neat_config_path, population_size=30, max_generations=2, workers=1
+    ).run()
+    await monitor.stop()
+    in_process = monitor.stats()
+    monitor.reset()
+    monitor.start()
+    trainer = ProcessTrainer(
+        base_config_path=get_settings().neat_config_path, population_size=8, max_generations=50
+    )
+    reports = []
+
+    async def on_generation(report):
+        reports.append(report)
+        if len(reports) == 2:
+            trainer.request_stop()
+
+    best = await trainer.run(on_generation=on_generation)
+    await monitor.stop()
+
+    assert [r.generation for r in reports[:2]] == [1, 2] and len(reports) < 50
+    assert trainer.stop_requested
+    assert best.fitness == max(r.best_fitness for r in reports)
+    # In a thread, training holds the GIL and the loop's tail wakeups wait out
+    # a switch interval; in the child it does not share the GIL at all.
+    stats = monitor.stats()
+    assert stats["samples"] > 0 and in_process["samples"] > 0
+    assert stats["p99_ms"] < in_process["p99_ms"]
+
+
+@pytest.mark.asyncio
+async def test_fanout_hub_coalesces_ticks_for_slow_subscribers():
+    from app.schemas import TrainingUpdate
+    from app.services.fanout import Event, FanoutHub
+
+    hub = FanoutHub(coalesce_after=4, max_pending=6)
+    fast = hub.subscribe("run")
+    slow = hub.subscribe("run")
+    everything = hub.subscribe(None, coalesce=False)
+
+    delivered = []
+    for gen in range(1, 11):
+        event = Event.encode(TrainingUpdate(run_id="run", type="generation", generation=gen))
+        hub.publish(event)
+        delivered.append(fast.get_nowait())
+    hub.publish(Event.encode(TrainingUpdate(run_id="run", type="finished", generation=10)))
+
+    # One encoding shared by every subscriber.
+    assert delivered[-1].data is slow._pending[-2][0].data
+    assert [e.update.generation for e in delivered] == list(range(1, 11))
+    # The slow one keeps the first ticks, then only the newest, then the terminal event.
+    assert [slow.get_nowait().update.generation for _ in range(slow.pending)] == [1, 2, 3, 10, 10]
+    assert slow.stats()["coalesced"] == 6
+    # Without coalescing the backlog is capped by dropping the oldest events.
+    types = [everything.get_nowait().type for _ in range(everything.pending)]
+    assert len(types) == 6 and types[-1] == "finished"
+    assert everything.stats()["dropped"] == 5
+    assert everything.stats()["max_lag_ms"] >= 0.0
+
+    hub.unsubscribe(fast)
+    assert {s["id"] for s in hub.stats()} == {slow.id, everything.id}
+    waiter = asyncio.create_task(slow.get())
+    await asyncio.sleep(0)
+    hub.publish(Event.encode(TrainingUpdate(run_id="run", type="stopped")))
+    assert (await asyncio.wait_for(waiter, 1)).type == "stopped"
+
+
+def test_replay_logs_match_recordings():
+    from app import physics as P
+    from app.services.replay_verifier import judge, replay_logs
+    from app.simulator import record_episode
+
+    def smart(rows):
+        s = rows[0]
+        return [P.ACTIONS.index("jump" if s[0] < 0.18 else "noop")]
+
+    recordings = [record_episode(smart, seed, 3000) for seed in (1, 2, 2, 5)]
+    logs = [(r.seed, r.actions) for r in recordings] + [(2, "12n3"), (2, "4000n"), (2, "")]
+    results = replay_logs(logs, 3000)
+
+    for recording, result in zip(recordings, results):
+        assert result.error is None
+        assert (result.frames, result.score + result.frames * 0.01) == (recording.frames, recording.fitness)
+    assert sum(r.frames for r in results) == sum(r.frames for r in recordings)
+    assert results[4].error and results[5].error and (results[6].frames, results[6].error) == (0, None)
+
+    claimed = int(results[0].score)
+    assert judge(claimed, results[0]) == ("verified", None)
+    assert judge(claimed + 1, results[0])[0] == "rejected"
+    assert judge(0, results[4])[0] == "rejected"
@@ -1,4 +1,15 @@
-from app.simulator import DinoSimulator
+from app import physics as P
+import pytest
+
+from app.simulator import (
+    BatchDinoSimulator,
+    DinoSimulator,
+    decode_actions,
+    encode_actions,
+    get_course,
+    record_episode,
+    replay_episode,
+)
 
 
 def test_simulator_deterministic():
@@ -32,3 +43,79 @@ def test_sensor_vector_length():
     sensors = sim.sensors()
     assert len(sensors) == 6
     assert all(0.0 <= s <= 1.0 for s in sensors)
+
+
+def test_batch_simulator_matches_scalar_frame_for_frame():
+    seeds = [42, 1337, 7, 1]
+    max_frames = 2500
+
+    def smart(sensors):
+        # Jump for near obstacles, duck under high birds, else run.
+        if sensors[0] < 0.18 and sensors[3] > 0.5:
+            return "jump"
+        if sensors[0] < 0.18:
+            return "duck"
+        return "noop"
+
+    scalars = [DinoSimulator(seed=s, max_frames=max_frames) for s in seeds]
+    batch = BatchDinoSimulator(seeds, max_frames=max_frames)
+    while batch.alive.any():
+        rows = batch.sensors()
+        actions = []
+        for i, sim in enumerate(scalars):
+            if sim.state.alive:
+                assert rows[i].tolist() == sim.sensors()
+                action = smart(sim.sensors())
+                sim.step(action)
+            else:
+                action = "noop"
+            actions.append(P.ACTIONS.index(action))
+        was_alive = batch.alive.copy()
+        batch.step(actions)
+        for i, sim in enumerate(scalars):
+            assert batch.alive[i] == sim.state.alive
+            assert batch.frames[i] == sim.state.frames
+            assert batch.score[i] == sim.state.score
+            if was_alive[i]:
+                assert batch.dino_y[i] == sim.state.dino_y
+
+    assert not any(sim.state.alive for sim in scalars)
+    expected = [s.state.score + s.state.frames * 0.01 for s in scalars]
+    assert batch.fitness().tolist() == expected
+
+
+def test_course_replay_matches_live_spawning():
+    def smart(sensors):
+        return "jump" if sensors[0] < 0.18 else "noop"
+
+    course = get_course(7, 3000)
+    assert get_course(7, 3000) is course
+    for seed in (7, 99):
+        live = DinoSimulator(seed=seed, max_frames=3000)
+        replay = DinoSimulator(seed=seed, max_frames=3000, course=get_course(seed, 3000))
+        assert live.run(smart) == replay.run(smart)
+        assert live.state.frames == replay.state.frames
+
+
+def test_recorded_episode_replays_exactly():
+    def smart(rows):
+        # Jump for near ground obstacles, duck under high birds, else run.
+        s = rows[0]
+        if s[0] < 0.18:
+            return [P.ACTIONS.index("jump" if s[3] > 0.5 else "duck")]
+        return [P.ACTIONS.index("noop")]
+
+    recording = record_episode(smart, 1337, 2500)
+    names = decode_actions(recording.actions)
+    assert len(names) >= recording.frames and len(recording.actions) < len(names) / 4
+    assert encode_actions(P.ACTIONS.index(n) for n in names) == recording.actions
+
+    sim = replay_episode(recording)
+    assert not sim.state.alive
+    assert sim.state.frames == recording.frames
+    assert sim.state.score + sim.state.frames * 0.01 == recording.fitness
+
+    with pytest.raises(ValueError):
+        decode_actions("3n0j")
+    with pytest.raises(ValueError):
+        decode_actions("3x")
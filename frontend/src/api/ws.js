@@ -12,13 +12,14 @@ function wsUrl(path) {
   return `${proto}//${host}${path}`;
 }
 
+// `path` may be a function, re-evaluated on every (re)connect.
 export function connectWs(path, { onMessage, onOpen, onClose, onError } = {}) {
   let ws;
   let closed = false;
   let retry = 0;
 
   const open = () => {
-    ws = new WebSocket(wsUrl(path));
+    ws = new WebSocket(wsUrl(typeof path === 'function' ? path() : path));
     ws.onopen = () => {
       retry = 0;
       onOpen && onOpen();
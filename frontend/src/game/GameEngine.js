@@ -35,6 +35,7 @@ export class GameEngine {
     this.ctx.imageSmoothingEnabled = false;
 
     this.onEvent = onEvent;
+    this.seed = seed;  // null: unseeded (Math.random)
     this.rng = seed !== null ? mulberry32(seed) : Math.random;
 
     this.dino = new Dino();
@@ -103,6 +104,7 @@ export class GameEngine {
 
   reset(seed = null) {
     this.stop();
+    this.seed = seed;
     this.rng = seed !== null ? mulberry32(seed) : Math.random;
     this.dino.reset();
     this.obstacles = [];
@@ -9,17 +9,26 @@ function wsUrlFor(path) {
   return `${proto}//${host}${path}`;
 }
 
+// Binary autopilot protocol (see backend/app/routers/inference.py):
+//   client -> server: uint32 frame counter + 6 x float32 sensors (little-endian)
+//   server -> client: uint8 action index
+const BINARY_SUBPROTOCOL = 'dino.bin.v1';
+const ACTIONS = ['jump', 'duck', 'noop'];
+
 export function useAiAutopilot(modelId) {
   const [connected, setConnected] = useState(false);
   const lastActionRef = useRef('noop');
   const wsRef = useRef(null);
+  const frameRef = useRef(0);
+  const bufRef = useRef(new DataView(new ArrayBuffer(28)));
 
   useEffect(() => {
     if (!modelId) { lastActionRef.current = 'noop'; setConnected(false); return undefined; }
     let closed = false;
     let retry = 0;
     const open = () => {
-      const ws = new WebSocket(wsUrlFor(`/api/ws/play/${modelId}`));
+      const ws = new WebSocket(wsUrlFor(`/api/ws/play/${modelId}`), [BINARY_SUBPROTOCOL]);
+      ws.binaryType = 'arraybuffer';
       wsRef.current = ws;
       ws.onopen = () => { retry = 0; setConnected(true); };
       ws.onclose = () => {
@@ -29,6 +38,11 @@ export function useAiAutopilot(modelId) {
         setTimeout(open, 500 * 2 ** retry);
       };
       ws.onmessage = (ev) => {
+        if (ev.data instanceof ArrayBuffer) {
+          const action = ACTIONS[new Uint8Array(ev.data)[0]];
+          if (action) lastActionRef.current = action;
+          return;
+        }
         try {
           const data = JSON.parse(ev.data);
           if (data && data.type === 'action' && data.action) lastActionRef.current = data.action;
@@ -43,7 +57,17 @@ export function useAiAutopilot(modelId) {
   const decide = useCallback((sensors) => {
     const ws = wsRef.current;
     if (ws && ws.readyState === WebSocket.OPEN) {
-      try { ws.send(JSON.stringify({ sensors })); } catch { /* ignore */ }
+      try {
+        if (ws.protocol === BINARY_SUBPROTOCOL) {
+          const view = bufRef.current;
+          frameRef.current = (frameRef.current + 1) >>> 0;
+          view.setUint32(0, frameRef.current, true);
+          for (let i = 0; i < 6; i += 1) view.setFloat32(4 + i * 4, sensors[i] || 0, true);
+          ws.send(view.buffer);
+        } else {
+          ws.send(JSON.stringify({ sensors }));
+        }
+      } catch { /* ignore */ }
     }
     return lastActionRef.current;
   }, []);
@@ -1,31 +1,51 @@
 import { useEffect, useRef, useState } from 'react';
 import { connectWs } from '../api/ws';
 
-// Subscribes to /api/training/ws/training and exposes:
+// Subscribes to /api/training/ws/training (every run) or, given a runId, to
+// /api/training/ws/training/{runId} and exposes:
 //   events    - raw event list (last 200)
 //   history   - generation summaries (for charts): { generation, best_fitness, mean_fitness, ... }
 //   status    - latest status-ish event ({ status, best_fitness, ... }) if any
+//   progress  - latest intra-generation progress event, null between generations
 //   connected - websocket state
 //   clear()   - reset accumulated state
-export function useTrainingSocket(enabled = true) {
+export function useTrainingSocket(enabled = true, runId = null) {
   const [events, setEvents] = useState([]);
   const [history, setHistory] = useState([]);
   const [status, setStatus] = useState(null);
+  const [progress, setProgress] = useState(null);
   const [connected, setConnected] = useState(false);
   const connRef = useRef(null);
+  const lastGenRef = useRef(0);
 
   useEffect(() => {
     if (!enabled) return undefined;
-    const conn = connectWs('/api/training/ws/training', {
+    setEvents([]); setHistory([]); setStatus(null); setProgress(null);
+    lastGenRef.current = 0;
+    // A per-run channel replays the run's history from the server; on reconnect
+    // only generations after the last one received are asked for.
+    const path = () => {
+      if (!runId) return '/api/training/ws/training';
+      const after = lastGenRef.current ? `?after=${lastGenRef.current}` : '';
+      return `/api/training/ws/training/${runId}${after}`;
+    };
+    const conn = connectWs(path, {
       onOpen: () => setConnected(true),
       onClose: () => setConnected(false),
       onMessage: (data) => {
         if (!data || data.type === 'ping') return;
+        // several per second while a generation is evaluated; kept out of events/history
+        if (data.type === 'progress') {
+          setProgress(data);
+          return;
+        }
+        setProgress(null);
         setEvents((prev) => [...prev.slice(-199), data]);
         // every non-ping event becomes the current status snapshot
         setStatus((prev) => ({ ...(prev || {}), ...data }));
         // generation summary events feed the history chart
-        if (data.type === 'generation' || data.generation !== undefined) {
+        if (data.type === 'generation') {
+          lastGenRef.current = data.generation;
           setHistory((prev) => {
             const entry = {
               generation: data.generation,
@@ -34,7 +54,7 @@ export function useTrainingSocket(enabled = true) {
               species_count: data.species_count,
               elapsed_seconds: data.elapsed_seconds,
             };
-            return [...prev.slice(-499), entry];
+            return [...prev.slice(-999), entry];
           });
         }
         // terminal events reset history for the NEXT run but keep the final snapshot visible
@@ -45,9 +65,9 @@ export function useTrainingSocket(enabled = true) {
     });
     connRef.current = conn;
     return () => conn.close();
-  }, [enabled]);
+  }, [enabled, runId]);
 
-  const clear = () => { setEvents([]); setHistory([]); setStatus(null); };
+  const clear = () => { setEvents([]); setHistory([]); setStatus(null); setProgress(null); };
 
-  return { events, history, status, connected, clear };
+  return { events, history, status, progress, connected, clear };
 }
\ No newline at end of file
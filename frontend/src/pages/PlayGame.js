@@ -12,6 +12,11 @@ import DinoCanvas from '../components/DinoCanvas';
 import { useAiAutopilot } from '../hooks/useAiAutopilot';
 import { api } from '../api/client';
 
+// Each game is seeded so an AI score can be checked: the server plays the
+// model on its own headless course for the same seed (not this course, whose
+// obstacles come from the browser RNG) and verifies the entry if it gets there.
+const newSeed = () => Math.floor(Math.random() * 2 ** 32);
+
 export default function PlayGame() {
   const canvasRef = useRef(null);
   const [running, setRunning] = useState(false);
@@ -68,8 +73,9 @@ export default function PlayGame() {
     const eng = canvasRef.current; if (!eng) return;
     // If we're starting after a crash, reset first so the engine re-initializes
     // the dino, obstacles and score (otherwise start() on a crashed state is a no-op).
-    if (gameOver) {
-      eng.reset();
+    const engine = eng.getEngine();
+    if (gameOver || (engine && engine.seed === null)) {
+      eng.reset(newSeed());
       setScore(0);
       setGameOver(false);
     }
@@ -81,19 +87,24 @@ export default function PlayGame() {
   };
   const handleReset = () => {
     const eng = canvasRef.current; if (!eng) return;
-    eng.reset(); setScore(0); setRunning(false); setGameOver(false);
+    eng.reset(newSeed()); setScore(0); setRunning(false); setGameOver(false);
   };
 
   const submitScore = async () => {
     setSubmitMsg('');
+    const ai = aiMode && modelId;
+    const engine = canvasRef.current && canvasRef.current.getEngine();
+    const seed = ai && engine ? engine.seed : null;
     try {
       await api('/api/leaderboard', {
         method: 'POST',
         body: {
           player_name: playerName || 'Anonymous',
           score,
-          model_id: aiMode && modelId ? modelId : null,
-          mode: aiMode && modelId ? 'ai' : 'human',
+          model_id: ai ? modelId : null,
+          mode: ai ? 'ai' : 'human',
+          // With a seed the entry is checked in the background (see newSeed).
+          ...(seed !== null && seed !== undefined ? { seed } : {}),
         },
       });
       setSubmitMsg('submitted'); setSubmitOpen(false);
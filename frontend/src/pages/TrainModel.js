@@ -2,9 +2,11 @@ import React, { useEffect, useMemo, useRef, useState } from 'react';
 import { Link as RouterLink } from 'react-router-dom';
 import {
   Box, Typography, Paper, Stack, Grid, Slider, TextField, Button, Chip, Alert, Divider,
+  FormControlLabel, Switch, Autocomplete, LinearProgress,
 } from '@mui/material';
 import PlayArrowIcon from '@mui/icons-material/PlayArrow';
 import StopIcon from '@mui/icons-material/Stop';
+import PauseIcon from '@mui/icons-material/Pause';
 import DownloadIcon from '@mui/icons-material/Download';
 import SportsEsportsIcon from '@mui/icons-material/SportsEsports';
 import HubIcon from '@mui/icons-material/Hub';
@@ -106,14 +108,25 @@ export default function TrainModel() {
   const [mutationRate, setMutationRate] = useState(0.8);
   const [survivalThreshold, setSurvivalThreshold] = useState(0.2);
   const [compatibilityThreshold, setCompatibilityThreshold] = useState(3.0);
+  const [racing, setRacing] = useState(false);
+  const [steadyState, setSteadyState] = useState(false);
   const [runName, setRunName] = useState('');
+  const [models, setModels] = useState([]);
+  const [sourceModels, setSourceModels] = useState([]);
+  const [runId, setRunId] = useState(null);
 
   const [submitting, setSubmitting] = useState(false);
   const [err, setErr] = useState('');
   const [ok, setOk] = useState('');
   const [finishedModelId, setFinishedModelId] = useState(null);
 
-  const { connected, status, history, events } = useTrainingSocket(true);
+  const { connected, status, history, events, progress } = useTrainingSocket(true, runId);
+
+  useEffect(() => {
+    api('/api/models')
+      .then((r) => setModels(Array.isArray(r) ? r : (r.models || [])))
+      .catch(() => setModels([]));
+  }, [finishedModelId]);
 
   // Detect finished event from the event stream
   useEffect(() => {
@@ -133,7 +146,7 @@ export default function TrainModel() {
   const start = async () => {
     setErr(''); setOk(''); setSubmitting(true); setFinishedModelId(null);
     try {
-      await api('/api/training/start', {
+      const res = await api('/api/training/start', {
         method: 'POST',
         body: {
           run_name: runName || `run-${new Date().toISOString().replace(/[:.]/g, '-')}`,
@@ -142,19 +155,29 @@ export default function TrainModel() {
           mutation_rate: mutationRate,
           survival_threshold: survivalThreshold,
           compatibility_threshold: compatibilityThreshold,
+          racing,
+          evolution: steadyState ? 'steady_state' : 'generational',
+          source_model_ids: sourceModels.map((m) => m.id),
         },
       });
-      setOk('Training started');
+      setRunId(res.run_id);
+      setOk(res.status === 'queued' ? 'Training queued' : 'Training started');
     } catch (e) { setErr(e.message); }
     finally { setSubmitting(false); }
   };
 
   const stop = async () => {
-    try { await api('/api/training/stop', { method: 'POST' }); }
+    try { await api(runId ? `/api/training/${runId}/stop` : '/api/training/stop', { method: 'POST' }); }
+    catch (e) { setErr(e.message); }
+  };
+
+  const togglePause = async () => {
+    try { await api(`/api/training/${runId}/${isPaused ? 'resume' : 'pause'}`, { method: 'POST' }); }
     catch (e) { setErr(e.message); }
   };
 
-  const isRunning = status && (status.type === 'start' || status.type === 'generation');
+  const isPaused = status && status.type === 'paused';
+  const isRunning = status && ['queued', 'start', 'resumed', 'generation', 'paused'].includes(status.type);
   const latest = history[history.length - 1];
   const bestFit = latest ? Number(latest.best_fitness || 0).toFixed(2) : '-';
   const meanFit = latest ? Number(latest.mean_fitness || 0).toFixed(2) : '-';
@@ -186,9 +209,24 @@ export default function TrainModel() {
             <Typography gutterBottom>Compatibility: {compatibilityThreshold.toFixed(1)}</Typography>
             <Slider min={0.5} max={6.0} step={0.1} value={compatibilityThreshold} onChange={(_, v) => setCompatibilityThreshold(v)} />
 
+            <FormControlLabel
+              control={<Switch checked={racing} onChange={(e) => setRacing(e.target.checked)} />}
+              label="Racing evaluation (stop hopeless genomes early)" />
+            <FormControlLabel
+              control={<Switch checked={steadyState} onChange={(e) => setSteadyState(e.target.checked)} />}
+              label="Steady-state evolution (no generation barrier)" />
+
+            <Autocomplete multiple size="small" sx={{ mt: 2 }} options={models} value={sourceModels}
+              onChange={(_, v) => setSourceModels(v)}
+              getOptionLabel={(m) => `${m.name} (${Number(m.fitness || 0).toFixed(1)})`}
+              isOptionEqualToValue={(a, b) => a.id === b.id}
+              renderInput={(params) => <TextField {...params} label="Warm start from models" placeholder="random population" />} />
+
             <Stack direction="row" spacing={2} sx={{ mt: 2 }}>
               <Button variant="contained" startIcon={<PlayArrowIcon />} onClick={start}
-                disabled={submitting || isRunning}>Start</Button>
+                disabled={submitting}>Start</Button>
+              <Button variant="outlined" startIcon={isPaused ? <PlayArrowIcon /> : <PauseIcon />}
+                onClick={togglePause} disabled={!isRunning || !runId}>{isPaused ? 'Resume' : 'Pause'}</Button>
               <Button variant="outlined" color="error" startIcon={<StopIcon />} onClick={stop}
                 disabled={!isRunning}>Stop</Button>
             </Stack>
@@ -227,8 +265,23 @@ export default function TrainModel() {
               {latest && latest.species_count != null && (
                 <Chip label={`${latest.species_count} species`} variant="outlined" size="small" />
               )}
+              {latest && latest.frames_saved > 0 && (
+                <Chip label={`${latest.censored} censored, ${latest.frames_saved} frames saved`} variant="outlined" size="small" />
+              )}
             </Stack>
 
+            {isRunning && progress && (
+              <Box sx={{ mb: 2 }}>
+                <Typography variant="body2" color="text.secondary" sx={{ mb: 0.5 }}>
+                  {`Generation ${progress.generation}: ${progress.evaluated}/${progress.population_size} genomes`
+                    + ` · best ${progress.best_fitness.toFixed(1)} · mean ${progress.mean_fitness.toFixed(1)}`
+                    + ` · ${progress.frames_simulated.toLocaleString()} frames`}
+                </Typography>
+                <LinearProgress variant="determinate"
+                  value={progress.population_size ? (100 * progress.evaluated) / progress.population_size : 0} />
+              </Box>
+            )}
+
             <Typography variant="h6" sx={{ mb: 1 }}>Fitness over generations</Typography>
             <Box sx={{ width: '100%', height: 280 }}>
               <ResponsiveContainer width="100%" height="100%">